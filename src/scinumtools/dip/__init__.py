@@ -1,3 +1,4 @@
 from .dip import DIP
 from .environment import Environment
+from .cache import EnvironmentCache, TokenCache
 from .settings import Format
\ No newline at end of file
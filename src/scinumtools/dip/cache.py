@@ -0,0 +1,284 @@
+import os
+import pickle
+import hashlib
+import tempfile
+from glob import glob
+from functools import lru_cache
+from importlib.metadata import version, PackageNotFoundError
+
+from .settings import STRING_SOURCE
+
+try:
+    VERSION = version('scinumtools')
+except PackageNotFoundError:
+    VERSION = None
+CACHE_SUFFIX = '.pkl'
+TOKEN_CACHE = None   # token cache of the currently parsed DIP object
+
+@lru_cache(maxsize=None)
+def parser_version():
+    """ Return a hash of the library version and of the source code of the library
+
+    Source code is included, because library version does not change in development checkouts.
+    """
+    digest = hashlib.sha256(str(VERSION).encode())
+    directory = os.path.dirname(os.path.dirname(__file__))
+    for path in sorted(glob(os.path.join(directory, '**', '*.py'), recursive=True)):
+        digest.update(os.path.relpath(path, directory).encode())
+        digest.update(file_digest(path).encode())
+    return digest.hexdigest()
+
+def file_digest(path:str):
+    """ Return a hash of a file content
+    """
+    with open(path,'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def rename_sources(env, old:str, new:str):
+    """ Rename sources of a DIP object in a parsed environment
+
+    :param env: Parsed environment
+    :param str old: Old name prefix of the sources
+    :param str new: New name prefix of the sources
+    """
+    def rename(source):
+        if isinstance(source, tuple) and source and isinstance(source[0], str) and source[0].startswith(old):
+            return (new + source[0][len(old):],) + source[1:]
+        return source
+    def rename_nodes(nodes):
+        for node in nodes:
+            node.source = rename(getattr(node, 'source', None))
+            if getattr(node, 'isource', None):
+                node.isource = rename(node.isource)
+    visited = set()
+    def rename_list(sources):
+        # nested source lists share sources, and remote sources contain themselves
+        if id(sources) in visited:
+            return
+        visited.add(id(sources))
+        items = sources.sources
+        sources.sources = {}
+        for name, source in items.items():
+            sources.sources[rename((name,))[0]] = source
+            if id(source) in visited:
+                continue
+            visited.add(id(source))
+            source.name = rename((source.name,))[0]
+            source.parent = rename(source.parent)
+            if source.nodes is not None:
+                rename_nodes(source.nodes)
+            if source.sources is not None:
+                rename_list(source.sources)
+    rename_list(env.sources)
+    rename_nodes(env.nodes)
+    for unit in env.units.units.values():
+        unit['source'] = rename(unit['source'])
+
+class FileCache:
+    """ Directory with cached entries that are evicted if they exceed a maximal size
+
+    Entries are written atomically, so that the cache can be shared by concurrent processes.
+    If the total size of entries exceeds a given limit, least recently used entries are removed.
+
+    :param str directory: Cache directory
+    :param int max_size: Maximal size of all cached entries in bytes
+    """
+    directory: str
+    max_size: int
+
+    def __init__(self, directory:str, max_size:int=100*1024**2):
+        self.directory = str(directory)
+        self.max_size = max_size
+
+    def read(self, key:str):
+        """ Return a cached entry, or None if it does not exist
+
+        :param str key: Cache key
+        """
+        filepath = os.path.join(self.directory, key + CACHE_SUFFIX)
+        try:
+            with open(filepath,'rb') as f:
+                entry = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+        try:
+            os.utime(filepath)   # mark entry as recently used
+        except OSError:
+            pass
+        return entry
+
+    def write(self, key:str, entry):
+        """ Store an entry
+
+        :param str key: Cache key
+        :param entry: Stored entry
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        # write to a temporary file first, so that other processes never read incomplete entries
+        with tempfile.NamedTemporaryFile(dir=self.directory, suffix='.tmp', delete=False) as f:
+            try:
+                pickle.dump(entry, f)
+            except (pickle.PicklingError, TypeError, AttributeError):
+                saved = False   # entry contains values that cannot be stored
+            else:
+                saved = True
+        if saved:
+            os.replace(f.name, os.path.join(self.directory, key + CACHE_SUFFIX))
+            self.evict()
+        else:
+            os.remove(f.name)
+
+    def evict(self):
+        """ Remove least recently used entries if the cache exceeds its maximal size
+        """
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(CACHE_SUFFIX):
+                try:
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                except OSError:
+                    pass
+        size = sum(entry[1] for entry in entries)
+        for mtime, esize, path in sorted(entries):
+            if size<=self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            size -= esize
+
+    def clear(self):
+        """ Remove all cached entries
+        """
+        if os.path.isdir(self.directory):
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(CACHE_SUFFIX):
+                    os.remove(entry.path)
+
+class EnvironmentCache(FileCache):
+    """ On-disk cache of parsed DIP environments
+
+    Environments are stored under a hash of the DIP code, sources, library version and source code of the parser.
+    Files that were read during parsing are validated using their modification times and sizes,
+    and if these changed, using hashes of their content.
+
+    .. code-block::
+
+        with DIP(cache=EnvironmentCache('.dipcache')) as dip:
+            dip.add_file('definitions.dip')
+            env = dip.parse()
+
+    :param str directory: Cache directory
+    :param int max_size: Maximal size of all cached entries in bytes
+    """
+
+    def key(self, dip):
+        """ Return a cache key of a DIP object, or None if it cannot be cached
+
+        Environments with predefined nodes, units or functions are not cached.
+
+        :param dip: DIP object before parsing
+        """
+        env = dip.env
+        if len(env.nodes) or len(env.units) or env.functions.functions:
+            return None
+        prefix = f"{dip.name}_"
+        def clean(name):
+            return name[len(prefix):] if name.startswith(prefix) else name
+        data = [parser_version(), type(dip).__module__, type(dip).__qualname__]
+        for line in dip.lines:
+            data.append((line['code'], clean(line['source'][0]), line['source'][1]))
+        for name, source in env.sources.items():
+            data.append((clean(name), source.path, source.code, source.parent and (clean(source.parent[0]), source.parent[1])))
+        return hashlib.sha256(repr(data).encode()).hexdigest()
+
+    def load(self, key:str, dip):
+        """ Return a cached environment, or None if it is missing or not valid
+
+        :param str key: Cache key
+        :param dip: DIP object that is being parsed
+        """
+        entry = self.read(key)
+        if entry is None:
+            return None
+        for path, (mtime, size, digest) in entry['files'].items():
+            try:
+                stat = os.stat(path)
+                if (stat.st_mtime_ns, stat.st_size)!=(mtime, size) and file_digest(path)!=digest:
+                    return None
+            except OSError:
+                return None
+        env = entry['env']
+        rename_sources(env, entry['name'], f"{dip.name}_")
+        return env
+
+    def save(self, key:str, dip, env):
+        """ Store a parsed environment
+
+        :param str key: Cache key
+        :param dip: DIP object that was parsed
+        :param env: Parsed environment
+        """
+        files = {}
+        visited = set()
+        def record(sources):
+            for name, source in sources.items():
+                if id(source) in visited:
+                    continue
+                visited.add(id(source))
+                if source.code is not None and not name.startswith(f"{dip.name}_{STRING_SOURCE}") and os.path.isfile(source.path):
+                    stat = os.stat(source.path)
+                    files.setdefault(source.path, (stat.st_mtime_ns, stat.st_size, file_digest(source.path)))
+                if source.sources is not None:
+                    record(source.sources)
+        record(env.sources)
+        self.write(key, dict(name=f"{dip.name}_", files=files, env=env))
+
+class TokenCache(FileCache):
+    """ On-disk cache of nodes lexed from DIP files
+
+    Nodes of every file are stored before parsing under a hash of the file content and parser version,
+    so that unchanged files are not lexed again even if other files were modified.
+
+    .. code-block::
+
+        with DIP(token_cache=TokenCache('.diptokens')) as dip:
+            dip.add_file('defaults.dip')
+            dip.add_file('modifications.dip')
+            env = dip.parse()
+
+    :param str directory: Cache directory
+    :param int max_size: Maximal size of all cached entries in bytes
+    """
+
+    def key(self, dip, lines:list):
+        """ Return a cache key of file lines
+
+        :param dip: DIP object that lexes the lines
+        :param list lines: Code lines of a file
+        """
+        data = [parser_version(), type(dip).__module__, type(dip).__qualname__]
+        data += [line['code'] for line in lines]
+        return hashlib.sha256(repr(data).encode()).hexdigest()
+
+    def load(self, key:str, source:str):
+        """ Return cached nodes, or None if they are missing
+
+        :param str key: Cache key
+        :param str source: Name of the file source
+        """
+        nodes = self.read(key)
+        if nodes is not None:
+            for node in nodes:
+                node.source = (source, node.source[1])
+        return nodes
+
+    def save(self, key:str, nodes:list):
+        """ Store lexed nodes
+
+        :param str key: Cache key
+        :param list nodes: Nodes lexed from a file
+        """
+        self.write(key, nodes)
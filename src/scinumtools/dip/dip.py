@@ -1,11 +1,16 @@
 import numpy as np
 import re
 import os
+import dataclasses
 from pathlib import Path
 from typing import List, Callable
 from inspect import getframeinfo, stack
 
 from .environment import Environment
+from .cache import EnvironmentCache, TokenCache
+from . import cache
+from .loader import SourceLoader
+from . import loader
 from .docs import Documentation
 from .settings import *
 from .docs.settings import DocsType
@@ -16,15 +21,37 @@ from .nodes import ModNode, GroupNode
 from .nodes import BooleanNode, IntegerNode, FloatNode, StringNode, TableNode
 from .solvers import LogicalSolver
 
+def same_values(value1, value2):
+    """ Check if two node values are identical
+    """
+    if type(value1)!=type(value2):
+        return False
+    elif value1 is None:
+        return True
+    elif getattr(value1, 'unit', None)!=getattr(value2, 'unit', None):
+        return False
+    elif isinstance(value1.value, (list, np.ndarray)) or isinstance(value2.value, (list, np.ndarray)):
+        return np.array_equal(value1.value, value2.value)
+    else:
+        return bool(value1.value==value2.value)
+
 class DIP:
     """ DIP parser class
 
     :param str code: DIP code
     :param DIP_Environment env: DIP environment object
+    :param cache: Cache of parsed environments, or path to its directory
+    :param token_cache: Cache of nodes lexed from files, or path to its directory
+    :param int workers: Number of worker processes used to load DIP sources, if set all independent sources are loaded before parsing
     """
     name: str            # object name
     env: Environment     # environment
     lines: List[dict]    # code lines
+    cache: EnvironmentCache  # cache of parsed environments
+    token_cache: TokenCache  # cache of nodes lexed from files
+    workers: int             # number of processes loading DIP sources
+    segments: List[dict]     # parsed code segments with their dependencies
+    parsed: Environment      # last parsed environment
     
     source: tuple        # source
 
@@ -40,6 +67,15 @@ class DIP:
     def __init__(self, env:Environment=None, **kwargs):
         self.name = kwargs['name'] if 'name' in kwargs else str(id(self))
         self.lines = []
+        self.segments = None
+        self.parsed = None
+        self.cache = kwargs.get('cache')
+        if isinstance(self.cache, (str, Path)):
+            self.cache = EnvironmentCache(self.cache)
+        self.workers = kwargs.get('workers')
+        self.token_cache = kwargs.get('token_cache')
+        if isinstance(self.token_cache, (str, Path)):
+            self.token_cache = TokenCache(self.token_cache)
         # create a new environment if not givenl
         if env:
             self.env = env
@@ -76,16 +112,54 @@ class DIP:
     def __exit__(self, type, value, traceback):
         pass
         
-    def _get_queue(self):
+    def _get_segments(self):
+        # Split code lines into segments of consecutive lines from the same source
+        segments = []
+        while len(self.lines)>0:
+            source = self.lines[0]['source'][0]
+            count = 1
+            while count<len(self.lines) and self.lines[count]['source'][0]==source:
+                count += 1
+            lines, self.lines = self.lines[:count], self.lines[count:]
+            segments.append(dict(
+                source = source,
+                lines = lines,
+                file = self.env.sources[source].path if lines[0].get('file') else None,
+                files = set(),   # files that were read during parsing of the segment
+                node = None,     # first node of the segment
+                env = None,      # environment before parsing of the segment
+            ))
+        return segments
+        
+    def _get_queue(self, segments:list=None):
         # Convert code lines to nodes
         queue = Environment()
-        while len(self.lines)>0:
-            line = self.lines.pop(0)
+        for segment in (self._get_segments() if segments is None else segments):
+            lines = [dict(line) for line in segment['lines']]
+            if self.token_cache and segment['file']:
+                # Lex all lines of a file at once and cache its nodes
+                key = self.token_cache.key(self, lines)
+                nodes = self.token_cache.load(key, segment['source'])
+                if nodes is None:
+                    nodes = self._get_nodes(lines)
+                    self.token_cache.save(key, nodes)
+            else:
+                nodes = self._get_nodes(lines)
+            segment['node'] = nodes[0] if nodes else None
+            for node in nodes:
+                queue.nodes.append(node)
+        return queue
+
+    def _get_nodes(self, lines):
+        # Convert code lines to nodes
+        nodes = []
+        while len(lines)>0:
+            line = lines.pop(0)
             # Group block structures
             if '"""' in line['code']:
                 block = []
-                while len(self.lines)>0:
-                    subline = self.lines.pop(0)
+                while len(lines)>0:
+                    subline = lines.pop(0)
                     if '"""' in subline['code']:
                         line['code'] += Sign.NEWLINE.join(block) + subline['code'].lstrip()
                         break
@@ -93,9 +167,8 @@ class DIP:
                         block.append( subline['code'] )
                 else:
                     raise Exception("Block structure is not properly terminated.", line['code'])
-            node = self._determine_node(line)
-            queue.nodes.append(node)
-        return queue
+            nodes.append(self._determine_node(line))
+        return nodes
 
     def _determine_node(self, line):
         # Add replacement marks
@@ -112,16 +185,21 @@ class DIP:
         steps = [
             EmptyNode.is_node,            # parse empty line node
             parser.part_indent,           
-            ImportNode.is_node,           # parse root import directive
-            UnitNode.is_node,             # parse unit directive
-            SourceNode.is_node,           # parse source directive
-            CaseNode.is_node,             # parse case directive
-            OptionNode.is_node,           # parse option setting
-            ConstantNode.is_node,         # parse constant setting
-            FormatNode.is_node,           # parse format setting
-            TagsNode.is_node,             # parse node tags
-            DescriptionNode.is_node,      # parse description node
-            ConditionNode.is_node,        # parse condition setting
+        ]
+        if parser.is_directive():         # skip directives if line starts with a node name
+            steps += [
+                ImportNode.is_node,       # parse root import directive
+                UnitNode.is_node,         # parse unit directive
+                SourceNode.is_node,       # parse source directive
+                CaseNode.is_node,         # parse case directive
+                OptionNode.is_node,       # parse option setting
+                ConstantNode.is_node,     # parse constant setting
+                FormatNode.is_node,       # parse format setting
+                TagsNode.is_node,         # parse node tags
+                DescriptionNode.is_node,  # parse description node
+                ConditionNode.is_node,    # parse condition setting
+            ]
+        steps += [
             parser.part_name,             
             GroupNode.is_node,            # parse group node
             ImportNode.is_node,           # parse group import directive
@@ -169,6 +247,24 @@ class DIP:
         # Return proper node type
         return node
     
+    def _read_file(self, filepath):
+        # Read lines of a file without leading and ending empty lines
+        with open(filepath,'r') as f:           
+            lines = f.read().split(Sign.NEWLINE)
+        while lines and lines[0].strip()=='':
+            del lines[0]
+        while lines and lines[-1].strip()=='':
+            del lines[-1]
+        return lines
+
+    def _file_lines(self, lines, source_name):
+        # Prepare code lines of a file
+        return [dict(
+            code = linecode,
+            source = (source_name, lineno+1),
+            file = True,
+        ) for lineno, linecode in enumerate(lines)]
+    
     def add_file(self, filepath:str, source_name:str = None, absolute=True):
         """ Load DIP code from a file
 
@@ -184,24 +280,13 @@ class DIP:
             else:
                 filepath = parent / filepath
         # open file and get its content
-        with open(filepath,'r') as f:           
-            lines = f.read().split(Sign.NEWLINE)
-        # strip leading and ending empty lines
-        while lines and lines[0].strip()=='':
-            del lines[0]
-        while lines and lines[-1].strip()=='':
-            del lines[-1]
-        code = Sign.NEWLINE.join(lines)
+        lines = self._read_file(filepath)
         # get source name
         if source_name is None:
             self.num_files += 1
             source_name = f"{self.name}_{FILE_SOURCE}{self.num_files}"
         # prepare individual lines
-        for lineno, linecode in enumerate(lines):
-            self.lines.append(dict(
-                code = linecode,
-                source = (source_name, lineno+1),
-            ))
+        self.lines += self._file_lines(lines, source_name)
         # get line number from the source code
         if self.source[1] is None:
             caller = getframeinfo(stack()[1][0])
@@ -281,15 +366,29 @@ class DIP:
     def add_function(self, name:str, fn:Callable):
         self.env.functions.append(name, fn)
 
-    def parse(self):
-        """ Parse DIP nodes from code lines
-        """
-        # Create queue/target environment
-        queue = self._get_queue()
-        target = self.env.copy()
-        # Parse nodes
+    def _parse_nodes(self, queue, target, segments):
+        # Lex declared DIP sources using the same token cache
+        if self.token_cache and cache.TOKEN_CACHE is not self.token_cache:
+            previous, cache.TOKEN_CACHE = cache.TOKEN_CACHE, self.token_cache
+            try:
+                return self._parse_nodes(queue, target, segments)
+            finally:
+                cache.TOKEN_CACHE = previous
+        # Load independent DIP sources before parsing
+        if self.workers and loader.LOADER is None:
+            with SourceLoader(self.workers) as sl:
+                sl.load(target, [line for segment in segments for line in segment['lines']])
+                return self._parse_nodes(queue, target, segments)
+        # Parse nodes and record environments at the beginning of each segment
+        starts = {id(segment['node']): segment for segment in segments if segment['node'] is not None}
+        segment = None
         while len(queue.nodes):
             node = queue.nodes.pop()
+            if id(node) in starts:
+                if segment:
+                    segment['files'] = self._segment_files(segment, target)
+                segment = starts[id(node)]
+                segment['env'] = target.copy()
             # Perform specific node parsing only outside of case or inside of valid case
             if not target.branching.false_case() or node.keyword=='case':
                 node.inject_value(target)
@@ -314,17 +413,35 @@ class DIP:
                 # Set the node value
                 node.set_value()
                 # If node was previously defined, modify its value
-                for n in range(len(target.nodes)):
-                    if target.nodes[n].name==node.name:
-                        if target.nodes[n].constant:
-                            raise Exception(f"Node '{target.nodes[n].name}' is constant and cannot be modified:",node.code)
-                        target.nodes[n].modify_value(node, target)
-                        break
+                if (defined:=target.nodes.get(node.name)) is not None:
+                    if defined.constant:
+                        raise Exception(f"Node '{defined.name}' is constant and cannot be modified:",node.code)
+                    defined.modify_value(node, target)
                 # If node wasn't defined, create a new node
                 else:
                     if node.keyword=='mod' and node.source[0].startswith(f"{self.name}_{STRING_SOURCE}"):
                         raise Exception("Modifying undefined node:",node.name)
                     target.nodes.append(node)
+        if segment:
+            segment['files'] = self._segment_files(segment, target)
+
+    def _segment_files(self, segment, target):
+        # Paths of the segment file and of all files that were sourced within the segment
+        files = {segment['file']} if segment['file'] else set()
+        visited = {id(source) for name, source in segment['env'].sources.items()}
+        def add(sources):
+            for name, source in sources.items():
+                if id(source) in visited:
+                    continue
+                visited.add(id(source))
+                if source.code is not None and os.path.isfile(source.path):
+                    files.add(os.path.realpath(source.path))
+                if source.sources is not None:
+                    add(source.sources)
+        add(target.sources)
+        return files
+
+    def _validate_nodes(self, target):
         # Validate nodes
         for node in target.nodes:
             # Check if all declared nodes have assigned value
@@ -347,7 +464,75 @@ class DIP:
                 if not m:
                     raise Exception("Node value does not match the format:",
                                     node.value.value, node.format)
+
+    def parse(self):
+        """ Parse DIP nodes from code lines
+        """
+        # Load a cached environment
+        key = self.cache.key(self) if self.cache else None
+        if key and (cached:=self.cache.load(key, self)) is not None:
+            # dependencies of the segments are not known
+            self.segments = self._get_segments()
+            for segment in self.segments:
+                segment['files'] = None
+            self.parsed = cached
+            return cached
+        # Create queue/target environment
+        self.segments = self._get_segments()
+        queue = self._get_queue(self.segments)
+        target = self.env.copy()
+        # Parse and validate nodes
+        self._parse_nodes(queue, target, self.segments)
+        self._validate_nodes(target)
+        # Store the parsed environment
+        if key:
+            self.cache.save(key, self, target)
+        self.parsed = target
         return target
+
+    def update(self, changed_files:list):
+        """ Parse again nodes that are affected by changed files
+
+        Parsing continues from the first code segment that depends on any of the changed files,
+        because nodes can reference only nodes that were parsed before them.
+        The last parsed environment is updated in place.
+
+        :param list changed_files: Paths of changed DIP or source files
+        :return: Names of nodes that were added, removed or whose values changed
+        """
+        if self.parsed is None:
+            raise Exception("Environment must be parsed before it is updated")
+        paths = {os.path.realpath(path) for path in changed_files}
+        for index, segment in enumerate(self.segments):
+            if segment['files'] is None or segment['files'] & paths:
+                break
+        else:
+            return set()
+        # Read changed files again
+        for segment in self.segments[index:]:
+            if segment['file'] in paths:
+                code = self._read_file(segment['file'])
+                segment['lines'] = self._file_lines(code, segment['source'])
+                source = dataclasses.replace(self.env.sources[segment['source']], code=Sign.NEWLINE.join(code))
+                for env in [self.env] + [other['env'] for other in self.segments if other['env']]:
+                    env.sources[segment['source']] = source
+        # Continue parsing from the last recorded environment
+        while index>0 and self.segments[index]['env'] is None:
+            index -= 1
+        segments = self.segments[index:]
+        queue = self._get_queue(segments)
+        target = (segments[0]['env'] or self.env).copy()
+        self._parse_nodes(queue, target, segments)
+        self._validate_nodes(target)
+        # Find changed nodes and update the environment
+        previous = {node.name: node for node in self.parsed.nodes}
+        current = {node.name: node for node in target.nodes}
+        changed = set(previous) ^ set(current)
+        for name in set(previous) & set(current):
+            if not same_values(previous[name].value, current[name].value):
+                changed.add(name)
+        vars(self.parsed).update(vars(target))
+        return changed
         
     def parse_docs(self):
         """ Parse DIP node definitions for a documentation
@@ -356,6 +541,10 @@ class DIP:
         queue = self._get_queue()
         target = self.env.copy()
         target.envtype = EnvType.DOCS
+        # Index nodes by their names without cases
+        names = {}
+        for node in target.nodes:
+            names.setdefault(node.clean_name(), []).append(node)
         # Parse nodes
         while len(queue.nodes):
             node = queue.nodes.pop()
@@ -380,15 +569,12 @@ class DIP:
                 node.set_value()
                 # Set empty DocsType
                 node.docs_type = DocsType.DEFINITION if node.value else DocsType.DECLARATION
-                # Loop through all nodes and find modifications
-                for n in range(len(target.nodes)):
-                    # Continue if names do not match
-                    target_name = target.nodes[n].clean_name()
-                    target_branch_id = target.nodes[n].branch_id
-                    if target_name != node.clean_name():
-                        continue  # nodes have different names
+                # Loop through all nodes with the same name and find modifications
+                target_name = node.clean_name()
+                for target_node in names.get(target_name, []):
+                    target_branch_id = target_node.branch_id
                     if target_branch_id==node.branch_id:
-                        if target.nodes[n].case_id!=node.case_id:
+                        if target_node.case_id!=node.case_id:
                             continue  # nodes are in the same branch but no case
                     if target_branch_id is not None:
                         target_branch = target.branching.branches[target_branch_id]
@@ -402,6 +588,7 @@ class DIP:
                     node.docs_type = DocsType.MODIFICATION
                     break
                 target.nodes.append(node)
+                names.setdefault(target_name, []).append(node)
         return Documentation(target)
 
     def setup(self):
@@ -25,8 +25,20 @@ class Environment:
     
     def copy(self):
         """ Copy a new object from self
+
+        Node, unit, source and function lists are copied shallowly and share their items with this environment.
+        Only state variables, that are modified in place during parsing, are copied deeply.
         """
-        return copy.deepcopy(self)
+        return Environment(
+            nodes = self.nodes.copy(),
+            units = self.units.copy(),
+            sources = self.sources.copy(),
+            functions = self.functions.copy(),
+            hierarchy = copy.deepcopy(self.hierarchy),
+            branching = copy.deepcopy(self.branching),
+            autoref = self.autoref,
+            envtype = self.envtype,
+        )
 
     def request(self, path:str, count:int=None, namespace:Namespace=Namespace.NODES, tags:list=None, errsrc:bool=True):
         """ Request nodes from a path
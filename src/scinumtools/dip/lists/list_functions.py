@@ -7,6 +7,11 @@ class FunctionList:
     
     def __getitem__(self, key: str):
         return self.functions[key]
+
+    def copy(self):
+        """ Copy a new object from self
+        """
+        return FunctionList(self.functions.copy())
             
     def append(self, name, function):
         self.functions[name] = function
\ No newline at end of file
@@ -1,35 +1,84 @@
 from dataclasses import dataclass, field
-from typing import List, Union
+from typing import List, Dict, Union
 import numpy as np
 
 from ..settings import Order, Sign
 
+def node_groups(name:str):
+    """ Return all parent groups of a node name, e.g. 'a' and 'a.b' for 'a.b.c'
+    """
+    pos = name.find(Sign.SEPARATOR)
+    while pos>=0:
+        yield name[:pos]
+        pos = name.find(Sign.SEPARATOR, pos+1)
+
 @dataclass
 class NodeList:
     nodes: List     = field(default_factory = list)  # list of nodes
+    names: Dict     = field(default = None, init = False, repr = False, compare = False)  # nodes indexed by their names
+    groups: Dict    = field(default = None, init = False, repr = False, compare = False)  # nodes indexed by their parent groups
     
     def __len__(self):
         return len(self.nodes)
     
     def __delitem__(self, key):
+        if self.names is not None:
+            if isinstance(key, int):
+                self._unregister(self.nodes[key])
+            else:
+                self.names = self.groups = None
         del self.nodes[key]
     
     def __getitem__(self, key: Union[int, str]):
         if isinstance(key, int):
             return self.nodes[key]
         elif isinstance(key, str):
+            self._index()
+            if key in self.names:
+                return self.names[key][0].view()
             nodes = NodeList()
-            for node in self.nodes:
-                if node.name == key:
-                    return node.copy()
-                elif node.name.startswith(key+Sign.SEPARATOR):
-                    node = node.copy()
-                    node.name = node.name[len(key)+1:]
-                    nodes.append(node)
+            for node in self.groups.get(key, []):
+                node = node.view()
+                node.name = node.name[len(key)+1:]
+                nodes.append(node)
             return nodes
         else:
             raise Exception("Node list keys can be only integers or strings:", key)
+
+    def _index(self):
+        # Index nodes only when they are requested for the first time
+        if self.names is None:
+            self.names, self.groups = {}, {}
+            for node in self.nodes:
+                self._register(node)
+
+    def _register(self, node):
+        self.names.setdefault(node.name, []).append(node)
+        for group in node_groups(node.name):
+            self.groups.setdefault(group, []).append(node)
+
+    def _unregister(self, node):
+        for index, key in [(self.names, node.name)] + [(self.groups, group) for group in node_groups(node.name)]:
+            items = index.get(key, [])
+            for i in range(len(items)):
+                if items[i] is node:
+                    del items[i]
+                    break
+            else:
+                # node was renamed after it was indexed
+                self.names = self.groups = None
+                return
+            if not items:
+                del index[key]
         
+    def get(self, name:str):
+        """ Return the first node with a given name, or None if it does not exist
+
+        :param str name: Node name
+        """
+        self._index()
+        return self.names[name][0] if name in self.names else None
+    
     def keys(self):
         keys = []
         for node in self.nodes:
@@ -38,15 +87,34 @@ class NodeList:
                 keys.append(node_key)
         keys.sort()
         return keys
-        
+
+    def copy(self):
+        """ Copy a new object from self
+
+        Nodes are copied as lightweight views that share their values with the original nodes.
+        """
+        return NodeList([node.view() for node in self.nodes])
+
     def pop(self):
+        if self.names is not None:
+            self._unregister(self.nodes[0])
         return self.nodes.pop(0)
     
     def append(self, node):
         self.nodes.append(node)
+        if self.names is not None:
+            self._register(node)
         
     def prepend(self, nodes):
         self.nodes = nodes + self.nodes
+        if self.names is not None:
+            names, groups = self.names, self.groups
+            self.names, self.groups = {}, {}
+            for node in nodes:
+                self._register(node)
+            for index, previous in [(self.names, names), (self.groups, groups)]:
+                for key, items in previous.items():
+                    index[key] = index.get(key, []) + items
         
     def query(self, query:str, tags:list=None, order:Order=None):
         """ Select local nodes according to a query
@@ -57,19 +125,19 @@ class NodeList:
         """
         nodes = NodeList()
         if query==Sign.WILDCARD:
-            nodes = NodeList([node.copy() for node in self.nodes])
+            nodes = NodeList([node.view() for node in self.nodes])
         elif query[-2:]==Sign.SEPARATOR + Sign.WILDCARD:
-            for node in self.nodes:
-                if node.name.startswith(query[:-1]):
-                    node = node.copy()
-                    node.name = node.name[len(query[:-1]):]
-                    nodes.append(node.copy())
+            self._index()
+            for node in self.groups.get(query[:-2], []):
+                node = node.view()
+                node.name = node.name[len(query[:-1]):]
+                nodes.append(node)
         else:
-            for node in self.nodes:
-                if node.name==query:
-                    node = node.copy()
-                    node.name = node.name.split(Sign.SEPARATOR)[-1]
-                    nodes.append(node.copy())
+            self._index()
+            for node in self.names.get(query, []):
+                node = node.view()
+                node.name = node.name.split(Sign.SEPARATOR)[-1]
+                nodes.append(node)
         if tags:
             tagged = NodeList()
             for n in range(len(nodes)):
@@ -1,6 +1,5 @@
 from typing import Dict
 from dataclasses import dataclass, field
-import copy
 
 from ..settings import Sign
 from .list_nodes import NodeList
@@ -40,8 +39,10 @@ class SourceList:
     
     def copy(self):
         """ Copy a new object from self
+
+        Sources are shared with the original list, because they are only replaced and never modified in place.
         """
-        return copy.deepcopy(self)
+        return SourceList(self.sources.copy())
         
     def append(self, name:str, path:str, code:str, parent:tuple = None):
         """ Append a new source
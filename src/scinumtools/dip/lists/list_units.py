@@ -19,6 +19,11 @@ class UnitList:
     
     def keys(self):
         return self.units.keys()
+
+    def copy(self):
+        """ Copy a new object from self
+        """
+        return UnitList(self.units.copy())
         
     def append(self, name:str, value:str, units:str, unit:Quantity, source:tuple):
         """ Add a new source
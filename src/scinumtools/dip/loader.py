@@ -0,0 +1,213 @@
+import os
+import re
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+import scinumtools.dip as dipsl
+from .settings import Sign
+from .nodes.parser import Parser
+from .lists.list_sources import EnvSource
+from . import cache
+
+LOADER = None   # currently active source loader
+
+def source_path(env, source:str, filepath:str):
+    """ Return path of a file relative to the path of a source
+
+    :param env: Environment with the source
+    :param str source: Name of the source
+    :param str filepath: Relative or absolute file path
+    """
+    if os.path.isabs(filepath):
+        return filepath
+    parent = Path(env.sources[source].path)
+    if os.path.isfile(parent):
+        return parent.parent / filepath
+    else:
+        return parent / filepath
+
+def scan_lines(lines:list):
+    """ Return DIP sources declared in code lines and names of all referenced sources
+
+    :param list lines: Code lines with their sources
+    """
+    sources, references, block = [], set(), False
+    for line in lines:
+        code = line['code']
+        references.update(re.findall(r'\{([a-zA-Z0-9_.-]*)' + re.escape(Sign.QUERY), code))
+        references.update(re.findall(r'\{([a-zA-Z0-9_.-]+)\}', code))
+        if '"""' in code:
+            block = not block if code.count('"""')%2 else block
+            continue
+        elif block:
+            continue
+        parser = Parser(code=code, source=line['source'])
+        parser.part_indent()
+        parser.kwd_source()
+        if not parser.is_parsed('kwd_source'):
+            continue
+        parser.part_comment()
+        parser = Parser(code=parser.value_raw, source=line['source'])
+        parser.part_reference()
+        if parser.is_parsed('part_reference'):
+            continue
+        parser.part_name(path=False)
+        parser.part_equal()
+        parser.part_value()
+        if parser.value_ref:
+            references.add(None)   # source path is not known before parsing
+        sources.append((parser.name, parser.value_raw, parser.source))
+    return sources, references
+
+def parse_source(filepath:str, name:str, source:tuple, parsed:dict, token_cache=None):
+    """ Parse a DIP source file without sources of its parent
+
+    :param str filepath: Absolute path of the file
+    :param str name: Name of the source
+    :param tuple source: Source and line number where the source was declared
+    :param dict parsed: Environments of already parsed sources
+    :param token_cache: Cache of nodes lexed from files
+    """
+    global LOADER
+    previous = LOADER
+    LOADER = SourceLoader(parsed=parsed)
+    try:
+        p = dipsl.DIP(source=source, token_cache=token_cache)
+        p.add_file(filepath, name)
+        return p.parse()
+    except Exception as e:
+        return e
+    finally:
+        LOADER = previous
+
+class SourceLoader:
+    """ Loader of DIP source files that are declared using the $source keyword
+
+    Before parsing, declarations of DIP sources are scanned in all files and collected into a dependency graph.
+    Sources that do not reference sources of their parents are parsed only once, starting from the leaves of the graph,
+    and optionally in parallel using multiple worker processes.
+    Parsed sources are used whenever they are declared during parsing, therefore the final environment does not depend on the order in which sources were loaded.
+
+    :param int workers: Number of worker processes
+    :param dict parsed: Environments of already parsed sources
+    """
+
+    workers: int
+    parsed: dict    # environments of parsed sources indexed by their paths and names
+    _previous: object
+
+    def __enter__(self):
+        global LOADER
+        self._previous = LOADER
+        LOADER = self
+        return self
+
+    def __exit__(self, type, value, tb):
+        global LOADER
+        LOADER = self._previous
+
+    def __init__(self, workers:int=None, parsed:dict=None):
+        self.workers = workers
+        self.parsed = {} if parsed is None else parsed
+        self._previous = None
+
+    def get(self, filepath:str, name:str):
+        """ Return a parsed environment of a source, or None if it was not loaded
+
+        :param str filepath: Path of the source file
+        :param str name: Name of the source
+        """
+        return self.parsed.get((os.path.realpath(filepath), name))
+
+    def scan(self, env, lines:list):
+        """ Return a dependency graph of all DIP sources declared in code lines and in the sources
+
+        :param env: Environment with sources of the code lines
+        :param list lines: Code lines
+        """
+        graph = {}   # sources, their children, source declarations and indicators if they are independent
+        def add(env, lines):
+            children = []
+            declared, references = scan_lines(lines)
+            for name, filepath, source in declared:
+                if not filepath.endswith('dip'):
+                    continue
+                filepath = os.path.realpath(source_path(env, source[0], filepath))
+                key = (filepath, name)
+                children.append(key)
+                if key in graph:
+                    continue
+                graph[key] = None   # prevent cycles
+                try:
+                    p = dipsl.DIP(source=source)
+                    p.add_file(filepath, name)
+                except OSError:
+                    graph[key] = ([], source, False)
+                    continue
+                grandchildren, independent = add(p.env, p.lines)
+                graph[key] = (grandchildren, source, independent)
+            names = {name for name, filepath, source in declared}
+            return children, references<=names|{''}
+        add(env, lines)
+        # source is independent only if all its children are independent
+        changed = True
+        while changed:
+            changed = False
+            for key, (children, source, independent) in graph.items():
+                if independent and not all(graph[child][2] for child in children):
+                    graph[key] = (children, source, False)
+                    changed = True
+        return graph
+
+    def load(self, env, lines:list):
+        """ Parse all independent DIP sources declared in code lines
+
+        :param env: Environment with sources of the code lines
+        :param list lines: Code lines
+        """
+        graph = self.scan(env, lines)
+        waiting = {key: set(children) for key, (children, source, independent) in graph.items() if independent}
+        def ready():
+            keys = [key for key, children in waiting.items() if not children]
+            for key in keys:
+                del waiting[key]
+            return keys
+        def done(key, penv):
+            if not isinstance(penv, Exception):
+                self.parsed[key] = penv
+            for children in waiting.values():
+                children.discard(key)
+        if self.workers and self.workers>1:
+            with ProcessPoolExecutor(self.workers) as executor:
+                futures = {}
+                while True:
+                    for key in ready():
+                        children = {child: self.parsed[child] for child in graph[key][0] if child in self.parsed}
+                        futures[executor.submit(parse_source, *key, graph[key][1], children, cache.TOKEN_CACHE)] = key
+                    if not futures:   # remaining sources have cyclic dependencies
+                        break
+                    finished, pending = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        done(futures.pop(future), future.result())
+        else:
+            while keys:=ready():
+                for key in keys:
+                    done(key, parse_source(*key, graph[key][1], self.parsed, cache.TOKEN_CACHE))
+
+    def source(self, env, name:str, filepath:str, source:tuple):
+        """ Return a loaded source, or None if it was not loaded or its name is already used
+
+        :param env: Environment where the source is declared
+        :param str name: Name of the source
+        :param str filepath: Path of the source file
+        :param tuple source: Source and line number where the source was declared
+        """
+        penv = self.get(filepath, name)
+        if penv is None or any(key in env.sources for key in penv.sources.keys()):
+            return None
+        loaded = penv.sources[name]
+        loaded = EnvSource(name, loaded.path, loaded.code, source, penv.nodes, env.sources.copy())
+        for key, val in penv.sources.items():
+            loaded.sources[key] = val
+        loaded.sources[name] = loaded
+        return loaded
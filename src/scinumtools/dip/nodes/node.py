@@ -1,6 +1,9 @@
 from typing import List
 import copy
 
+from ..datatypes import Type
+from .node_select import Option
+
 class Node:
     code: str 
     source: tuple = None            # source 
@@ -26,4 +29,25 @@ class Node:
             setattr(self, key, val)
 
     def copy(self):
-        return copy.deepcopy(self)
\ No newline at end of file
+        return copy.deepcopy(self)
+
+    def view(self):
+        """ Return a lightweight copy of the node that shares data of its values
+
+        Value objects are copied, because comparisons and unit conversions modify them in place,
+        but their data, e.g. large arrays, are only replaced and can be shared with the original node.
+        Lists that are modified in place, e.g. tags or options, are copied.
+        """
+        def view(value):
+            if isinstance(value, Type):
+                return value.copy()
+            elif isinstance(value, Option):
+                return Option(view(value.value), value.value_raw, value.units_raw)
+            elif isinstance(value, list):
+                return [view(item) for item in value]
+            return value
+        node = copy.copy(self)
+        for key, value in node.__dict__.items():
+            if isinstance(value, (Type, list)):
+                node.__dict__[key] = view(value)
+        return node
\ No newline at end of file
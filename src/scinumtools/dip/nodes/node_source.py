@@ -2,6 +2,8 @@ import os
 from pathlib import Path
 
 import scinumtools.dip as dipsl
+from .. import loader
+from .. import cache
 from .node_base import BaseNode
 from .parser import Parser
 from ..settings import Namespace
@@ -35,9 +37,14 @@ class SourceNode(BaseNode):
             parser.part_value()          # parse value
             if parser.value_ref:
                 self.inject_value(env, parser)
-            if parser.value_raw.endswith('dip'):
+            if parser.value_raw.endswith('dip') and loader.LOADER and (source:=loader.LOADER.source(
+                    env, parser.name, loader.source_path(env, self.source[0], parser.value_raw), self.source
+            )) is not None:
+                # source is a DIP file that was already loaded
+                env.sources[parser.name] = source
+            elif parser.value_raw.endswith('dip'):
                 # source is a DIP file
-                p = dipsl.DIP(source=self.source)
+                p = dipsl.DIP(source=self.source, token_cache=cache.TOKEN_CACHE)
                 p.env.sources = env.sources.copy()
                 p.add_file(parser.value_raw, parser.name)
                 penv = p.parse()
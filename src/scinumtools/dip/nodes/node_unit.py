@@ -34,7 +34,5 @@ class UnitNode(BaseNode):
             parser.part_units()          # parse unit
             with UnitEnvironment(env.units):
                 unit = Quantity(float(parser.value_raw), parser.units_raw)
-                unit.symbol = '['+parser.name+']'
-                unit.dfn = f"{parser.value_raw}*{parser.units_raw}"
                 env.units.append(parser.name, parser.value_raw, parser.units_raw, unit, self.source)
         return None
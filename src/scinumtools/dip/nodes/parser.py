@@ -4,6 +4,40 @@ import re
 from ..settings import Keyword, Sign
 from .node import Node
 
+# Patterns of directive keywords and node parts are compiled only once
+NAME = r'[a-zA-Z0-9_.-]'
+PATTERNS = dict(
+    directive       = re.compile(r'^\s*(=|[{' + re.escape(Sign.VALIDATION) + r']|' + NAME + r'*[' +
+                                 re.escape(Sign.VARIABLE + Sign.CONDITION) + r'])'),
+    kwd_case        = re.compile(r'^((' + NAME + r'*' + re.escape(Sign.CONDITION) + Keyword.CASE + r')\s+)'),
+    kwd_case_end    = re.compile(r'^(' + NAME + r'*(' +
+                                 re.escape(Sign.CONDITION) + Keyword.ELSE + r'|' +
+                                 re.escape(Sign.CONDITION) + Keyword.END + r'))'),
+    kwd_unit        = re.compile(r'^((' + NAME + r'*' + re.escape(Sign.VARIABLE) + Keyword.UNIT + r')\s+([^#]*))'),
+    kwd_source      = re.compile(r'^((' + NAME + r'*' + re.escape(Sign.VARIABLE) + Keyword.SOURCE + r')\s+([^#]*))'),
+    kwd_options     = re.compile(r'^((' + re.escape(Sign.VALIDATION) + Keyword.OPTIONS + r')\s+)'),
+    kwd_constant    = re.compile(r'^(' + re.escape(Sign.VALIDATION) + Keyword.CONSTANT + r')'),
+    kwd_format      = re.compile(r'^((' + re.escape(Sign.VALIDATION) + Keyword.FORMAT + r')\s*)'),
+    kwd_tags        = re.compile(r'^((' + re.escape(Sign.VALIDATION) + Keyword.TAGS + r')\s*)'),
+    kwd_description = re.compile(r'^((' + re.escape(Sign.VALIDATION) + Keyword.DESCRIPTION + r'|' +
+                                 re.escape(Sign.VALIDATION) + Keyword.DESCRIPTION[:4] + r')\s*)'),
+    kwd_condition   = re.compile(r'^((' + re.escape(Sign.VALIDATION) + Keyword.CONDITION + r')\s*)'),
+    part_indent     = re.compile(r'^(\s*)'),
+    part_name       = re.compile(r'^(' + NAME + r'+)'),    # format of node names
+    part_name_unit  = re.compile(r'^([a-zA-Z0-9_]+)'),     # format of unit names
+    part_type       = re.compile(r'^(\s+(bool|str|table|(u|)int(16|32|64|)|float(32|64|128|)))'),
+    part_dimension  = re.compile(r'^(\[([0-9:,]+)\])'),
+    part_equal      = re.compile(r'^(\s*=\s*)'),
+    part_value      = re.compile(r'^(("""(.*)"""|"(.*)"|\'(.*)\'|([^# ]+)))'),
+    part_reference  = re.compile(r'^(\s*({([^}]*)}))'),
+    part_format     = re.compile(r'^(:[0-9.]*[sdfeb]+)'),
+    part_function   = re.compile(r'^(\(([a-zA-Z0-9_-]*)\))'),
+    part_expression = re.compile(r'^(\(("""(.*)"""|"(.*)"|\'(.*)\')\))'),
+    part_units_sign = re.compile(r'^\s+[\/*+-]+'),
+    part_units      = re.compile(r'^(\s+([^\s#=]+))'),
+    part_comment    = re.compile(r'^(\s*#\s*(.*))$'),
+)
+
 class Parser(Node):
     ccode: str
     comment: str = None
@@ -21,6 +55,11 @@ class Parser(Node):
     def is_empty(self):
         return self.ccode.strip()==''
 
+    def is_directive(self):
+        """ Check if code can contain a directive, modification or option instead of a node definition
+        """
+        return PATTERNS['directive'].match(self.ccode) is not None
+
     def is_parsed(self, name:str):
         """ Check if directive or node part was already parsed
 
@@ -33,35 +72,20 @@ class Parser(Node):
     #####################
     
     def kwd_case(self):
-        m=re.match(
-            r'^(([a-zA-Z0-9_.-]*'+
-            re.escape(Sign.CONDITION) + Keyword.CASE +
-            r')\s+)',
-            self.ccode
-        )
+        m=PATTERNS['kwd_case'].match(self.ccode)
         if m:
             self.parsed.append('kwd_case')
             self.name = m.group(2)
             self._strip(m.group(1))
         else:
-            m=re.match(
-                r'^([a-zA-Z0-9_.-]*('+
-                re.escape(Sign.CONDITION) + Keyword.ELSE +'|'+
-                re.escape(Sign.CONDITION) + Keyword.END +'))',
-                self.ccode
-            )
+            m=PATTERNS['kwd_case_end'].match(self.ccode)
             if m:
                 self.parsed.append('kwd_case')
                 self.name = m.group(1)
                 self._strip(m.group(1))
 
     def kwd_unit(self):
-        m=re.match(
-            r'^(([a-zA-Z0-9_.-]*'+
-            re.escape(Sign.VARIABLE) + Keyword.UNIT +
-            r')\s+([^#]*))',
-            self.ccode
-        )
+        m=PATTERNS['kwd_unit'].match(self.ccode)
         if m:
             self.parsed.append('kwd_unit')
             self.name = m.group(2)
@@ -69,12 +93,7 @@ class Parser(Node):
             self._strip(m.group(1))
 
     def kwd_source(self):
-        m=re.match(
-            r'^(([a-zA-Z0-9_.-]*'+
-            re.escape(Sign.VARIABLE) + Keyword.SOURCE +
-            r')\s+([^#]*))',
-            self.ccode
-        )
+        m=PATTERNS['kwd_source'].match(self.ccode)
         if m:
             self.parsed.append('kwd_source')
             self.name = m.group(2)
@@ -82,58 +101,38 @@ class Parser(Node):
             self._strip(m.group(1))
 
     def kwd_options(self):
-        m=re.match(
-            r'^(('+re.escape(Sign.VALIDATION)+Keyword.OPTIONS+r')\s+)',
-            self.ccode
-        )
+        m=PATTERNS['kwd_options'].match(self.ccode)
         if m:
             self.parsed.append('kwd_options')
             self.dimension = [(None,None)]
             self._strip(m.group(1))
 
     def kwd_constant(self):
-        m=re.match(
-            r'^('+re.escape(Sign.VALIDATION)+Keyword.CONSTANT+r')',
-            self.ccode
-        )
+        m=PATTERNS['kwd_constant'].match(self.ccode)
         if m:
             self.parsed.append('kwd_constant')
             self._strip(m.group(1))
 
     def kwd_format(self):
-        m=re.match(
-            r'^(('+re.escape(Sign.VALIDATION)+Keyword.FORMAT+r')\s*)',
-            self.ccode
-        )
+        m=PATTERNS['kwd_format'].match(self.ccode)
         if m:
             self.parsed.append('kwd_format')
             self._strip(m.group(1))
             
     def kwd_tags(self):
-        m=re.match(
-            r'^(('+re.escape(Sign.VALIDATION)+Keyword.TAGS+r')\s*)',
-            self.ccode
-        )
+        m=PATTERNS['kwd_tags'].match(self.ccode)
         if m:
             self.parsed.append('kwd_tags')
             self._strip(m.group(1))
 
     def kwd_description(self):
-        kwd1 = re.escape(Sign.VALIDATION)+Keyword.DESCRIPTION
-        kwd2 = re.escape(Sign.VALIDATION)+Keyword.DESCRIPTION[:4]
-        m=re.match(
-            r'^(('+kwd1+r'|'+kwd2+r')\s*)',
-            self.ccode
-        )
+        m=PATTERNS['kwd_description'].match(self.ccode)
         if m:
             self.parsed.append('kwd_description')
             self._strip(m.group(1))
 
     def kwd_condition(self):
-        m=re.match(
-            r'^(('+re.escape(Sign.VALIDATION)+Keyword.CONDITION+r')\s*)',
-            self.ccode
-        )
+        m=PATTERNS['kwd_condition'].match(self.ccode)
         if m:
             self.parsed.append('kwd_condition')
             self._strip(m.group(1))
@@ -143,7 +142,7 @@ class Parser(Node):
     #############
     
     def part_indent(self):
-        m=re.match(r'^(\s*)',self.ccode)
+        m=PATTERNS['part_indent'].match(self.ccode)
         if m:
             self.parsed.append('part_indent')
             self.indent = len(m.group(1))
@@ -151,9 +150,9 @@ class Parser(Node):
 
     def part_name(self, path=True):
         if path is True:
-            m=re.match(r'^([a-zA-Z0-9_.-]+)', self.ccode)  # format of node names
+            m=PATTERNS['part_name'].match(self.ccode)
         else:
-            m=re.match(r'^([a-zA-Z0-9_]+)', self.ccode)    # format of unit names
+            m=PATTERNS['part_name_unit'].match(self.ccode)
         if m:
             self.parsed.append('part_name')
             self.name = m.group(1)
@@ -164,31 +163,24 @@ class Parser(Node):
             raise Exception("Name has an invalid format: "+self.ccode)
         
     def part_type(self):
-        types = [
-            ('bool',    r'^(\s+bool)',                False, False),
-            ('str',     r'^(\s+str)',                 False, False),
-            ('table',   r'^(\s+table)',               False, False),
-            ('int',     r'^(\s+(u|)int(16|32|64|))',  True,  True),
-            ('float',   r'^(\s+float(32|64|128|))',   True,  False),
-        ]
-        for keyword, pattern, precision, unsigned in types:
-            m=re.match(pattern, self.ccode)
-            if m:
-                self.parsed.append('part_type')
-                self.keyword = keyword
-                if unsigned and precision:   # integer
-                    self.dtype_prop.append(m.group(2))
-                    self.dtype_prop.append(m.group(3))
-                elif precision:              # float
-                    self.dtype_prop.append(m.group(2))
-                self._strip(m.group(1))
-                break
+        m=PATTERNS['part_type'].match(self.ccode)
+        if m:
+            self.parsed.append('part_type')
+            if m.group(4) is not None:   # integer
+                self.keyword = 'int'
+                self.dtype_prop.append(m.group(3))
+                self.dtype_prop.append(m.group(4))
+            elif m.group(5) is not None: # float
+                self.keyword = 'float'
+                self.dtype_prop.append(m.group(5))
+            else:
+                self.keyword = m.group(2)
+            self._strip(m.group(1))
         if self.keyword is None:
             raise Exception(f"Type not recognized: {self.code}")
 
     def _part_dimension(self):
-        pattern = r'^(\[([0-9:,]+)\])'
-        m=re.match(pattern, self.ccode)
+        m=PATTERNS['part_dimension'].match(self.ccode)
         if m:
             dims = m.group(2).split(',')
             var = []
@@ -211,7 +203,7 @@ class Parser(Node):
             self.dimension = dim
                         
     def part_equal(self):
-        m=re.match(r'^(\s*=\s*)', self.ccode)
+        m=PATTERNS['part_equal'].match(self.ccode)
         if m:
             self.parsed.append('part_equal')
             self._strip(m.group(1))
@@ -233,7 +225,7 @@ class Parser(Node):
             self.parsed.append('part_value')
             return
         # If not block value, parse standard text value
-        m=re.match(r'^(("""(.*)"""|"(.*)"|\'(.*)\'|([^# ]+)))', self.ccode)
+        m=PATTERNS['part_value'].match(self.ccode)
         if m:
             self.parsed.append('part_value')
             # Reduce matches
@@ -245,7 +237,7 @@ class Parser(Node):
             raise Exception("Value cannot start with an empty string:", self.code)
         
     def part_reference(self, inject=False):
-        m=re.match(r'^(\s*({([^}]*)}))', self.ccode)
+        m=PATTERNS['part_reference'].match(self.ccode)
         if m:
             self.parsed.append('part_reference')
             self.value_ref = m.group(3)
@@ -264,14 +256,14 @@ class Parser(Node):
             self.value_slice = dim
 
     def part_format(self):  # template reference text format
-        m=re.match(r'^(:[0-9.]*[sdfeb]+)', self.ccode)
+        m=PATTERNS['part_format'].match(self.ccode)
         if m:
             self.parsed.append('part_format')
             self.formating = m.group(1)
             self._strip(m.group(1))
 
     def part_function(self):
-        m=re.match(r'^(\(([a-zA-Z0-9_-]*)\))', self.ccode)
+        m=PATTERNS['part_function'].match(self.ccode)
         if m:
             self.parsed.append('part_function')
             # Reduce matches
@@ -280,7 +272,7 @@ class Parser(Node):
             self._strip(m.group(1))
             
     def part_expression(self):
-        m=re.match(r'^(\(("""(.*)"""|"(.*)"|\'(.*)\')\))', self.ccode)
+        m=PATTERNS['part_expression'].match(self.ccode)
         if m:
             self.parsed.append('part_expression')
             # Reduce matches
@@ -292,15 +284,15 @@ class Parser(Node):
     def part_units(self):
         # In numerical expressions following starting
         # signs +-*/ have to be explicitely excluded
-        n=re.match(r'^\s+[\/*+-]+', self.ccode)
-        m=re.match(r'^(\s+([^\s#=]+))', self.ccode)
+        n=PATTERNS['part_units_sign'].match(self.ccode)
+        m=PATTERNS['part_units'].match(self.ccode)
         if m and not n:
             self.parsed.append('part_units')
             self.units_raw = m.group(2)
             self._strip(m.group(1))
         
     def part_comment(self):
-        m=re.match(r'^(\s*#\s*(.*))$', self.ccode)
+        m=PATTERNS['part_comment'].match(self.ccode)
         if m:
             self.parsed.append('part_comment')
             self.comment = m.group(2)
@@ -82,6 +82,13 @@ class CustomAnd(OperatorAnd):
         if isinstance(right, (bool, np.bool_)):
             right = BooleanType(right)
         tokens.put_left(left.logical_and(right))
+
+    def operate_short(self, tokens):
+        left = tokens.get_left()
+        if isinstance(left, (bool, np.bool_)):
+            left = BooleanType(left)
+        tokens.put_left(left)
+        return super().operate_short(tokens)
         
 class CustomOr(OperatorOr):
     
@@ -91,4 +98,11 @@ class CustomOr(OperatorOr):
             left = BooleanType(left)
         if isinstance(right, (bool, np.bool_)):
             right = BooleanType(right)
-        tokens.put_left(left.logical_or(right))
\ No newline at end of file
+        tokens.put_left(left.logical_or(right))
+
+    def operate_short(self, tokens):
+        left = tokens.get_left()
+        if isinstance(left, (bool, np.bool_)):
+            left = BooleanType(left)
+        tokens.put_left(left)
+        return super().operate_short(tokens)
\ No newline at end of file
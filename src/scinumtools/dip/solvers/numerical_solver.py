@@ -38,7 +38,6 @@ class NumericalSolver:
             value, units = p.value_raw, p.units_raw
         with UnitEnvironment(self.env.units):                
             unit = Quantity(float(value), units)
-        unit.symbol = expr
         return unit
         
     def solve(self, expr, in_units=None):
@@ -1,3 +1,6 @@
 from .solver import ExpressionSolver
-from .atom import AtomBase
+from .program import ExpressionProgram
+from .array_solver import ArraySolver
+from .profiler import SolverProfiler
+from .atom import AtomBase, AtomArray
 from .operators import *
\ No newline at end of file
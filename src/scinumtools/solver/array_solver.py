@@ -0,0 +1,21 @@
+import numpy as np
+
+from .atom import AtomArray
+from .solver import ExpressionSolver
+
+def ArraySolver(expr:str, data, operators:dict = None, steps:list = None):
+    """ Evaluate expression elementwise over arrays of variables
+
+    Expression is compiled only once and every operation is performed on whole arrays.
+
+    :param expr: Expression string
+    :param data: Dictionary of arrays or a pandas DataFrame with variable values
+    :param operators: Dictionary of operator classes
+    :param steps: List of operation steps
+    """
+    if hasattr(data, 'columns'):
+        data = {column: data[column].to_numpy() for column in data.columns}
+    with ExpressionSolver(AtomArray, operators, steps) as es:
+        value = es.solve(expr, data).value
+    shape = np.broadcast_shapes(*[np.shape(array) for array in data.values()])
+    return np.array(np.broadcast_to(value, shape))
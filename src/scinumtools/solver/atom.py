@@ -77,4 +77,80 @@ class AtomBase:
     def __gt__(self, other):
         return AtomBase(self.value > other.value)
 
-    
+class AtomArray(AtomBase):
+    """ Atom that evaluates operations elementwise on NumPy arrays
+    """
+
+    value: np.ndarray
+
+    def __init__(self, value:Union[str,float,bool,np.ndarray]):
+        if isinstance(value,str):
+            self.value = np.asarray(float(value.strip()))
+        else:
+            self.value = np.asarray(value)
+
+    def __repr__(self):
+        return f"AtomArray({self.value})"
+
+    def __add__(self, other):
+        return AtomArray(np.add(self.value, other.value))
+
+    def __sub__(self, other):
+        return AtomArray(np.subtract(self.value, other.value))
+
+    def __mul__(self, other):
+        return AtomArray(np.multiply(self.value, other.value))
+
+    def __truediv__(self, other):
+        return AtomArray(np.true_divide(self.value, other.value))
+
+    def __pow__(self, other):
+        return AtomArray(np.power(self.value, other.value))
+
+    def __neg__(self):
+        return AtomArray(np.negative(self.value))
+
+    def log(self):
+        return AtomArray(np.log(self.value))
+
+    def log10(self):
+        return AtomArray(np.log10(self.value))
+
+    def sqrt(self):
+        return AtomArray(np.sqrt(self.value))
+
+    def sin(self):
+        return AtomArray(np.sin(self.value))
+
+    def cos(self):
+        return AtomArray(np.cos(self.value))
+
+    def tan(self):
+        return AtomArray(np.tan(self.value))
+
+    def logical_and(self, other):
+        return AtomArray(np.logical_and(self.value, other.value))
+
+    def logical_or(self, other):
+        return AtomArray(np.logical_or(self.value, other.value))
+
+    def logical_not(self):
+        return AtomArray(np.logical_not(self.value))
+
+    def __eq__(self, other):
+        return AtomArray(np.equal(self.value, other.value))
+
+    def __ne__(self, other):
+        return AtomArray(np.not_equal(self.value, other.value))
+
+    def __le__(self, other):
+        return AtomArray(np.less_equal(self.value, other.value))
+
+    def __ge__(self, other):
+        return AtomArray(np.greater_equal(self.value, other.value))
+
+    def __lt__(self, other):
+        return AtomArray(np.less(self.value, other.value))
+
+    def __gt__(self, other):
+        return AtomArray(np.greater(self.value, other.value))
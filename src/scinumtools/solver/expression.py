@@ -1,25 +1,44 @@
 class Expression:
-    
-    left: str
+
     expr: str
-    right: str
-    
+    start: int    # beginning of the left side
+    pos: int      # beginning of the right side
+    prefix: str   # part of the left side that precedes a removed string
+
     def __repr__(self):
         return f"Expr({self.right.strip()})"
-    
+
     def __init__(self, expr:str):
         self.expr = expr
-        self.right = expr
-        self.left = ''
-        
+        self.start = 0
+        self.pos = 0
+        self.prefix = ''
+
+    @property
+    def left(self):
+        return self.prefix + self.expr[self.start:self.pos]
+
+    @property
+    def right(self):
+        return self.expr[self.pos:]
+
+    def empty(self):
+        return self.pos>=len(self.expr)
+
+    def startswith(self, string:str):
+        return self.expr.startswith(string, self.pos)
+
     def shift(self, nchar:int=1):
-        self.left += self.right[:nchar]
-        self.right = self.right[nchar:]
-        
+        self.pos += nchar
+
     def remove(self, string:str):
-        self.right = self.right[len(string):]
-        
+        if self.start<self.pos:
+            self.prefix += self.expr[self.start:self.pos]
+        self.pos += len(string)
+        self.start = self.pos
+
     def pop_left(self):
         left = self.left.strip()
-        self.left = ''
+        self.prefix = ''
+        self.start = self.pos
         return left
@@ -111,14 +111,14 @@ class OperatorPar(OperatorBase):
         depth=1
         self.args = []
         while depth>0:
-            if len(expr.right)==0:
+            if expr.empty():
                 raise Exception("Unclosed parenthesis in", expr.expr)
-            elif expr.right.startswith(self.symbol) or expr.right.startswith(self.symbol_open):
+            elif expr.startswith(self.symbol) or expr.startswith(self.symbol_open):
                 depth += 1
-            elif expr.right.startswith(self.symbol_separator) and depth==1:
+            elif expr.startswith(self.symbol_separator) and depth==1:
                 expr.remove(self.symbol_separator)
                 self.args.append(Expression(expr.pop_left()))                
-            elif expr.right.startswith(self.symbol_close):
+            elif expr.startswith(self.symbol_close):
                 depth -= 1
                 if depth==0:
                     expr.remove(self.symbol_close)
@@ -204,6 +204,16 @@ class OperatorAnd(OperatorBase):
         left, right = tokens.get_left(), tokens.get_right()
         tokens.put_left(left.logical_and(right))
 
+    def operate_short(self, tokens):
+        # result is decided without the right operand if the left operand is false
+        left = tokens.get_left()
+        value = getattr(left, 'value', None)
+        if isinstance(value, (bool, np.bool_)) and not value:
+            tokens.put_left(left.logical_and(left))
+            return True
+        tokens.put_left(left)
+        return False
+
 class OperatorOr(OperatorBase):
     
     symbol: str = '||'
@@ -212,6 +222,16 @@ class OperatorOr(OperatorBase):
         left, right = tokens.get_left(), tokens.get_right()
         tokens.put_left(left.logical_or(right))
 
+    def operate_short(self, tokens):
+        # result is decided without the right operand if the left operand is true
+        left = tokens.get_left()
+        value = getattr(left, 'value', None)
+        if isinstance(value, (bool, np.bool_)) and value:
+            tokens.put_left(left.logical_or(left))
+            return True
+        tokens.put_left(left)
+        return False
+
 class OperatorNot(OperatorBase):
     
     symbol: str = '!'
@@ -0,0 +1,315 @@
+import copy
+
+from .operators import OperatorBase, Otype
+from .tokens import Tokens
+from . import profiler
+
+class TreeContext(Tokens):
+    """ Tokens used to apply operators during evaluation of an expression tree
+
+    :param atom: Atom class or function parsing atom strings
+    :param variables: Values used instead of atom strings
+    :param parser: Function parsing atom strings and variables, atom is used by default
+    """
+
+    variables: dict
+    parser: object
+    cache: dict     # values of shared sub-expressions
+
+    def __init__(self, atom, variables:dict=None, parser=None):
+        super().__init__(atom)
+        self.variables = variables
+        self.parser = parser or atom
+        self.cache = {}
+
+    def apply(self, method, left, right):
+        self.left = [] if left is None else [left]
+        self.right = [] if right is None else [right]
+        if profiler.PROFILER:
+            profiler.PROFILER.operate(method, self)
+        else:
+            method(self)
+        if len(self.left)+len(self.right)!=1:
+            raise Exception("Cannot solve expression due to unprocessed tokens:", self.left, self.right)
+        return self.left[0] if self.left else self.right[0]
+
+    def decide(self, operator, left):
+        """ Return result of a binary operator if it is decided by the left operand, otherwise None
+
+        :param operator: Operator with a short-circuit method
+        :param left: Left operand
+        """
+        self.left, self.right = [left], []
+        if profiler.PROFILER:
+            decided = profiler.PROFILER.operate(operator.operate_short, self)
+        else:
+            decided = operator.operate_short(self)
+        return self.left[0] if decided else None
+
+class TreeNode:
+
+    key: tuple
+    shared: bool = False   # sub-expression occurs multiple times in the tree
+
+    def evaluate(self, context:TreeContext):
+        if not self.shared:
+            return self.compute(context)
+        if self.key not in context.cache:
+            value = self.compute(context)
+            context.cache[self.key] = copy.copy(value)
+            return value
+        return copy.copy(context.cache[self.key])
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self})"
+
+    def nodes(self):
+        yield self
+
+    def fold(self, context:TreeContext, variables:set):
+        return self
+
+class TreeAtom(TreeNode):
+
+    string: str
+
+    def __init__(self, string:str):
+        self.string = string
+        self.key = ('atom', string)
+
+    def __str__(self):
+        return self.string
+
+    def compute(self, context:TreeContext):
+        if context.variables and self.string in context.variables:
+            return context.parser(context.variables[self.string])
+        else:
+            return context.parser(self.string)
+
+    def fold(self, context:TreeContext, variables:set):
+        if self.string in variables:
+            return self
+        return TreeConstant(self.compute(context))
+
+class TreeConstant(TreeNode):
+
+    value: object
+
+    def __init__(self, value):
+        self.value = value
+        self.key = ('constant', id(value))
+
+    def __str__(self):
+        return repr(self.value)
+
+    def compute(self, context:TreeContext):
+        return copy.copy(self.value)
+
+class TreeOperator(TreeNode):
+
+    operator: OperatorBase
+    otype: Otype
+    operands: list
+
+    def __init__(self, operator:OperatorBase, otype:Otype, operands:list):
+        self.operator = operator
+        self.otype = otype
+        self.operands = operands
+        self.key = (type(operator), otype) + tuple(operand.key for operand in operands)
+
+    def __str__(self):
+        if self.otype==Otype.ARGS:
+            separator = f"{self.operator.symbol_separator} "
+            return self.operator.symbol + separator.join(map(str, self.operands)) + self.operator.symbol_close
+        else:
+            return f"{self.operator.symbol}{self.operands[0]}"
+
+    def nodes(self):
+        yield self
+        for operand in self.operands:
+            yield from operand.nodes()
+
+    def compute(self, context:TreeContext):
+        values = [operand.evaluate(context) for operand in self.operands]
+        if self.otype==Otype.ARGS:
+            op = copy.copy(self.operator)
+            op.args = values
+            return context.apply(op.operate_args, None, None)
+        else:
+            return context.apply(self.operator.operate_unary, None, values[0])
+
+    def fold(self, context:TreeContext, variables:set):
+        operands = [operand.fold(context, variables) for operand in self.operands]
+        node = TreeOperator(self.operator, self.otype, operands)
+        if all(isinstance(operand, TreeConstant) for operand in operands):
+            return TreeConstant(node.compute(context))
+        return node
+
+class TreeChain(TreeNode):
+    """ Sequence of left associative binary and postfix unary operations
+    """
+
+    first: TreeNode
+    chain: list     # pairs of an operator and its right operand (None for unary operators)
+
+    def __init__(self, first:TreeNode, chain:list):
+        self.first = first
+        self.chain = chain
+        self.key = ('chain', first.key) + tuple(
+            (type(operator), None if operand is None else operand.key) for operator, operand in chain
+        )
+
+    def __str__(self):
+        return "(" + str(self.first) + "".join(
+            operator.symbol + ("" if operand is None else str(operand)) for operator, operand in self.chain
+        ) + ")"
+
+    def nodes(self):
+        yield self
+        yield from self.first.nodes()
+        for operator, operand in self.chain:
+            if operand is not None:
+                yield from operand.nodes()
+
+    def compute(self, context:TreeContext):
+        value = self.first.evaluate(context)
+        for operator, operand in self.chain:
+            if operand is None:
+                value = context.apply(operator.operate_unary, value, None)
+            elif hasattr(operator, 'operate_short') and (result:=context.decide(operator, value)) is not None:
+                # right operand is not evaluated
+                value = result
+            else:
+                value = context.apply(operator.operate_binary, value, operand.evaluate(context))
+        return value
+
+    def fold(self, context:TreeContext, variables:set):
+        first = self.first.fold(context, variables)
+        chain = [
+            (operator, None if operand is None else operand.fold(context, variables))
+            for operator, operand in self.chain
+        ]
+        # fold leading constant operations, and operations decided by a constant left operand
+        start = 0
+        while start<len(chain) and isinstance(first, TreeConstant):
+            operator, operand = chain[start]
+            if operand is None or isinstance(operand, TreeConstant):
+                first = TreeConstant(TreeChain(first, chain[start:start+1]).compute(context))
+            elif hasattr(operator, 'operate_short') and (result:=context.decide(operator, first.compute(context))) is not None:
+                first = TreeConstant(result)
+            else:
+                break
+            start += 1
+        return TreeChain(first, chain[start:]) if start<len(chain) else first
+
+def mark_shared(tree:TreeNode):
+    """ Mark sub-expressions that occur multiple times in an expression tree
+
+    :param tree: Expression tree
+    """
+    counts = {}
+    for node in tree.nodes():
+        counts[node.key] = counts.get(node.key, 0) + 1
+    for node in tree.nodes():
+        node.shared = counts[node.key]>1
+    return tree
+
+class Precedence:
+    """ Single pass parsing of tokens into an expression tree using precedence climbing
+
+    Binding powers of operators are derived from the order of operation steps,
+    where operators in earlier steps bind stronger. Binary operators are left associative.
+    Unary operators are applied as prefix operators if they follow another operator,
+    and as postfix operators if they follow an atom and cannot be applied as binary operators.
+    Operators are applied on their operands using the same methods as in operation steps.
+
+    :param operators: Dictionary of operator classes
+    :param steps: List of operation steps
+    """
+
+    args: dict      # powers of operators with arguments
+    unary: dict     # powers of unary operators
+    binary: dict    # powers of binary operators
+
+    def __init__(self, operators:dict, steps:list):
+        self.args = {}
+        self.unary = {}
+        self.binary = {}
+        tables = {Otype.ARGS: self.args, Otype.UNARY: self.unary, Otype.BINARY: self.binary}
+        for s, ostep in enumerate(steps):
+            if ostep['otype'] not in tables:
+                continue
+            for name in ostep['operators']:
+                if name in operators:
+                    tables[ostep['otype']].setdefault(operators[name], len(steps)-s)
+
+    def parse(self, stream:list):
+        """ Parse tokens into an expression tree
+
+        :param stream: List of tree nodes and operators, where operator arguments are compiled programs
+        """
+        stream = list(stream)
+        scratch = Tokens(TreeNode)
+        pos = 0
+
+        def unprocessed(left):
+            return Exception("Cannot solve expression due to unprocessed tokens:", left, stream[pos:])
+
+        def operand(power):
+            nonlocal pos
+            if pos>=len(stream):
+                raise unprocessed([])
+            token = stream[pos]
+            pos += 1
+            if not isinstance(token, OperatorBase):
+                return token
+            elif type(token) in self.args:
+                return TreeOperator(token, Otype.ARGS, [arg.parse() for arg in token.args])
+            elif type(token) in self.unary:
+                # fold following unary operators from the same step, e.g. '- -' into '+'
+                if pos<len(stream) and self.unary.get(type(stream[pos]))==self.unary[type(token)]:
+                    scratch.left, scratch.right = [], [stream[pos]]
+                    token.operate_unary(scratch)
+                    if all(item is None for item in scratch.left) and len(scratch.right)==1 and type(scratch.right[0]) in self.unary:
+                        stream[pos] = scratch.right[0]
+                        return operand(power)
+                # operands of stronger operators cannot start with weaker unary operators, e.g. '- ! 1'
+                if self.unary[type(token)]<=power:
+                    pos -= 1
+                    raise unprocessed([])
+                return TreeOperator(token, Otype.UNARY, [expression(self.unary[type(token)])])
+            pos -= 1
+            raise unprocessed([])
+
+        def expression(power):
+            nonlocal pos
+            left = operand(power)
+            chain = []
+            while pos<len(stream):
+                token = stream[pos]
+                if type(token) in self.binary:
+                    if self.binary[type(token)]<=power:
+                        break
+                    # fold following unary operators from the same step, e.g. '+ -' into '-'
+                    if type(token) in self.unary and pos+1<len(stream) and self.unary.get(type(stream[pos+1]))==self.unary[type(token)]:
+                        scratch.left, scratch.right = [left], [stream[pos+1]]
+                        token.operate_unary(scratch)
+                        if len(scratch.left)==1 and len(scratch.right)==1 and type(scratch.right[0]) in self.binary:
+                            pos += 1
+                            stream[pos] = scratch.right[0]
+                            continue
+                    pos += 1
+                    chain.append((token, expression(self.binary[type(token)])))
+                elif type(token) in self.unary and self.unary[type(token)]>power:
+                    pos += 1
+                    chain.append((token, None))
+                else:
+                    break
+            return TreeChain(left, chain) if chain else left
+
+        if not stream:
+            return TreeConstant(None)
+        tree = expression(0)
+        if pos<len(stream):
+            raise unprocessed([tree])
+        return tree
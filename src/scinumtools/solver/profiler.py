@@ -0,0 +1,88 @@
+import time
+
+from ..row_collector import RowCollector
+from ..stopwatch import Stopwatch
+
+PROFILER = None   # currently active solver profiler
+
+class SolverProfiler:
+    """ Counters of tokenization, operator and atom calls in expression solvers
+
+    Calls are recorded in all solvers, including nested solvers, only while the profiler is active.
+    Cumulative times of atoms include times of solvers that are nested within the atoms.
+
+    .. code-block::
+
+        with SolverProfiler() as sp:
+            Quantity(3, 'kg*m2/s2')
+        print(sp.report())
+
+    :param stopwatch: Stopwatch that additionally records all calls as its nodes
+    """
+
+    counters: dict        # number of calls and cumulative time of every counter
+    stopwatch: Stopwatch
+    _previous: object     # profiler that was active before this one
+
+    def __enter__(self):
+        global PROFILER
+        self._previous = PROFILER
+        PROFILER = self
+        return self
+
+    def __exit__(self, type, value, tb):
+        global PROFILER
+        PROFILER = self._previous
+
+    def __init__(self, stopwatch:Stopwatch=None):
+        self.counters = {}
+        self.stopwatch = stopwatch
+        self._previous = None
+
+    def call(self, name:str, function, *args):
+        """ Call a function and record its time
+
+        :param name: Name of a counter
+        :param function: Called function
+        """
+        if self.stopwatch:
+            self.stopwatch.start(name)
+        start = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            counter = self.counters.setdefault(name, [0, 0.])
+            counter[0] += 1
+            counter[1] += time.perf_counter()-start
+            if self.stopwatch:
+                self.stopwatch.stop(name)
+
+    def operate(self, method, tokens):
+        """ Call an operator method on tokens and record its time
+
+        :param method: Bound method of an operator, e.g. operate_binary
+        :param tokens: Tokens of a solver
+        """
+        return self.call(f"{type(method.__self__).__name__}.{method.__name__}", method, tokens)
+
+    def atom(self, atom):
+        """ Wrap an atom class or function so that its calls are recorded
+
+        :param atom: Atom class or function parsing atom strings
+        """
+        if getattr(atom, 'profiler', None) is self:
+            return atom
+        name = getattr(atom, '__qualname__', type(atom).__name__).split('<locals>.')[-1] + "()"
+        def wrapper(value):
+            return self.call(name, atom, value)
+        wrapper.profiler = self
+        return wrapper
+
+    def report(self):
+        """ Return a table of all counters sorted by their cumulative time
+        """
+        rc = RowCollector(['Calls','Time','Time/Call','Name'])
+        for name, (calls, elapsed) in self.counters.items():
+            rc.append([calls, elapsed, elapsed/calls, name])
+        rc.sort('Time')
+        return rc
@@ -0,0 +1,114 @@
+import copy
+
+from .tokens import Tokens
+from . import profiler
+from .precedence import Precedence, TreeContext, TreeAtom, mark_shared
+
+class ExpressionProgram:
+    """ Tokenized expression that can be evaluated repeatedly
+
+    Atoms are stored as strings and are parsed only during evaluation,
+    arguments of parenthesis operators are stored as nested programs.
+    Sub-expressions that occur multiple times are evaluated only once per evaluation.
+
+    :param operators: Dictionary of operator classes
+    :param steps: List of operation steps
+    """
+
+    operators: dict
+    steps: list
+    tokens: list
+    precedence: Precedence
+    tree: object   # expression tree used by the precedence engine
+
+    def __init__(self, operators:dict, steps:list):
+        self.operators = operators
+        self.steps = steps
+        self.tokens = []
+        self.precedence = None
+        self.tree = None
+
+    def __repr__(self):
+        return f"Program({self.tokens})"
+
+    def __str__(self):
+        if self.tree is None:
+            self.tree = mark_shared(self.parse())
+        return str(self.tree)
+
+    def parse(self):
+        """ Parse tokens into a new expression tree
+        """
+        if self.precedence is None:
+            self.precedence = Precedence(self.operators, self.steps)
+        return self.precedence.parse([
+            TreeAtom(token) if isinstance(token, str) else token for token in self.tokens
+        ])
+
+    def optimize(self, atom, variables:list=None):
+        """ Return a new program with folded constant sub-expressions
+
+        All atoms, except of the variables, are considered to be constant and are parsed only once.
+
+        :param atom: Atom class or function parsing atom strings
+        :param variables: Atom strings that change between evaluations
+        """
+        parser = profiler.PROFILER.atom(atom) if profiler.PROFILER else None
+        program = copy.copy(self)
+        program.tree = mark_shared(self.parse().fold(TreeContext(atom, parser=parser), set(variables or [])))
+        return program
+
+    def bind(self, tokens:Tokens, variables:dict=None, engine:str='precedence', parser=None):
+        """ Parse atoms, evaluate operator arguments and append them to tokens
+
+        :param tokens: Tokens of a solver
+        :param variables: Values used instead of atom strings
+        :param engine: Evaluation engine of operator arguments
+        :param parser: Function parsing atom strings, atom of the tokens is used by default
+        """
+        parser = parser or tokens.atom
+        for token in self.tokens:
+            if isinstance(token, str):
+                if variables and token in variables:
+                    tokens.append(parser(variables[token]))
+                else:
+                    tokens.append(parser(token))
+            else:
+                op = copy.copy(token)
+                if op.args:
+                    op.args = [arg.evaluate(tokens.atom, variables, engine, parser) for arg in op.args]
+                tokens.append(op)
+
+    def evaluate(self, atom, variables:dict=None, engine:str='precedence', parser=None):
+        """ Evaluate the program
+
+        :param atom: Atom class or function parsing atom strings
+        :param variables: Values used instead of atom strings
+        :param engine: Evaluation engine: 'precedence' evaluates tokens in a single pass, 'steps' performs each operation step separately
+        :param parser: Function parsing atom strings and variables, atom is used by default
+        """
+        if profiler.PROFILER and parser is None:
+            parser = profiler.PROFILER.atom(atom)
+        if engine=='precedence':
+            if self.tree is None:
+                self.tree = mark_shared(self.parse())
+            return self.tree.evaluate(TreeContext(atom, variables, parser))
+        elif engine=='steps':
+            tokens = Tokens(atom)
+            self.bind(tokens, variables, engine, parser)
+            return self.operate(tokens)
+        else:
+            raise Exception("Unknown evaluation engine:", engine)
+
+    def operate(self, tokens:Tokens):
+        """ Perform operation steps on tokens and return the final atom
+
+        :param tokens: Tokens with parsed atoms and operators
+        """
+        for ostep in self.steps:
+            operators = tuple([self.operators[o] for o in ostep['operators'] if o in self.operators.keys()])
+            if operators:
+                tokens.operate(operators, ostep['otype'])
+        if len(tokens.left)>0 or len(tokens.right)>1:
+            raise Exception("Cannot solve expression due to unprocessed tokens:", tokens.left, tokens.right)
+        return tokens.get_right()
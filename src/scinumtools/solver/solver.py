@@ -1,14 +1,44 @@
+import re
+import copy
+from concurrent.futures import ProcessPoolExecutor
 from typing import Union
 
 from .operators import *
 from .expression import Expression
 from .tokens import Tokens
+from .program import ExpressionProgram
+from . import profiler
+
+SCANNERS = {}
+PROGRAMS = {}
+PROGRAMS_SIZE = 1024  # maximum number of cached programs
+
+def get_scanner(operators:dict):
+    """ Return a pattern matching operator symbols and a map of symbols to operators
+
+    Symbols are matched in the same order as operators are listed in the operator table.
+    """
+    key = tuple((operator, operator.symbol) for operator in operators.values())
+    if key not in SCANNERS:
+        symbols = {}
+        for operator in operators.values():
+            symbols.setdefault(operator.symbol, operator)
+        pattern = re.compile("|".join(re.escape(symbol) for symbol in symbols))
+        SCANNERS[key] = (pattern, symbols)
+    return SCANNERS[key]
+
+def solve_chunk(atom, operators:dict, steps:list, engine:str, expressions:list, variables:dict):
+    """ Solve a chunk of expressions in a worker process
+    """
+    with ExpressionSolver(atom, operators, steps, engine) as es:
+        return es.solve_many(expressions, variables)
 
 class ExpressionSolver:
 
     tokens: list
     operators: dict
-    expr: Expression
+    steps: list
+    engine: str = 'precedence'   # evaluation engine: 'precedence' or 'steps'
     
     def __enter__(self):
         return self
@@ -16,8 +46,10 @@ class ExpressionSolver:
     def __exit__(self, type, value, tb):
         pass
     
-    def __init__(self, atom, operators:dict = None, steps:list = None):
+    def __init__(self, atom, operators:dict = None, steps:list = None, engine:str = None):
         self.tokens = Tokens(atom)
+        if engine:
+            self.engine = engine
         self.operators = operators if operators else {
             'log':OperatorLog, 'log10':OperatorLog10, 'logb':OperatorLogb,
             'exp':OperatorExp, 'sqrt':OperatorSqrt,   'powb':OperatorPowb,
@@ -44,42 +76,106 @@ class ExpressionSolver:
             dict(operators=['or'],             otype=Otype.BINARY),
         ]
 
-    def solve(self, expr:Union[str,Expression]):
-        self.expr = Expression(expr) if isinstance(expr, str) else expr
-        
-        # Tokenize expression
-        while self.expr.right:
-            for operator in self.operators.values():
-                if self.expr.right.startswith(operator.symbol):
-                    # Create atom from the left side and append it to tokens
-                    if left:=self.expr.pop_left():
-                        self.tokens.append(self.tokens.atom(left))
-                    # Initialize an operator
-                    op = operator(self.expr)
-                    if op.args:
-                        #print(op.args, steps)
-                        # Solve operator arguments
-                        with ExpressionSolver(self.tokens.atom, self.operators, self.steps) as es:
-                            for a in range(len(op.args)):
-                                op.args[a] = es.solve(op.args[a])
-                    # Append operator to tokens
-                    self.tokens.append(op)
-                    break
-            else:
-                self.expr.shift()
-        # Create atom from the remaining left side
-        if left:=self.expr.pop_left():
-            self.tokens.append(self.tokens.atom(left))
-
-        # Perform operation steps
-        for o,ostep in enumerate(list(self.steps)):
-            operators = tuple([self.operators[o] for o in ostep['operators'] if o in self.operators.keys()])
-            if operators:
-                self.tokens.operate(operators, ostep['otype'])
-
-        # Return the final atom
-        if len(self.tokens.left)>0 or len(self.tokens.right)>1:
-            raise Exception("Cannot solve expression due to unprocessed tokens:", self.tokens.left, self.tokens.right)
-        atom = self.tokens.get_right()
-        #print(self.expr.expr, atom)
-        return atom
+    def compile(self, expr:Union[str,Expression]):
+        """ Tokenize expression into a program that can be evaluated repeatedly
+
+        Compiled programs are cached for every combination of an expression, operators and steps.
+
+        :param expr: Expression string
+        """
+        expr = Expression(expr) if isinstance(expr, str) else expr
+        key = (
+            expr.right,
+            tuple(self.operators.items()),
+            tuple((tuple(ostep['operators']), ostep['otype']) for ostep in self.steps),
+        )
+        if key in PROGRAMS:
+            return PROGRAMS[key]
+        if profiler.PROFILER:
+            program = profiler.PROFILER.call('tokenize', self.scan, expr)
+        else:
+            program = self.scan(expr)
+        if len(PROGRAMS)>=PROGRAMS_SIZE:
+            del PROGRAMS[next(iter(PROGRAMS))]
+        PROGRAMS[key] = program
+        return program
+
+    def scan(self, expr:Expression):
+        """ Scan expression for atoms and operators and return a new program
+
+        :param expr: Expression
+        """
+        program = ExpressionProgram(self.operators, self.steps)
+        pattern, symbols = get_scanner(self.operators)
+        while match:=pattern.search(expr.expr, expr.pos):
+            # Move to the next operator symbol
+            expr.shift(match.start()-expr.pos)
+            # Add atom string from the left side
+            if left:=expr.pop_left():
+                program.tokens.append(left)
+            # Initialize an operator
+            op = symbols[match.group()](expr)
+            if op.args:
+                # Compile operator arguments
+                op.args = [self.compile(arg) for arg in op.args]
+            program.tokens.append(op)
+        expr.shift(len(expr.expr)-expr.pos)
+        # Add atom string from the remaining left side
+        if left:=expr.pop_left():
+            program.tokens.append(left)
+        return program
+
+    def tokenize(self, expr:Union[str,Expression]):
+        """ Split expression into atoms and operators and append them to tokens
+
+        :param expr: Expression string
+        """
+        self.compile(expr).bind(self.tokens, engine=self.engine)
+
+    def solve(self, expr:Union[str,Expression], variables:dict=None):
+        """ Solve expression and return the final atom
+
+        :param expr: Expression string
+        :param variables: Values used instead of atom strings
+        """
+        return self.compile(expr).evaluate(self.tokens.atom, variables, self.engine)
+
+    def solve_many(self, expressions:list, variables:dict=None, workers:int=None):
+        """ Solve multiple expressions and return a list of final atoms in the input order
+
+        Identical expressions are solved only once and every atom string is parsed only once per batch.
+        Exceptions raised by individual expressions are returned in place of their results.
+
+        :param expressions: List of expression strings
+        :param variables: Values used instead of atom strings
+        :param workers: Number of worker processes; atom class and operators have to be picklable
+        """
+        unique = list(dict.fromkeys(expressions))
+        if workers and workers>1 and len(unique)>1:
+            size = -(-len(unique)//(4*workers))
+            chunks = [unique[i:i+size] for i in range(0, len(unique), size)]
+            with ProcessPoolExecutor(workers) as executor:
+                futures = [
+                    executor.submit(solve_chunk, self.tokens.atom, self.operators, self.steps, self.engine, chunk, variables)
+                    for chunk in chunks
+                ]
+                values = [value for future in futures for value in future.result()]
+            results = dict(zip(unique, values))
+        else:
+            atoms = {}
+            parser = self.tokens.atom
+            if profiler.PROFILER:
+                parser = profiler.PROFILER.atom(parser)
+            def cached_atom(value):
+                if not isinstance(value, str):
+                    return parser(value)
+                if value not in atoms:
+                    atoms[value] = parser(value)
+                return copy.copy(atoms[value])
+            results = {}
+            for expr in unique:
+                try:
+                    results[expr] = self.compile(expr).evaluate(self.tokens.atom, variables, self.engine, cached_atom)
+                except Exception as e:
+                    results[expr] = e
+        return [copy.copy(results[expr]) for expr in expressions]
@@ -1,5 +1,6 @@
 from .atom import AtomBase
 from .operators import Otype
+from . import profiler
 
 class Tokens:
     
@@ -32,12 +33,17 @@ class Tokens:
         while self.right:
             token = self.right.pop(0)
             if isinstance(token, operators) and otype==Otype.UNARY:
-                token.operate_unary(self)
+                method = token.operate_unary
             elif isinstance(token, operators) and otype==Otype.BINARY:
-                token.operate_binary(self)
+                method = token.operate_binary
             elif isinstance(token, operators) and otype==Otype.ARGS:
-                token.operate_args(self)
+                method = token.operate_args
             else:
                 self.put_left(token)
+                continue
+            if profiler.PROFILER:
+                profiler.PROFILER.operate(method, self)
+            else:
+                method(self)
         self.right = self.left
         self.left = []
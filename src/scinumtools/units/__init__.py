@@ -7,9 +7,11 @@ from .constant import Constant as const
 from .nan import NaN
 from .nan import NaN as nan
 from .magnitude import Magnitude
+from .double_double import DoubleDouble
 from .dimensions import Dimensions
 from .fraction import Fraction
 from .base_units import BaseUnits
 from .unit_solver import UnitSolver
 from .unit_environment import UnitEnvironment
 from .systems import SI, CGS, AU
+from .execution import ParallelExecution
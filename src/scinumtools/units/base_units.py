@@ -9,6 +9,7 @@ from .unit_solver import UnitSolver
 
 @dataclass
 class Base:
+    __slots__ = ('magnitude','dimensions','units','expression')
     
     magnitude: float
     dimensions: Dimensions
@@ -39,6 +40,7 @@ def get_unit_base(unitid: str, exp: Fraction = None):
     return Base(magnitude, dimensions, base, expression)
 
 class BaseUnits:
+    __slots__ = ('baseunits','_magnitude','_dimensions','_units','_expression')
 
     baseunits: dict
     magnitude: float
@@ -49,6 +51,10 @@ class BaseUnits:
     nobase: bool
 
     def __init__(self, baseunits: Union[str,list,dict,Dimensions]=None):
+        self._magnitude = None
+        self._dimensions = None
+        self._units = None
+        self._expression = None
         if baseunits is None:
             self.baseunits = {}
         elif isinstance(baseunits, dict):
@@ -59,31 +65,83 @@ class BaseUnits:
             self.baseunits = Dimensions.from_list(baseunits).value(dtype=dict)
         elif isinstance(baseunits, BaseUnits):
             self.baseunits = baseunits.baseunits
+            self._magnitude = baseunits._magnitude
+            self._dimensions = baseunits._dimensions
+            self._units = baseunits._units
+            self._expression = baseunits._expression
         elif isinstance(baseunits, str):
             self.baseunits = UnitSolver(baseunits).baseunits
         else:
             raise Exception("Cannot initialize BaseUnits with given argument:", baseunits)
-        # calculate total base
-        self.magnitude = 1
-        self.dimensions = Dimensions()
-        self.units = []
-        self.expression = []
-        self.nobase = True
+        # normalize unit exponents
         for unitid in list(self.baseunits.keys()):
             if not isinstance(self.baseunits[unitid], Fraction):
                 frac = self.baseunits[unitid]
                 self.baseunits[unitid] = Fraction.from_tuple(frac) if isinstance(frac, tuple) else Fraction(frac)
             if self.baseunits[unitid].num==0:
                 del self.baseunits[unitid]
-                continue
-            self.nobase = False
-            ubase = get_unit_base(unitid, self.baseunits[unitid])
-            self.magnitude *= ubase.magnitude
-            self.dimensions += ubase.dimensions
-            self.units.append(ubase.units)
-            self.expression.append(ubase.expression)
-        self.expression = SYMBOL_MULTIPLY.join(self.expression) if self.expression else None
-        self.nodim = self.dimensions.nodim
+        # units of unit environments are not available after the environment is closed
+        if ENVIRONMENT_UNITS and self._units is None:
+            for unitid in self.baseunits.keys():
+                if unitid.split(SYMBOL_UNITID)[-1] in ENVIRONMENT_UNITS:
+                    self._evaluate()
+                    break
+
+    def _evaluate(self):
+        """ Calculate total base of all units
+        """
+        magnitude = 1
+        dimensions = Dimensions()
+        units = []
+        expression = []
+        for unitid, exp in self.baseunits.items():
+            ubase = get_unit_base(unitid, exp)
+            magnitude *= ubase.magnitude
+            dimensions += ubase.dimensions
+            units.append(ubase.units)
+            expression.append(ubase.expression)
+        if self._magnitude is None:
+            self._magnitude = magnitude
+        if self._dimensions is None:
+            self._dimensions = dimensions
+        self._units = units
+        self._expression = SYMBOL_MULTIPLY.join(expression) if expression else None
+
+    @property
+    def magnitude(self):
+        if self._magnitude is None:
+            self._evaluate()
+        return self._magnitude
+
+    @magnitude.setter
+    def magnitude(self, value):
+        self._magnitude = value
+
+    @property
+    def dimensions(self):
+        if self._dimensions is None:
+            self._evaluate()
+        return self._dimensions
+
+    @property
+    def units(self):
+        if self._units is None:
+            self._evaluate()
+        return self._units
+
+    @property
+    def expression(self):
+        if self._units is None:
+            self._evaluate()
+        return self._expression
+
+    @property
+    def nodim(self):
+        return self.dimensions.nodim
+
+    @property
+    def nobase(self):
+        return not self.baseunits
 
     def __str__(self):
         baseunits = []
@@ -107,25 +165,41 @@ class BaseUnits:
         baseunits = dict(self.baseunits)
         for unit,exp in other.baseunits.items():
             baseunits[unit] = baseunits[unit]+exp if unit in baseunits else exp
-        return BaseUnits(baseunits)
+        baseunits = BaseUnits(baseunits)
+        if self._dimensions is not None and other._dimensions is not None:
+            baseunits._dimensions = self._dimensions + other._dimensions
+            if isinstance(self._magnitude, (int,float)) and isinstance(other._magnitude, (int,float)):
+                baseunits._magnitude = self._magnitude * other._magnitude
+        return baseunits
     
     def __sub__(self, other):
         baseunits = dict(self.baseunits)
         for unit,exp in other.baseunits.items():
             baseunits[unit] = baseunits[unit]-exp if unit in baseunits else -exp
-        return BaseUnits(baseunits)
+        baseunits = BaseUnits(baseunits)
+        if self._dimensions is not None and other._dimensions is not None:
+            baseunits._dimensions = self._dimensions - other._dimensions
+            if isinstance(self._magnitude, (int,float)) and isinstance(other._magnitude, (int,float)):
+                baseunits._magnitude = self._magnitude / other._magnitude
+        return baseunits
 
     def __mul__(self, other):
         baseunits = dict(self.baseunits)
         for unit,exp in self.baseunits.items():
             baseunits[unit] *= other
-        return BaseUnits(baseunits)
+        baseunits = BaseUnits(baseunits)
+        if self._dimensions is not None:
+            baseunits._dimensions = self._dimensions * other
+        return baseunits
 
     def __truediv__(self, div):
         baseunits = dict(self.baseunits)
         for unit,exp in self.baseunits.items():
             baseunits[unit] /= div
-        return BaseUnits(baseunits)
+        baseunits = BaseUnits(baseunits)
+        if self._dimensions is not None:
+            baseunits._dimensions = self._dimensions / div
+        return baseunits
     
     def __eq__(self, other):
         if len(self.baseunits) != len(other.baseunits):
@@ -1,6 +1,6 @@
 
 from .settings import *
-from .quantity import Quantity
+from .quantity import frozen_quantity
 
 class Constant:
 
@@ -12,12 +12,12 @@ class Constant:
     
     def __new__(cls, unit=None):
         if unit:
-            return Quantity(1,f"[{str(unit)}]")
+            return frozen_quantity(f"[{str(unit)}]")
         else:
             return object.__new__(cls)
     
     def __getattr__(self, unit):
-        return Quantity(1,f"[{str(unit)}]")
+        return frozen_quantity(f"[{str(unit)}]")
 
     def __str__(self):
         return Constant._list()
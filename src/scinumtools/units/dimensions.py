@@ -94,6 +94,16 @@ class Dimensions:
             dimensions[name] = getattr(self, name) * -1
         return Dimensions(**dimensions)
 
+    def signature(self):
+        """ Return a hashable tuple of reduced dimension fractions
+        """
+        signature = []
+        for name in DIMENSION_LIST:
+            fraction = Fraction.from_fraction(getattr(self, name))
+            fraction.rebase()
+            signature.append((fraction.num, fraction.den))
+        return tuple(signature)
+
     def value(self, dtype=list):
         if dtype==list:
             dimensions = []
@@ -0,0 +1,155 @@
+import numpy as np
+from decimal import Decimal
+from typing import Union
+
+SPLITTER = 134217729.0   # 2**27+1, splits a float64 into two non-overlapping halves
+
+def _two_sum(a, b):
+    s = a + b
+    bb = s - a
+    return s, (a - (s - bb)) + (b - bb)
+
+def _quick_two_sum(a, b):
+    s = a + b
+    return s, b - (s - a)
+
+def _split(a):
+    t = SPLITTER * a
+    hi = t - (t - a)
+    return hi, a - hi
+
+def _two_prod(a, b):
+    p = a * b
+    ahi, alo = _split(a)
+    bhi, blo = _split(b)
+    return p, ((ahi*bhi - p) + ahi*blo + alo*bhi) + alo*blo
+
+class DoubleDouble:
+    """ Extended precision numbers represented by pairs of float64 values
+
+    Values are stored as unevaluated sums ``hi + lo`` of two scalars or arrays,
+    giving approximately 32 significant digits with vectorized NumPy arithmetic.
+    """
+    __slots__ = ('hi','lo')
+
+    hi: np.ndarray
+    lo: np.ndarray
+
+    def __init__(self, hi: Union[int,float,list,np.ndarray], lo: Union[int,float,list,np.ndarray] = None):
+        self.hi = np.asarray(hi, dtype=float)
+        self.lo = np.zeros_like(self.hi) if lo is None else np.asarray(lo, dtype=float)
+
+    @staticmethod
+    def from_value(value):
+        """ Convert floats, arrays, strings and Decimals to double-double numbers
+        """
+        if isinstance(value, DoubleDouble):
+            return value
+        elif isinstance(value, (str, Decimal)):
+            return DoubleDouble.from_decimal(value)
+        elif isinstance(value, (list, tuple, np.ndarray)) and np.asarray(value).dtype.kind in ('O','U','S'):
+            return DoubleDouble.from_decimal(value)
+        else:
+            return DoubleDouble(value)
+
+    @staticmethod
+    def from_decimal(value: Union[str,Decimal,list,np.ndarray]):
+        """ Convert Decimal numbers (or their strings) to double-double numbers
+        """
+        values = np.asarray(value, dtype=object)
+        hi = np.empty(values.shape, dtype=float)
+        lo = np.empty(values.shape, dtype=float)
+        for index, item in np.ndenumerate(values):
+            item = Decimal(item)
+            hi[index] = float(item)
+            lo[index] = float(item - Decimal(hi[index]))
+        return DoubleDouble(hi, lo)
+
+    def to_decimal(self):
+        """ Return value as a Decimal number, or an object array of Decimal numbers
+        """
+        if self.hi.ndim==0:
+            return Decimal(float(self.hi)) + Decimal(float(self.lo))
+        values = np.empty(self.hi.shape, dtype=object)
+        for index, hi in np.ndenumerate(self.hi):
+            values[index] = Decimal(float(hi)) + Decimal(float(self.lo[index]))
+        return values
+
+    def to_float(self):
+        """ Return value rounded to float precision
+        """
+        value = self.hi + self.lo
+        return float(value) if value.ndim==0 else value
+
+    def __array__(self, dtype=None, copy=None):
+        value = self.hi + self.lo
+        return value if dtype is None else value.astype(dtype)
+
+    def __repr__(self):
+        return f"DoubleDouble({self.to_float()})"
+
+    def __format__(self, spec):
+        return format(self.to_float(), spec)
+
+    def __len__(self):
+        return len(self.hi)
+
+    @property
+    def shape(self):
+        return self.hi.shape
+
+    def __getitem__(self, key):
+        return DoubleDouble(self.hi[key], self.lo[key])
+
+    def __neg__(self):
+        return DoubleDouble(-self.hi, -self.lo)
+
+    def __add__(self, other):
+        other = DoubleDouble.from_value(other)
+        s, e = _two_sum(self.hi, other.hi)
+        t, f = _two_sum(self.lo, other.lo)
+        s, e = _quick_two_sum(s, e + t)
+        return DoubleDouble(*_quick_two_sum(s, e + f))
+
+    def __radd__(self, other):
+        return self + other
+
+    def __sub__(self, other):
+        return self + (-DoubleDouble.from_value(other))
+
+    def __rsub__(self, other):
+        return DoubleDouble.from_value(other) + (-self)
+
+    def __mul__(self, other):
+        other = DoubleDouble.from_value(other)
+        p, e = _two_prod(self.hi, other.hi)
+        e += self.hi*other.lo + self.lo*other.hi
+        return DoubleDouble(*_quick_two_sum(p, e))
+
+    def __rmul__(self, other):
+        return self * other
+
+    def __truediv__(self, other):
+        other = DoubleDouble.from_value(other)
+        q1 = self.hi / other.hi
+        r = self - other * q1
+        q2 = r.hi / other.hi
+        r = r - other * q2
+        q3 = r.hi / other.hi
+        return DoubleDouble(*_quick_two_sum(q1, q2)) + q3
+
+    def __rtruediv__(self, other):
+        return DoubleDouble.from_value(other) / self
+
+    def __pow__(self, power: Union[int,float]):
+        if float(power).is_integer():
+            exponent = abs(int(power))
+            result, base = DoubleDouble(np.ones_like(self.hi)), self
+            while exponent:
+                if exponent & 1:
+                    result = result * base
+                base = base * base
+                exponent >>= 1
+            return 1/result if power<0 else result
+        else:
+            return DoubleDouble(np.power(self.hi + self.lo, power))
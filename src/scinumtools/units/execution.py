@@ -0,0 +1,64 @@
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+EXECUTION = {
+    'workers':    1,        # number of threads; 1 disables parallel execution
+    'chunk_size': 131072,   # number of array elements processed by one thread at once
+}
+
+class ParallelExecution:
+    """ Set global parallel execution of array conversions and arithmetics
+
+    Settings are kept until the environment is closed.
+
+    :param int workers: Number of threads
+    :param int chunk_size: Number of array elements in one chunk
+    """
+
+    settings: dict
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, tb):
+        self.close()
+
+    def __init__(self, workers: int = None, chunk_size: int = None):
+        self.settings = dict(EXECUTION)
+        if workers is not None:
+            EXECUTION['workers'] = workers
+        if chunk_size is not None:
+            EXECUTION['chunk_size'] = chunk_size
+
+    def close(self):
+        EXECUTION.update(self.settings)
+
+def parallel(func, *args, workers: int = None, chunk_size: int = None):
+    """ Apply an element-wise function on large arrays in chunks using a thread pool
+
+    Chunks are processed only if all array arguments have the same shape,
+    otherwise the function is called directly.
+    """
+    workers = EXECUTION['workers'] if workers is None else workers
+    chunk_size = EXECUTION['chunk_size'] if chunk_size is None else chunk_size
+    if workers<=1:
+        return func(*args)
+    arrays = [arg for arg in args if isinstance(arg, np.ndarray)]
+    if not arrays or arrays[0].size<2*chunk_size:
+        return func(*args)
+    shape = arrays[0].shape
+    for array in arrays:
+        if type(array) is not np.ndarray or array.shape!=shape:
+            return func(*args)
+    args = [arg.reshape(-1) if isinstance(arg, np.ndarray) else arg for arg in args]
+    size = arrays[0].size
+    def chunk(start):
+        return func(*[arg[start:start+chunk_size] if isinstance(arg, np.ndarray) else arg for arg in args])
+    first = np.asarray(chunk(0))
+    output = np.empty(size, dtype=first.dtype)
+    output[:chunk_size] = first
+    def process(start):
+        output[start:start+chunk_size] = chunk(start)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(process, range(chunk_size, size, chunk_size)))
+    return output.reshape(shape)
@@ -1,20 +1,33 @@
+import operator
 import numpy as np
 from decimal import Decimal
 from typing import Union
 
+from .execution import parallel
+from .double_double import DoubleDouble
+
+try:
+    from scipy.sparse import issparse
+except ImportError:
+    def issparse(value):
+        return False
+
 class Magnitude:
-    value: Union[int,float,Decimal,np.ndarray]
-    error: Union[int,float,Decimal,np.ndarray] = None   # absolute error 
+    __slots__ = ('value','error')
+    
+    value: Union[int,float,Decimal,np.ndarray,DoubleDouble]
+    error: Union[int,float,Decimal,np.ndarray,DoubleDouble]   # absolute error 
 
     def __init__(self, value: float, abse: float = None, rele: float = None):
+        self.error = None
         # set value
         if isinstance(value, (float,int)):
             self.value = float(value)
-        elif isinstance(value, Decimal):
+        elif isinstance(value, (Decimal,DoubleDouble)):
             self.value = value
         elif isinstance(value, list):
             self.value = np.array(value, dtype=float)
-        elif isinstance(value, np.ndarray) or np.isscalar(value):
+        elif isinstance(value, np.ndarray) or np.isscalar(value) or issparse(value):
             self.value = value.astype(float)
         else:
             raise Exception("Magnitude value can be either a number or an list/array of numbers", value)
@@ -25,9 +38,13 @@ class Magnitude:
             self.error = abse
         elif abse is None and rele is not None:
             self.error = self._rel_to_abs(rele)
+        if self.error is not None and issparse(self.value):
+            raise Exception("Sparse magnitudes cannot have errors:", self.error)
         # set array of errors if value is an array
         if isinstance(self.value, np.ndarray) and self.error is not None:
             self.error = np.full_like(self.value, self.error)
+        elif isinstance(self.value, DoubleDouble) and self.value.shape and self.error is not None:
+            self.error = np.full_like(self.value.hi, self.error)
             
     def _rel_to_abs(self, rele):
         return self.value*rele/100
@@ -57,14 +74,22 @@ class Magnitude:
             return formatter(value,error)
     
     def _str(self):    
-        if self.error is None:
-            if isinstance(self.value, (list,np.ndarray)):
+        value, error = self.value, self.error
+        if isinstance(value, DoubleDouble):
+            value = value.to_float()
+        if isinstance(error, DoubleDouble):
+            error = error.to_float()
+        if error is None:
+            if isinstance(value, (list,np.ndarray)):
                 with np.printoptions(precision=3, suppress=False, threshold=5):
-                    return str(self.value)
+                    return str(value)
+            elif issparse(value):
+                shape = "x".join(str(size) for size in value.shape)
+                return f"<{shape} sparse, {value.nnz} stored>"
             else:
-                return f"{self.value:.03e}"
+                return f"{value:.03e}"
         else:          
-            return Magnitude.parse_string(self.value, self.error)
+            return Magnitude.parse_string(value, error)
     
     def __str__(self):
         return self._str()
@@ -73,10 +98,12 @@ class Magnitude:
         return self._str()
 
     def _add(self, left, right):
-        if isinstance(left.value, Decimal) or isinstance(right.value, Decimal):
+        if isinstance(left.value, DoubleDouble) or isinstance(right.value, DoubleDouble):
+            value = DoubleDouble.from_value(left.value) + right.value
+        elif isinstance(left.value, Decimal) or isinstance(right.value, Decimal):
             value = Decimal(left.value) + Decimal(right.value)
         else:
-            value = left.value + right.value
+            value = parallel(operator.add, left.value, right.value)
         if left.error is None and right.error is None:
             error = None
         elif left.error is None and right.error is not None:
@@ -98,10 +125,12 @@ class Magnitude:
         return self._add(other, self)
         
     def _sub(self, left, right):
-        if isinstance(left.value, Decimal) or isinstance(right.value, Decimal):
+        if isinstance(left.value, DoubleDouble) or isinstance(right.value, DoubleDouble):
+            value = DoubleDouble.from_value(left.value) - right.value
+        elif isinstance(left.value, Decimal) or isinstance(right.value, Decimal):
             value = Decimal(left.value) - Decimal(right.value)
         else:
-            value = left.value - right.value
+            value = parallel(operator.sub, left.value, right.value)
         if left.error is None and right.error is None:
             error = None
         elif left.error is None and right.error is not None:
@@ -123,10 +152,16 @@ class Magnitude:
         return self._sub(other, self)
         
     def _mul(self, left, right):
-        if isinstance(left.value, Decimal) or isinstance(right.value, Decimal):
+        if isinstance(left.value, DoubleDouble) or isinstance(right.value, DoubleDouble):
+            value = DoubleDouble.from_value(left.value) * right.value
+        elif isinstance(left.value, Decimal) or isinstance(right.value, Decimal):
             value = Decimal(left.value) * Decimal(right.value)
+        elif issparse(left.value):      # operator * is a matrix product for sparse matrices
+            value = left.value.multiply(right.value)
+        elif issparse(right.value):
+            value = right.value.multiply(left.value)
         else:
-            value = left.value * right.value
+            value = parallel(operator.mul, left.value, right.value)
         if left.error is None and right.error is None:
             error = None
         elif left.error is None and right.error is not None:
@@ -150,10 +185,12 @@ class Magnitude:
         return self._mul(other, self)
         
     def _truediv(self, left, right):
-        if isinstance(left.value, Decimal) or isinstance(right.value, Decimal):
+        if isinstance(left.value, DoubleDouble) or isinstance(right.value, DoubleDouble):
+            value = DoubleDouble.from_value(left.value) / right.value
+        elif isinstance(left.value, Decimal) or isinstance(right.value, Decimal):
             value = Decimal(left.value) / Decimal(right.value)
         else:
-            value = left.value / right.value
+            value = parallel(operator.truediv, left.value, right.value)
         if left.error is None and right.error is None:
             error = None
         elif left.error is None and right.error is not None:
@@ -179,7 +216,10 @@ class Magnitude:
         return self._truediv(other, self)
         
     def __pow__(self, power: Union[float,int]):
-        value = self.value**power
+        if issparse(self.value):        # operator ** is a matrix power for sparse matrices
+            value = self.value.power(power)
+        else:
+            value = parallel(operator.pow, self.value, power)
         if self.error is not None:
             error = self._rel_to_abs(self._abs_to_rel()*power)
         else:
@@ -192,6 +232,8 @@ class Magnitude:
     def abse(self, abse=None):
         if abse is None:
             return self.error
+        elif issparse(self.value):
+            raise Exception("Sparse magnitudes cannot have errors:", abse)
         else:
             self.error = abse
             return self
@@ -199,6 +241,8 @@ class Magnitude:
     def rele(self, rele=None):
         if rele is None:
             return self._abs_to_rel()
+        elif issparse(self.value):
+            raise Exception("Sparse magnitudes cannot have errors:", rele)
         else:
             self.error = self._rel_to_abs(rele)
             return self
@@ -1,31 +1,37 @@
+import re
+import pickle
 import numpy as np
 from decimal import Decimal
 from typing import Union
 
 from .settings import *
 from .unit_types import *
-from .magnitude import Magnitude
+from .magnitude import Magnitude, issparse
+from .double_double import DoubleDouble
 from .dimensions import Dimensions
 from .base_units import BaseUnits, get_unit_base
 from .fraction import Fraction
 from .unit_solver import UnitSolver
 
 HANDLED_FUNCTIONS = {}
+FROZEN_QUANTITIES = {}
+PATTERN_QUANTITY = re.compile(r"^\s*([-+]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][-+]?[0-9]+)?)\s*(\S*)\s*$")
 
 class Quantity:
+    __slots__ = ('magnitude','baseunits')
     
     magnitude: Magnitude      # magnitude
     baseunits: BaseUnits      # base units
 
     def __init__(
         self, 
-        magnitude: Union[int,float,Decimal,list,np.ndarray,Magnitude],
+        magnitude: Union[int,float,Decimal,list,np.ndarray,DoubleDouble,Magnitude],
         baseunits: Union[str,list,np.ndarray,Dimensions,dict,BaseUnits] = None,
         abse: Union[int,float] = None,
         rele: Union[int,float] = None
     ):
         # Set magnitude
-        if isinstance(magnitude, (int,float,Decimal,list,np.ndarray)) or np.isscalar(magnitude):
+        if isinstance(magnitude, (int,float,Decimal,list,np.ndarray,DoubleDouble)) or np.isscalar(magnitude) or issparse(magnitude):
             self.magnitude = Magnitude(magnitude, abse=abse, rele=rele)
         elif isinstance(magnitude, Magnitude):
             if abse is not None:
@@ -50,7 +56,7 @@ class Quantity:
         else:
             raise Exception("Insufficient quantity definition", magnitude, baseunits)
         # rebase if dimensions are zero
-        if self.baseunits.dimensions.nodim:
+        if self.baseunits.nodim:
             baseunits = {}
             for unitid, exp in self.baseunits.baseunits.items():
                 base = get_unit_base(unitid, exp)
@@ -61,6 +67,19 @@ class Quantity:
                     self.magnitude *= base.magnitude
             self.baseunits = BaseUnits(baseunits)
 
+    def __reduce_ex__(self, protocol):
+        value, error = self.magnitude.value, self.magnitude.error
+        units = tuple((unitid, exp.num, exp.den) for unitid, exp in self.baseunits.baseunits.items())
+        if type(value) is np.ndarray:
+            data = np.ascontiguousarray(value)
+            if protocol>=5:
+                buffer = pickle.PickleBuffer(data)
+            else:
+                buffer = data.tobytes()
+            return (_unpickle_quantity, (buffer, data.dtype.str, data.shape, units, error))
+        else:
+            return (_unpickle_quantity, (value, None, None, units, error))
+
     def _add(self, left, right):
         for utype in UNIT_TYPES:
             if c := utype(left.baseunits, right.baseunits):
@@ -147,7 +166,7 @@ class Quantity:
         if isinstance(other, (int, float)):
             other = Quantity(other)
         if np.all(other.magnitude.value!=0):
-            other.to(self.units())
+            other = other.to(self.units())
         if not np.allclose(self.magnitude.value, other.magnitude.value, rtol=MAGNITUDE_PRECISION):
             return False
         if not self.baseunits==other.baseunits:
@@ -218,33 +237,40 @@ class Quantity:
             raise NotImplementedError()
         return HANDLED_FUNCTIONS[func](*args, **kwargs)
     
-    def _convert(self, magnitude1, baseunits1, baseunits2):
+    def _convert(self, magnitude1, baseunits1, baseunits2, **kwargs):
         for utype in UNIT_TYPES:
             if c := utype(baseunits1, baseunits2):
-                return c.convert(magnitude1)
+                # custom unit types may not support execution settings
+                return c.convert(magnitude1, **{k:v for k,v in kwargs.items() if v is not None})
         else:
             raise Exception("Unsupported conversion between units:", baseunits1.expression, baseunits2.expression)
 
-    def value(self, expression=None, dtype=None):
+    def value(self, expression=None, dtype=None, workers: int = None, chunk_size: int = None):
         if expression:
-            value = self._convert(self.magnitude, self.baseunits, BaseUnits(expression)).value
+            value = self._convert(
+                self.magnitude, self.baseunits, BaseUnits(expression), 
+                workers=workers, chunk_size=chunk_size
+            ).value
         else:
             value = self.magnitude.value
         if dtype:
-            return value.astype(dtype) if isinstance(value, np.ndarray) else dtype(value)
+            if isinstance(value, DoubleDouble):
+                value = value.to_decimal() if dtype is Decimal else value.to_float()
+            return value.astype(dtype) if isinstance(value, np.ndarray) or issparse(value) else dtype(value)
         else:
             return value
 
     def units(self):
         return self.baseunits.expression
 
-    def to(self, units: Union[str,list,np.ndarray,Dimensions,dict,BaseUnits]):
+    def to(self, units: Union[str,list,np.ndarray,Dimensions,dict,BaseUnits], workers: int = None, chunk_size: int = None):
+        kwargs = dict(workers=workers, chunk_size=chunk_size)
         if isinstance(units, Quantity):
             baseunits = units.baseunits
-            self.magnitude = self._convert(self.magnitude, self.baseunits, baseunits) / units.magnitude
+            self.magnitude = self._convert(self.magnitude, self.baseunits, baseunits, **kwargs) / units.magnitude
         else:
             baseunits = BaseUnits(units)
-            self.magnitude = self._convert(self.magnitude, self.baseunits, baseunits)
+            self.magnitude = self._convert(self.magnitude, self.baseunits, baseunits, **kwargs)
         self.baseunits = baseunits
         return self
         
@@ -282,6 +308,153 @@ class Quantity:
         self.baseunits = BaseUnits({unitid:exp for unitid,exp in baseunits.values()})
         return self
 
+    def to_system(self, system):
+        """ Return a new quantity converted into units of a given system of units (e.g. SI, CGS, AU)
+
+        Temperatures in Celsius or Fahrenheit are converted using Kelvins.
+        Quantities with logarithmic units are returned without conversion.
+        """
+        magnitude, baseunits = Magnitude(self.magnitude.value, self.magnitude.error), self.baseunits
+        if np.any(np.isin(baseunits.units, LogarithmicUnitType.process)):
+            return Quantity(magnitude, BaseUnits(baseunits))
+        if np.any(np.isin(baseunits.units, TemperatureUnitType.process)):
+            magnitude = self._convert(magnitude, baseunits, BaseUnits('K'))
+            baseunits = BaseUnits('K')
+        baseunits2 = system.baseunits(baseunits.dimensions)
+        return Quantity(self._convert(magnitude, baseunits, baseunits2), baseunits2)
+
+    @staticmethod
+    def from_strings(
+        strings: Union[list,tuple,np.ndarray],
+        units: Union[str,list,np.ndarray,Dimensions,dict,BaseUnits] = None,
+        errors: str = 'raise'
+    ):
+        """ Create an array quantity from a sequence of value-unit strings
+
+        Entries are grouped by their unit strings, so that every distinct unit is resolved only once.
+        If target units are not given, units of the first valid entry are used.
+
+        :param strings: Sequence or array of strings like '1.2 km' or '300 K'
+        :param units: Target units of the returned quantity
+        :param errors: Malformed entries raise an exception if 'raise', or are set to NaN if 'coerce'
+        """
+        if errors not in ['raise','coerce']:
+            raise Exception("Unsupported error handling option:", errors)
+        strings = np.asarray(strings, dtype=str)
+        flat = strings.ravel()
+        values = np.full(flat.size, np.nan, dtype=float)
+        groups = {}
+        malformed = {}
+        # split numbers and units
+        for index, string in enumerate(flat):
+            if m := PATTERN_QUANTITY.match(string):
+                values[index] = float(m.group(1))
+                groups.setdefault(m.group(2), []).append(index)
+            else:
+                malformed[index] = str(string)
+        # resolve every distinct unit only once
+        atoms = {}
+        for unit, indices in groups.items():
+            try:
+                atoms[unit] = UnitSolver(unit) if unit else None
+            except Exception:
+                for index in indices:
+                    malformed[index] = str(flat[index])
+        if malformed and errors=='raise':
+            raise Exception("Following entries could not be parsed:", dict(sorted(malformed.items())))
+        for index in malformed.keys():
+            values[index] = np.nan
+        # set target units
+        if units is not None:
+            baseunits2 = units.baseunits if isinstance(units, Quantity) else BaseUnits(units)
+        elif atoms:
+            atom = next(iter(atoms.values()))
+            baseunits2 = BaseUnits(dict(atom.baseunits)) if atom else BaseUnits()
+        else:
+            baseunits2 = BaseUnits()
+        # convert linear units using a single array of factors
+        factors = np.ones(flat.size, dtype=float)
+        for unit, atom in atoms.items():
+            indices = np.array(groups[unit])
+            magnitude = atom.magnitude if atom else 1.0
+            baseunits1 = BaseUnits(dict(atom.baseunits)) if atom else BaseUnits()
+            if baseunits1==baseunits2:   # non-linear units cannot be converted to themselves
+                factors[indices] = magnitude
+                continue
+            for utype in UNIT_TYPES:
+                if c := utype(baseunits1, baseunits2):
+                    break
+            else:
+                raise Exception("Unsupported conversion between units:", baseunits1.expression, baseunits2.expression)
+            if c.conversion==("_convert_linear",):
+                factors[indices] = magnitude * baseunits1.magnitude / baseunits2.magnitude
+            else:
+                values[indices] = c.convert(Magnitude(values[indices]*magnitude)).value
+        values *= factors
+        return Quantity(values.reshape(strings.shape), baseunits2)
+
+class FrozenQuantity(Quantity):
+    """ Immutable quantity that can be shared between threads
+
+    Methods that would modify the quantity return a modified copy instead.
+    """
+    __slots__ = ()
+
+    def __init__(self, *args, **kwargs):
+        quantity = Quantity(*args, **kwargs)
+        object.__setattr__(self, 'magnitude', quantity.magnitude)
+        object.__setattr__(self, 'baseunits', quantity.baseunits)
+        # evaluate lazy fields before the object is shared
+        self.baseunits.expression
+
+    def __setattr__(self, name, value):
+        raise Exception("Frozen quantity cannot be modified:", name)
+
+    def copy(self):
+        magnitude = Magnitude(self.magnitude.value, self.magnitude.error)
+        return Quantity(magnitude, BaseUnits(self.baseunits))
+
+    def to(self, units: Union[str,list,np.ndarray,Dimensions,dict,BaseUnits], **kwargs):
+        return self.copy().to(units, **kwargs)
+
+    def abse(self, error: Union[int,float] = None):
+        if error is None:
+            return self.magnitude.abse()
+        return self.copy().abse(error)
+
+    def rele(self, error: Union[int,float] = None):
+        if error is None:
+            return self.magnitude.rele()
+        return self.copy().rele(error)
+
+    def rebase(self):
+        return self.copy().rebase()
+
+def frozen_quantity(expression: str):
+    """ Return a copy of a cached frozen quantity of a unit expression
+
+    The cache is cleared every time the unit registry changes.
+    """
+    if (quantity := FROZEN_QUANTITIES.get(expression)) is None:
+        quantity = FrozenQuantity(1, expression)
+        FROZEN_QUANTITIES[expression] = quantity
+    return quantity.copy()
+
+def _unpickle_quantity(value, dtype, shape, units, error):
+    """ Reconstruct a pickled quantity from its raw data and unit signature
+    """
+    if dtype is not None:
+        value = np.frombuffer(value, dtype=dtype).reshape(shape)
+        if not value.flags.writeable:
+            value = value.copy()
+    magnitude = Magnitude.__new__(Magnitude)
+    magnitude.value = value
+    magnitude.error = error
+    quantity = Quantity.__new__(Quantity)
+    quantity.magnitude = magnitude
+    quantity.baseunits = BaseUnits({unitid:Fraction(num, den) for unitid, num, den in units})
+    return quantity
+
 def implements(np_function):
     def decorator(func):
         HANDLED_FUNCTIONS[np_function] = func
@@ -328,6 +501,18 @@ def ceil(a, **kwargs):
 def sum(a, **kwargs):
     return Quantity(np.sum(a.magnitude.value), a.baseunits)
     
+@implements(np.mean)
+def mean(a, **kwargs):
+    return Quantity(np.mean(a.magnitude.value, **kwargs), a.baseunits)
+
+@implements(np.min)
+def min(a, **kwargs):
+    return Quantity(np.min(a.magnitude.value, **kwargs), a.baseunits)
+
+@implements(np.max)
+def max(a, **kwargs):
+    return Quantity(np.max(a.magnitude.value, **kwargs), a.baseunits)
+
 @implements(np.iscomplexobj)
 def iscomplexobj(a, **kwargs):
     return False
@@ -14,6 +14,8 @@ SYMBOL_SYSTEM_UNIT = "#"
 
 DIMENSION_LIST     = ['m','g','s','K','C','cd','mol','rad']
 
+ENVIRONMENT_UNITS = set()   # symbols of units added by active unit environments
+
 UNIT_TYPES = [
     TemperatureUnitType,
     LogarithmicUnitType,
@@ -1,23 +1,79 @@
 from .settings import *
-from .quantity import Quantity 
+from .fraction import Fraction
+from .dimensions import Dimensions
+from .base_units import BaseUnits
+from .quantity import Quantity
+
+# quantities used to compose units that do not have a dedicated system unit
+SYSTEM_BASE_QUANTITIES = {
+    'm': 'LEN', 'g': 'MAS', 's': 'TIM', 'K': 'TEM', 'C': 'ECH', 'cd': 'LIN', 'mol': 'AOS', 'rad': 'PAN'
+}
 
 class SystemOfUnits:
     def __init__(self, prefix):
         self.prefix = prefix
         self.names = list(QUANTITY_LIST.name)
         self.symbols = list(QUANTITY_LIST.symbol)
+        self._symbols = dict(zip(self.names, self.symbols))
+        self._units = None
     def __getattr__(self, quantity):
-        idx = self.names.index(quantity)
-        symbol = self.symbols[idx]
+        if quantity.startswith('_'):
+            raise AttributeError(quantity)
+        symbol = self._symbols[quantity]
         def system(x=1):
             unit = f"{SYMBOL_SYSTEM_UNIT}{self.prefix}{symbol}"
             return Quantity(x, unit)
         return system
     def __getitem__(self, quantity):
-        idx = self.names.index(quantity)
-        symbol = self.symbols[idx]
+        symbol = self._symbols[quantity]
         unit = f"{SYMBOL_SYSTEM_UNIT}{self.prefix}{symbol}"
         return unit
+    def _system_units(self):
+        """ Map dimension signatures to system units
+        """
+        if self._units is None:
+            self._units = {}
+            for unitid, (magnitude, dimensions) in QUANTITY_UNITS.items():
+                if unitid[len(SYMBOL_SYSTEM_UNIT)]!=self.prefix:
+                    continue
+                signature = Dimensions.from_list(dimensions).signature()
+                if signature not in self._units:
+                    self._units[signature] = {unitid: Fraction(1)}
+        return self._units
+    def baseunits(self, dimensions: Dimensions):
+        """ Return base units of the system with given dimensions
+
+        :param dimensions: Dimensions of a quantity
+        """
+        units = self._system_units()
+        signature = dimensions.signature()
+        if signature not in units:
+            baseunits = {}
+            for name in DIMENSION_LIST:
+                exp = getattr(dimensions, name)
+                if exp.num==0:
+                    continue
+                unitid = f"{SYMBOL_SYSTEM_UNIT}{self.prefix}{SYSTEM_BASE_QUANTITIES[name]}"
+                if unitid not in QUANTITY_UNITS:
+                    raise Exception("Dimensions cannot be expressed in the system of units:", dimensions, unitid)
+                baseunits[unitid] = Fraction.from_fraction(exp)
+            units[signature] = baseunits
+        return BaseUnits(dict(units[signature]))
+    def convert(self, data):
+        """ Convert quantities in a dictionary or a list into the system of units
+
+        Quantities are converted as new objects, and other values are returned without changes.
+
+        :param data: Quantity, or a dictionary/list of quantities
+        """
+        if isinstance(data, Quantity):
+            return data.to_system(self)
+        elif isinstance(data, dict):
+            return {key: self.convert(value) for key, value in data.items()}
+        elif isinstance(data, (list, tuple)):
+            return type(data)(self.convert(value) for value in data)
+        else:
+            return data
 
 SI    = SystemOfUnits('S')
 AU    = SystemOfUnits('A')
@@ -1,6 +1,6 @@
 
 from .settings import *
-from .quantity import Quantity
+from .quantity import frozen_quantity
 
 class Unit:
     
@@ -12,12 +12,12 @@ class Unit:
         
     def __new__(cls, unit=None):
         if unit:
-            return Quantity(1, unit)
+            return frozen_quantity(unit)
         else:
             return object.__new__(cls)
     
     def __getattr__(self, unit):
-        return Quantity(1,str(unit))
+        return frozen_quantity(str(unit))
         
     def __str__(self):
         return Unit._list()
@@ -1,5 +1,5 @@
 from .settings import *
-from .quantity import Quantity
+from .quantity import Quantity, FROZEN_QUANTITIES
 
 def check_unique_symbols():   
     units = list(UNIT_STANDARD.keys())
@@ -51,14 +51,18 @@ class UnitEnvironment:
             if 'prefixes' not in unit:
                 unit['prefixes'] = False
             UNIT_STANDARD.append(symbol, (unit['magnitude'], unit['dimensions'], unit['definition'], unit['name'], unit['prefixes']))
+            ENVIRONMENT_UNITS.add(symbol)
             self.new_units.append(symbol)
         check_unique_symbols()
+        FROZEN_QUANTITIES.clear()
         
     def close(self):
         for unit in self.new_units:
             del UNIT_STANDARD[unit]
+            ENVIRONMENT_UNITS.discard(unit)
         for utype in self.new_types:
             UNIT_TYPES.remove(utype)
+        FROZEN_QUANTITIES.clear()
         
         
     
\ No newline at end of file
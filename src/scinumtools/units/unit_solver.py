@@ -5,6 +5,7 @@ from ..solver import ExpressionSolver, OperatorPar, OperatorMul, OperatorTruediv
 from .fraction import Fraction
 
 class Atom:
+    __slots__ = ('magnitude','baseunits')
     
     magnitude: float
     baseunits: dict
@@ -1,7 +1,8 @@
 import numpy as np
 from decimal import Decimal
 
-from .magnitude import Magnitude
+from .magnitude import Magnitude, issparse
+from .execution import parallel
 
 class UnitType:
 
@@ -14,17 +15,19 @@ class UnitType:
         else:
             return None
             
-    def convert(self, magnitude1):
+    def convert(self, magnitude1, workers: int = None, chunk_size: int = None):
         if not hasattr(self, self.conversion[0]):
                 raise Exception('Conversion method is not implemented:', self.conversion[0])
-        if isinstance(magnitude1.value, Decimal) or \
-           isinstance(self.baseunits1.magnitude, Decimal) or \
-           isinstance(self.baseunits2.magnitude, Decimal):
-            magnitude1.value = Decimal(magnitude1.value)
-            self.baseunits1.magnitude = Decimal(self.baseunits1.magnitude)
-            self.baseunits2.magnitude = Decimal(self.baseunits2.magnitude)
+        value, base1, base2 = magnitude1.value, self.baseunits1.magnitude, self.baseunits2.magnitude
+        if issparse(value) and self.conversion[0]!="_convert_linear":
+            raise Exception('Sparse magnitudes support only linear conversions:', self.conversion[0])
+        if isinstance(value, Decimal) or isinstance(base1, Decimal) or isinstance(base2, Decimal):
+            value, base1, base2 = Decimal(value), Decimal(base1), Decimal(base2)
+        conversion = getattr(self, self.conversion[0])
+        def convert(value):
+            return conversion(value * base1, *self.conversion[1:]) / base2
         return Magnitude(
-            getattr(self, self.conversion[0])(magnitude1.value * self.baseunits1.magnitude, *self.conversion[1:]) / self.baseunits2.magnitude,
+            parallel(convert, value, workers=workers, chunk_size=chunk_size),
             magnitude1.error
         )
         
@@ -202,9 +205,10 @@ class LogarithmicUnitType(UnitType):
         if self.baseunits1.units!=self.baseunits2.units:
             raise Exception('Only the same units can be added', unit1, unit2)
         mag1 = unit1.magnitude
-        mag2 = unit2.to(unit1.baseunits).magnitude
-        mag1.value = np.power(10,mag1.value*unit1.baseunits.magnitude)
-        mag2.value = np.power(10,mag2.value*unit2.baseunits.magnitude)
+        unit2 = unit2.to(unit1.baseunits)
+        mag2 = unit2.magnitude
+        mag1 = Magnitude(np.power(10,mag1.value*unit1.baseunits.magnitude), mag1.error)
+        mag2 = Magnitude(np.power(10,mag2.value*unit2.baseunits.magnitude), mag2.error)
         mag = mag1 + mag2
         mag.value = np.log10(mag.value)/unit1.baseunits.magnitude
         return mag
@@ -215,9 +219,10 @@ class LogarithmicUnitType(UnitType):
         if self.baseunits1.units!=self.baseunits2.units:
             raise Exception('Only the same units can be substracted', unit1, unit2)
         mag1 = unit1.magnitude
-        mag2 = unit2.to(unit1.baseunits).magnitude
-        mag1.value = np.power(10,mag1.value*unit1.baseunits.magnitude)
-        mag2.value = np.power(10,mag2.value*unit2.baseunits.magnitude)
+        unit2 = unit2.to(unit1.baseunits)
+        mag2 = unit2.magnitude
+        mag1 = Magnitude(np.power(10,mag1.value*unit1.baseunits.magnitude), mag1.error)
+        mag2 = Magnitude(np.power(10,mag2.value*unit2.baseunits.magnitude), mag2.error)
         mag = mag1 - mag2
         mag.value = np.log10(mag.value)/unit1.baseunits.magnitude
         return mag
@@ -0,0 +1,141 @@
+import os
+import sys
+sys.path.insert(0, 'src')
+
+from scinumtools.dip import DIP, EnvironmentCache, TokenCache
+from scinumtools.dip.settings import Format, FILE_SOURCE
+
+def parse(cache, filepath):
+    with DIP(cache=cache) as dip:
+        dip.add_file(filepath)
+        dip.add_string("c int = 3")
+        env = dip.parse()
+    return dip, env
+
+def test_environment_cache(tmp_path, monkeypatch):
+
+    with open(tmp_path/"settings.dip",'w') as f:
+        f.write("b int = 5")
+    with open(tmp_path/"definitions.dip",'w') as f:
+        f.write("""
+$source settings = settings.dip
+$unit length = 2 m
+a float = 3 [length]
+b int = {settings?b}
+c int = 1
+""")
+    cache = EnvironmentCache(tmp_path/"cache")
+    dip, env = parse(cache, tmp_path/"definitions.dip")
+    data = {'a': (3, '[length]'), 'b': 5, 'c': 3}
+    assert env.data(Format.TUPLE) == data
+    assert len(os.listdir(tmp_path/"cache")) == 1
+
+    # cached environment is loaded without parsing
+    def get_queue(self):
+        raise Exception("Environment was not loaded from the cache")
+    with monkeypatch.context() as m:
+        m.setattr(DIP, '_get_queue', get_queue)
+        dip, env = parse(cache, tmp_path/"definitions.dip")
+    assert env.data(Format.TUPLE) == data
+    assert env.nodes['b'].source == (f"{dip.name}_{FILE_SOURCE}1", 4)
+    assert f"{dip.name}_{FILE_SOURCE}1" in env.sources
+    assert env.sources['settings'].path == str(tmp_path/"settings.dip")
+
+    # cached environments are not used if source code of the library changes
+    with monkeypatch.context() as m:
+        m.setattr('scinumtools.dip.cache.parser_version', lambda: 'modified')
+        dip, env = parse(cache, tmp_path/"definitions.dip")
+    assert env.data(Format.TUPLE) == data
+    assert len(os.listdir(tmp_path/"cache")) == 2
+
+    # cached environment is updated if a source file changes
+    with open(tmp_path/"settings.dip",'w') as f:
+        f.write("b int = 16")
+    dip, env = parse(cache, tmp_path/"definitions.dip")
+    assert env.data(Format.TUPLE) == {'a': (3, '[length]'), 'b': 16, 'c': 3}
+
+    # least recently used entries are removed
+    size = os.path.getsize(cache.directory+"/"+os.listdir(cache.directory)[0])
+    cache = EnvironmentCache(cache.directory, max_size=int(1.5*size))
+    dip, env = parse(cache, tmp_path/"settings.dip")
+    assert env.data() == {'b': 16, 'c': 3}
+    assert len(os.listdir(cache.directory)) == 1
+    cache.clear()
+    assert len(os.listdir(cache.directory)) == 0
+
+def test_token_cache(tmp_path, monkeypatch):
+
+    with open(tmp_path/"defaults.dip",'w') as f:
+        f.write("""
+a float = 3 m
+b int = 5
+  = 5
+  = 6
+c str = \"\"\"
+block
+\"\"\"
+""")
+    with open(tmp_path/"modifications.dip",'w') as f:
+        f.write("a = 4 m")
+    def parse(token_cache):
+        with DIP(token_cache=token_cache) as dip:
+            dip.add_file(tmp_path/"defaults.dip")
+            dip.add_file(tmp_path/"modifications.dip")
+            dip.add_string("b = 6")
+            env = dip.parse()
+        return env.data(Format.TUPLE)
+    lexed = []
+    determine_node = DIP._determine_node
+    def count_node(self, line):
+        lexed.append(line['code'])
+        return determine_node(self, line)
+    monkeypatch.setattr(DIP, '_determine_node', count_node)
+
+    data = parse(None)
+    assert data == {'a': (4, 'm'), 'b': 6, 'c': "block"}
+    assert len(lexed) == 7
+
+    # nodes of files are lexed only once
+    cache = TokenCache(tmp_path/"cache")
+    lexed.clear()
+    assert parse(cache) == data
+    assert len(lexed) == 7
+    assert len(os.listdir(tmp_path/"cache")) == 2
+    lexed.clear()
+    assert parse(cache) == data
+    assert lexed == ["b = 6"]
+
+    # only modified files are lexed again
+    with open(tmp_path/"modifications.dip",'w') as f:
+        f.write("a = 5 m")
+    lexed.clear()
+    assert parse(cache) == {'a': (5, 'm'), 'b': 6, 'c': "block"}
+    assert lexed == ["a = 5 m", "b = 6"]
+
+def test_token_cache_sources(tmp_path, monkeypatch):
+
+    with open(tmp_path/"common.dip",'w') as f:
+        f.write("value float = 2 m\nfactor int = 3")
+    with open(tmp_path/"settings.dip",'w') as f:
+        f.write("$source common = common.dip\na float = {common?value}")
+    def parse(token_cache, workers=None):
+        with DIP(token_cache=token_cache, workers=workers) as dip:
+            dip.add_file(tmp_path/"settings.dip")
+            env = dip.parse()
+        return env.data(Format.TUPLE)
+    lexed = []
+    determine_node = DIP._determine_node
+    def count_node(self, line):
+        lexed.append(line['code'])
+        return determine_node(self, line)
+    monkeypatch.setattr(DIP, '_determine_node', count_node)
+
+    # nodes of sourced files are cached as well
+    cache = TokenCache(tmp_path/"cache")
+    assert parse(cache) == {'a': (2, 'm')}
+    assert lexed == ["$source common = common.dip", "a float = {common?value}", "value float = 2 m", "factor int = 3"]
+    assert len(os.listdir(tmp_path/"cache")) == 2
+    lexed.clear()
+    assert parse(cache) == {'a': (2, 'm')}
+    assert parse(cache, workers=1) == {'a': (2, 'm')}
+    assert lexed == []
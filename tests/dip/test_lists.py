@@ -1,8 +1,10 @@
 import sys
+import numpy as np
 sys.path.insert(0, 'src')
 
 from scinumtools.dip import DIP
-from scinumtools.dip.datatypes import FloatType
+from scinumtools.dip.settings import Format
+from scinumtools.dip.datatypes import FloatType, IntegerType
 
 def test_node_list():
     with DIP() as p:
@@ -12,4 +14,81 @@ def test_node_list():
     assert env.nodes.keys()                       == ['box', 'modules', 'runtime', 'simulation']
     assert env.nodes['runtime'].keys()            == ['t_max', 'timestep']
     assert env.nodes['runtime']['timestep'].value == FloatType(1.0000000000000001e-11, 's')
-    assert env.nodes['runtime.t_max'].value       == FloatType(1e-08, 's')
\ No newline at end of file
+    assert env.nodes['runtime.t_max'].value       == FloatType(1e-08, 's')
+
+def test_node_index():
+    with DIP() as p:
+        p.add_string("""
+        a float = 1 m
+        a.b int = 2
+        a.c.d int = 3
+        ab int = 4
+        a.b = 5
+        e {?a.*}
+        """)
+        env = p.parse()
+    nodes = env.nodes
+    assert [node.name for node in nodes] == ['a', 'a.b', 'a.c.d', 'ab', 'e.b', 'e.c.d']
+    assert nodes.get('a.b').value == IntegerType(5)   # modified node
+    assert nodes.get('a.x') is None
+    assert [node.name for node in nodes.query('a.*')] == ['b', 'c.d']
+    assert [node.name for node in nodes['a.c']] == ['d']
+    assert nodes['a.c.d'].value == IntegerType(3)
+
+    # index is updated with the list
+    node = env.nodes[3].copy()
+    nodes.append(node)
+    node.name = 'a.f'    # node renamed after indexing
+    del nodes[-1]
+    node = env.nodes[1].copy()
+    node.name = 'a.c.g'
+    nodes.append(node)
+    nodes.prepend([node.copy()])
+    assert [node.name for node in nodes.query('a.c.*')] == ['g', 'd', 'g']
+    del nodes[2]
+    nodes.pop()
+    assert [node.name for node in nodes.query('a.*')] == ['c.d', 'c.g']
+    assert len(nodes.query('a.c.g')) == 1
+
+def test_node_views():
+    with DIP() as p:
+        p.add_string("""
+        a.b float[3] = [1,2,3] cm
+          !tags ["x"]
+        a.c float = 1 cm
+        c {?a.*}
+        c.c = 2 m
+        d float[3] = {?a.b}
+          !tags ["y"]
+        """)
+        env = p.parse()
+    data = env.data(Format.TUPLE)
+    np.testing.assert_equal(data['a.b'], ([1,2,3], 'cm'))
+    np.testing.assert_equal(data['c.b'], ([1,2,3], 'cm'))
+    np.testing.assert_equal(data['d'],   ([1,2,3], 'cm'))
+    assert data['a.c'] == (1, 'cm')
+    assert data['c.c'] == (200, 'cm')
+    assert env.nodes.get('a.b').tags == ['x']
+    assert env.nodes.get('c.b').tags == ['x']
+    assert env.nodes.get('d').tags == ['y']
+
+    # queried nodes share values with the original nodes
+    node = env.nodes.get('a.b')
+    view = env.nodes['a.b']
+    assert view.value is not node.value and view.value.value is node.value.value
+    view.tags += ['z']
+    view.value = FloatType(view.value.value*2, 'cm')
+    assert node.tags == ['x']
+    np.testing.assert_equal(node.value.value, [1,2,3])
+    assert [view.name for view in env.nodes.query('a.*')] == ['b', 'c']
+    assert env.nodes.query('a.*')[0].value.value is node.value.value
+
+    # comparisons in expressions do not modify values of referenced nodes
+    with DIP() as p:
+        p.add_string("""
+        a float = 3000 m
+        b float = 3 km
+        c bool = ("{?a} == {?b}")
+        """)
+        env = p.parse()
+    assert env.data(Format.TUPLE) == {'a': (3000, 'm'), 'b': (3, 'km'), 'c': True}
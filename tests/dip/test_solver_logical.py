@@ -107,6 +107,30 @@ def test_combination():
         || ~!{?color}
         """) == BooleanType(True)
         
+def test_short_circuit():
+    with DIP() as dip:
+        dip.add_string("""
+        dogs int = 23
+        cats int = 44
+        """)
+        env = dip.parse()
+    requests = []
+    request = env.request
+    def counted_request(*args, **kwargs):
+        requests.append(args[0])
+        return request(*args, **kwargs)
+    env.request = counted_request
+    with LogicalSolver(env) as p:
+        # right operands are evaluated only if they can change the result
+        assert p.solve('{?dogs} > {?cats} && {?cats} > 40') == BooleanType(False)
+        assert requests == ['?dogs','?cats']
+        requests.clear()
+        assert p.solve('{?dogs} < {?cats} || {?elefant} > 3') == BooleanType(True)
+        assert requests == ['?dogs','?cats']
+        requests.clear()
+        assert p.solve('false || {?cats} > 40 && true') == BooleanType(True)
+        assert requests == ['?cats']
+        
 if __name__ == "__main__":
     # Specify wich test to run
     test = sys.argv[1] if len(sys.argv)>1 else True
@@ -185,4 +185,74 @@ def test_inline_sources():
         ]
         for name, source, lineno in nodes:
             node = env.request(name)[0]
-            assert node.source == (source, lineno)
\ No newline at end of file
+            assert node.source == (source, lineno)
+
+def test_environment_copy():
+
+    with DIP() as dip:
+        dip.add_string("""
+        $source inline = examples/source_fa.dip
+        a float = 3 m
+        b str = 'John Smith'
+        """)
+        env = dip.parse()
+
+    # sources and node value data are shared with the copy
+    copied = env.copy()
+    num_sources = len(env.sources)
+    assert copied.sources is not env.sources
+    assert copied.sources['inline'] is env.sources['inline']
+    assert copied.nodes.nodes[0] is not env.nodes.nodes[0]
+    assert copied.nodes.nodes[0].value.value is env.nodes.nodes[0].value.value
+
+    # modifications of the copy do not change the original environment
+    with DIP(copied) as dip:
+        dip.add_string("""
+        a = 4 m
+        c int = 1
+        """)
+        modified = dip.parse()
+    assert modified.data() == {'a': 4, 'b': 'John Smith', 'c': 1}
+    assert env.data() == {'a': 3, 'b': 'John Smith'}
+    assert len(env.sources) == num_sources
+
+def test_source_loader(tmp_path, monkeypatch):
+
+    files = {
+        'common.dip': "value float = 2 m",
+        'a.dip': "$source common = common.dip\na float = {common?value}",
+        'b.dip': "$source common = common.dip\nb float = {common?value}\nc float = {a?a}",  # references parent source
+    }
+    for name, code in files.items():
+        with open(tmp_path/name,'w') as f:
+            f.write(code)
+    lexed = []
+    get_nodes = DIP._get_nodes
+    def count_nodes(self, lines):
+        lexed.extend(line['code'] for line in lines)
+        return get_nodes(self, lines)
+    monkeypatch.setattr(DIP, '_get_nodes', count_nodes)
+    def parse(workers):
+        lexed.clear()
+        with DIP(workers=workers) as dip:
+            dip.add_string(f"""
+            $source a = {tmp_path}/a.dip
+            $source b = {tmp_path}/b.dip
+            x float = {{a?a}}
+            y float = {{b?c}}
+            """)
+            env = dip.parse()
+        sources = {
+            name: sorted(key.replace(dip.name, '') for key in source.sources.keys())
+            for name, source in env.sources.items() if source.sources
+        }
+        return env.data(), sources
+
+    # common source is parsed only once
+    data, sources = parse(None)
+    assert data == {'x': 2, 'y': 2}
+    assert sorted(sources) == ['a', 'b']
+    assert lexed.count(files['common.dip']) == 2
+    assert parse(1) == (data, sources)
+    assert lexed.count(files['common.dip']) == 1
+    assert parse(2) == (data, sources)
@@ -0,0 +1,72 @@
+import sys
+sys.path.insert(0, 'src')
+
+from scinumtools.dip import DIP
+from scinumtools.dip.settings import Format
+
+def write(path, code):
+    with open(path,'w') as f:
+        f.write(code)
+
+def parse(tmp_path):
+    dip = DIP()
+    dip.add_file(tmp_path/"defaults.dip")
+    dip.add_file(tmp_path/"modifications.dip")
+    dip.add_string("box.depth float = {?box.width}")
+    return dip, dip.parse()
+
+def test_update(tmp_path):
+
+    write(tmp_path/"settings.dip", """
+width float = 3 cm
+scale float = 3
+grid str = 'cartesian'
+""")
+    write(tmp_path/"defaults.dip", """
+$source settings = settings.dip
+box
+  width float = {settings?width}
+  grid str = {settings?grid}
+  @case ("{?box.grid} == 'cartesian'")
+    height float = 2 cm
+  @else
+    radius float = 1 cm
+  @end
+  scale float = {settings?scale}
+  area float = ("{?box.width} * {?box.width}") cm2
+""")
+    write(tmp_path/"modifications.dip", """
+box.width = 4 cm
+""")
+    dip, env = parse(tmp_path)
+    data = env.data(Format.TUPLE)
+    assert data == {
+        'box.width': (4, 'cm'), 'box.grid': 'cartesian', 'box.height': (2, 'cm'),
+        'box.scale': 3, 'box.area': (9, 'cm2'), 'box.depth': (3, 'cm'),
+    }
+    assert dip.update([tmp_path/"settings.dip"]) == set()
+    assert env.data(Format.TUPLE) == data
+
+    # modification file changed
+    write(tmp_path/"modifications.dip", """
+box.width = 5 cm
+""")
+    lexed = []
+    determine_node = dip._determine_node
+    def count_node(line):
+        lexed.append(line['code'])
+        return determine_node(line)
+    dip._determine_node = count_node
+    assert dip.update([tmp_path/"modifications.dip"]) == {'box.width'}
+    assert len(lexed) == 2   # defaults are not parsed again
+    assert env.data(Format.TUPLE) == parse(tmp_path)[1].data(Format.TUPLE)
+
+    # sourced file changed
+    write(tmp_path/"settings.dip", """
+width float = 2 cm
+scale float = 2
+grid str = 'cylindrical'
+""")
+    assert dip.update([str(tmp_path/"settings.dip")]) == {'box.grid', 'box.height', 'box.radius', 'box.scale', 'box.area', 'box.depth'}
+    assert env.data(Format.TUPLE) == parse(tmp_path)[1].data(Format.TUPLE)
+    assert env.data(Format.TUPLE)['box.area'] == (4, 'cm2')
@@ -4,6 +4,28 @@ import sys
 sys.path.insert(0, 'src')
 
 from scinumtools.solver import *
+from scinumtools.units import Quantity
+from scinumtools import Stopwatch
+
+class CountingAtom(AtomBase):
+    # records all strings that are parsed into atoms
+    calls = []
+    
+    def __init__(self, value):
+        if isinstance(value, str):
+            CountingAtom.calls.append(value)
+            if value in ('true','false'):
+                value = value=='true'
+            elif value[0].isdigit():
+                value = float(value)
+            else:
+                value = len(value)
+        self.value = value
+
+@pytest.fixture
+def counting_atom():
+    CountingAtom.calls.clear()
+    return CountingAtom
 
 def test_custom_atom1():
 
@@ -131,4 +153,140 @@ def test_customisation_in_parentheses():
     with ExpressionSolver(AtomCustom, operators, steps) as es:
         # test multiple functions
         result = es.solve("(limit + 100 km/s) > (limit + 50000000000 km/s)")
-        assert result.value == 'False' # AtomCustom returns strings
\ No newline at end of file
+        assert result.value == 'False' # AtomCustom returns strings
+
+
+def test_compiled_program(counting_atom):
+
+    # compile expression once and evaluate it with different variables
+    with ExpressionSolver(AtomBase) as es:
+        program = es.compile('sin(x) * 2 + y**2 > 3')
+        assert es.compile('sin(x) * 2 + y**2 > 3') is program
+        for x, y in [(1,2),(3,0),(0.5,1.5)]:
+            result = program.evaluate(AtomBase, {'x': x, 'y': y})
+            assert result.value == (np.sin(x) * 2 + y**2 > 3)
+        assert es.solve('x*y', {'x': 3, 'y': 4}).value == 12
+
+    # evaluate program with a custom atom class
+    result = program.evaluate(counting_atom)
+    assert counting_atom.calls == ['x', '2', 'y', '3']   # repeated atoms are parsed only once
+    assert result.value == (np.sin(1) * 2 + 1**2 > 3)
+
+    # programs are cached separately for different operators
+    operators = {'mul':OperatorMul}
+    with ExpressionSolver(AtomBase, operators) as es:
+        assert es.compile('sin(x) * 2 + y**2 > 3') is not program
+
+def test_optimized_program(counting_atom):
+
+    Atom, calls = counting_atom, counting_atom.calls
+    with ExpressionSolver(Atom) as es:
+        program = es.compile('sqrt(2) * x + sqrt(2) * y - 3**2')
+    assert str(program) == "(sqrt(2)*x+(sqrt(2)*y)-(3**2))"
+
+    # repeated sub-expressions are evaluated only once
+    result = program.evaluate(Atom, {'x': 1, 'y': 2})
+    assert calls == ['2', '3']
+    assert result.value == np.sqrt(2) * 3 - 9
+
+    # constant sub-expressions are folded into atoms
+    optimized = program.optimize(Atom, ['x','y'])
+    assert str(optimized) == "(Atom(1.4142135623730951)*x+(Atom(1.4142135623730951)*y)-Atom(9.0))"
+    calls.clear()
+    for x, y in [(1,2),(3,0),(0.5,1.5)]:
+        result = optimized.evaluate(Atom, {'x': x, 'y': y})
+        assert result.value == program.evaluate(Atom, {'x': x, 'y': y}).value
+    assert calls == ['2', '3']*3   # only the original program parses atoms
+    assert str(program) == "(sqrt(2)*x+(sqrt(2)*y)-(3**2))"
+
+def test_solve_many(counting_atom):
+
+    Atom, calls = counting_atom, counting_atom.calls
+    expressions = ['1 + 2', '3 * 2 + 1', '1 + 2', 'x * 2', '2 / 4 + 1']
+    with ExpressionSolver(Atom) as es:
+        results = es.solve_many(expressions, {'x': 5})
+    assert [result.value for result in results] == [3, 7, 3, 10, 1.5]
+    assert sorted(calls) == ['1', '2', '3', '4']   # atoms are parsed only once per batch
+
+    # errors are captured for each expression
+    with ExpressionSolver(AtomBase) as es:
+        results = es.solve_many(['2 * 3', '2 *', '4 ** -0.5'])
+    assert results[0].value == 6
+    assert isinstance(results[1], Exception)
+    assert results[2].value == 0.5
+
+    # signed atoms are parsed by the batch cache in both engines
+    for engine in ['precedence', 'steps']:
+        with ExpressionSolver(AtomBase, engine=engine) as es:
+            results = es.solve_many(['-2 * 3', '2 * -3', '-2 * 3', '+4 ** -0.5'])
+        assert [result.value for result in results] == [-6, -6, -6, 0.5]
+
+    # expressions distributed to worker processes
+    expressions = [f"{i} * 2 + sqrt({i})" for i in range(20)]*2 + ['1 +']
+    with ExpressionSolver(AtomBase) as es:
+        results = es.solve_many(expressions, workers=2)
+        assert [str(result) for result in results] == [str(result) for result in es.solve_many(expressions)]
+    assert results[0].value == 0
+    assert results[21].value == 2 + 1
+    assert isinstance(results[-1], Exception)
+
+def test_profiler():
+
+    with SolverProfiler() as sp:
+        with ExpressionSolver(AtomBase) as es:
+            es.solve('2 * 3 + 2 * 4 - 2')
+            es.solve('2 * 3 + 2 * 4 - 2')
+    counters = dict(zip(sp.report().Name, sp.report().Calls))
+    assert counters == {
+        'tokenize': 1,     # second expression is compiled only once
+        'AtomBase()': 6,   # repeated atoms are parsed only once per evaluation
+        'OperatorMul.operate_binary': 4,
+        'OperatorAdd.operate_binary': 2,
+        'OperatorSub.operate_binary': 2,
+    }
+
+    # counters are aggregated across nested solvers and recorded also by a stopwatch
+    stopwatch = Stopwatch()
+    with SolverProfiler(stopwatch) as sp:
+        with ExpressionSolver(AtomBase, engine='steps') as es:
+            es.solve('sqrt(4) * 3')
+        Quantity(3, 'kg*m2/s')
+    report = sp.report().to_dict()
+    assert report['Calls'][report['Name'].index('OperatorSqrt.operate_args')] == 1
+    assert report['Calls'][report['Name'].index('OperatorMul.operate_binary')] == 2
+    assert 'AtomParser()' in report['Name']   # atoms of the unit solver
+    assert stopwatch.report().to_dict()['Node'].count('OperatorMul.operate_binary') == 1
+
+    # nothing is recorded when the profiler is not active
+    with ExpressionSolver(AtomBase) as es:
+        es.solve('1 + 2 + 3')
+    assert sp.report().to_dict()['Name'] == report['Name']
+
+def test_short_circuit(counting_atom):
+
+    Atom, calls = counting_atom, counting_atom.calls
+
+    # right operands are evaluated only if they can change the result
+    with ExpressionSolver(Atom) as es:
+        for expr, result, atoms in [
+            ('false && 1 / 0 > 2',          False, ['false']),
+            ('true || 1 / 0 > 2',           True,  ['true']),
+            ('1 > 2 && 3 < 4 || 5 == 5',    True,  ['1','2','5']),
+            ('true && (false || 2 < 3)',    True,  ['true','false','2','3']),
+            ('(false && 4 > 5) || !true',   False, ['false','true']),
+        ]:
+            calls.clear()
+            assert es.solve(expr).value is result
+            assert calls == atoms
+
+    # operands that are decided by constants are removed during optimization
+    with ExpressionSolver(Atom) as es:
+        program = es.compile('2 > 1 || x > 3').optimize(Atom, ['x'])
+        assert str(program) == "Atom(True)"
+        program = es.compile('(1 > 2 && x > 3) || y > 2').optimize(Atom, ['x','y'])
+        assert str(program) == "(Atom(False)||(y>Atom(2.0)))"
+
+    # numerical and array operands are evaluated as before
+    with ExpressionSolver(AtomBase) as es:
+        assert es.solve('0 && 1').value == 0
+    assert list(ArraySolver('a > 1 && a < 3', {'a': np.array([1, 2, 3])})) == [False, True, False]
@@ -0,0 +1,127 @@
+import numpy as np
+import random
+import warnings
+import sys
+sys.path.insert(0, 'src')
+
+from scinumtools.solver import *
+from scinumtools.units import Quantity
+from scinumtools.dip.solvers import NumericalSolver, LogicalSolver
+from scinumtools.materials import Substance, SubstanceSolver, Material, MaterialSolver
+
+def generate(rng, depth=0):
+    # random expression with default operators
+    r = rng.random()
+    if depth>3 or r<0.3:
+        expr = str(rng.randint(0,5))
+    elif r<0.45:
+        expr = f"({generate(rng,depth+1)})"
+    elif r<0.55:
+        expr = f"{rng.choice(['sin','cos','sqrt','log','exp'])}({generate(rng,depth+1)})"
+    elif r<0.6:
+        expr = f"pow({generate(rng,depth+1)}, {generate(rng,depth+1)})"
+    else:
+        expr = generate(rng, depth+1)
+    if rng.random()<0.25:
+        expr = rng.choice(['-','+','- -','+-','!']) + expr
+    if rng.random()<0.6 and depth<4:
+        operator = rng.choice(['+','-','*','/','**','==','!=','<','>','<=','>=','&&','||'])
+        expr = f"{expr} {operator} {generate(rng, depth+1)}"
+    return expr
+
+def solve(expr, engine, atom=AtomBase, operators=None, steps=None):
+    try:
+        with ExpressionSolver(atom, operators, steps, engine=engine) as es:
+            return es.solve(expr).value
+    except Exception as e:
+        return e
+
+def test_random_expressions():
+
+    # expressions solvable by operation steps give the same results with precedence climbing
+    rng = random.Random(42)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        for i in range(1000):
+            expr = generate(rng)
+            value1 = solve(expr, 'steps')
+            value2 = solve(expr, 'precedence')
+            if isinstance(value1, Exception):
+                # malformed expressions are rejected by both engines
+                assert isinstance(value2, Exception), expr
+                continue
+            assert not isinstance(value2, Exception), expr
+            assert type(value1)==type(value2), expr
+            assert value1==value2 or (np.isnan(value1) and np.isnan(value2)), expr
+
+def test_malformed_expressions():
+
+    # weaker unary operators cannot be operands of stronger operators
+    for expr in ['- ! 1 == 4 < 4', '-!1', '1 + ! 1', '1 == ! 2', '* 1']:
+        assert isinstance(solve(expr, 'steps'), Exception), expr
+        error = solve(expr, 'precedence')
+        assert isinstance(error, Exception), expr
+        assert error.args[0] == "Cannot solve expression due to unprocessed tokens:"
+        assert 'object at' not in str(error.args)
+    assert str(solve('1 + ! 1', 'precedence').args[2]) == "[Oper(!), TreeAtom(1)]"
+    for expr in ['! - 1 == 4', '!-1', '1 && !0']:
+        assert solve(expr, 'steps') == solve(expr, 'precedence'), expr
+
+def test_custom_operators():
+
+    class OperatorSquare(OperatorBase):
+        symbol: str = '~'
+        def operate_unary(self, tokens):
+            right = tokens.get_right()
+            tokens.put_left(right*right)
+    class OperatorCube(OperatorBase):
+        symbol: str = '^'
+        def operate_unary(self, tokens):
+            left = tokens.get_left()
+            tokens.put_left(left*left*left)
+    operators = {'square':OperatorSquare,'cube':OperatorCube,'add':OperatorAdd,'mul':OperatorMul,'par':OperatorPar}
+    steps = [
+        dict(operators=['par'],           otype=Otype.ARGS),
+        dict(operators=['square','cube'], otype=Otype.UNARY),
+        dict(operators=['mul'],           otype=Otype.BINARY),
+        dict(operators=['add'],           otype=Otype.BINARY),
+    ]
+    for expr in ['~3 + 2^', '~(1 + 2^) * 3^ + 1', '2 * ~2^', '(~2)^']:
+        assert solve(expr, 'steps', operators=operators, steps=steps) == solve(expr, 'precedence', operators=operators, steps=steps)
+
+    # operators with lower precedence than their operands
+    steps = [
+        dict(operators=['par'],  otype=Otype.ARGS),
+        dict(operators=['add'],  otype=Otype.BINARY),
+        dict(operators=['mul'],  otype=Otype.BINARY),
+    ]
+    for expr in ['1 + 2 * 3 + 4', '(1 + 2) * 3 + 4 * 5']:
+        assert solve(expr, 'steps', operators=operators, steps=steps) == solve(expr, 'precedence', operators=operators, steps=steps)
+
+def test_submodules(monkeypatch):
+
+    def results():
+        data = []
+        # units
+        for units in ['kg*m2/s2', '(kg/(m*s))/K', 'm3:2/s']:
+            data.append(str(Quantity(1, units)))
+        # numerical and logical DIP expressions
+        with NumericalSolver() as p:
+            for expr in ['1 - -3 + -4', '-8 / 2 * -4', '3 kg * 4 m2 / 2 s2 + 1e7 erg', 'sqrt(4 m2) - (2 cm + 3 mm) * -2', 'exp(2) * 3 m + logb(8, 2) * 1 cm']:
+                data.append(str(p.solve(expr)))
+        with LogicalSolver() as p:
+            for expr in ['false || true && false && true || true', '~true && (false || true)', 'true == false || ~false']:
+                data.append(str(p.solve(expr)))
+        # materials
+        with SubstanceSolver(Substance().atom) as ms:
+            for expr in ['C{13+2}(B{11}Li2)4 H{-}2 O{+3}', '((CB2)2Al)3']:
+                data.append(str(ms.solve(expr)))
+        with MaterialSolver(Material().atom) as ms:
+            data.append(str(ms.solve('0.2 <H2O> 0.8 <NaCl>')))
+        return data
+
+    monkeypatch.setattr(ExpressionSolver, 'engine', 'steps')
+    data1 = results()
+    monkeypatch.setattr(ExpressionSolver, 'engine', 'precedence')
+    data2 = results()
+    assert data1 == data2
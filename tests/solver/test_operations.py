@@ -86,3 +86,34 @@ def test_solver_logical():
         for expr, value in expressions.items():
             result = es.solve(expr)
             assert result.value == value
+
+def test_tokenizer():
+
+    # operators are matched in the order of the operator table
+    with ExpressionSolver(AtomBase) as es:
+        es.tokenize("2**-3 != !1 <= logb(8, 2)")
+        assert str(es.tokens.right) == "[Atom(2.0), Oper(**), Oper(-), Atom(3.0), Oper(!=), Oper(!), Atom(1.0), Oper(<=), Oper(logb()]"
+        assert str(es.tokens.right[-1].args) == "[Atom(8.0), Atom(2.0)]"
+
+    # long expressions
+    expr = "+".join(f"({i}*2-{i})" for i in range(1000))
+    with ExpressionSolver(AtomBase) as es:
+        assert es.solve(expr).value == sum(range(1000))
+
+def test_array_solver():
+
+    # elementwise evaluation gives the same results as solving each element
+    x = np.linspace(0.5, 3, 20)
+    y = np.linspace(3, 0.1, 20)
+    expr = 'sqrt(x**2 + y**2) * (1 + exp(-x/y)) > 3 && !(x >= y) || -log(y) > 1'
+    result = ArraySolver(expr, {'x': x, 'y': y})
+    assert result.shape == (20,)
+    with ExpressionSolver(AtomBase) as es:
+        for i in range(20):
+            assert result[i] == es.solve(expr, {'x': x[i], 'y': y[i]}).value
+
+    # variables from a DataFrame columns and constant expressions
+    import pandas as pd
+    data = pd.DataFrame({'x': x, 'y': y})
+    assert np.allclose(ArraySolver('pow(x, 2) + sin(y) * 2', data), x**2 + np.sin(y)*2)
+    assert np.array_equal(ArraySolver('logb(8, 2) * 2', data), np.full(20, 6.0))
@@ -1,7 +1,7 @@
 import sys
 sys.path.insert(0, 'src')
 
-from scinumtools.units import BaseUnits, Dimensions
+from scinumtools.units import BaseUnits, Dimensions, Quantity, UnitEnvironment
 
 def test_initialization():
     
@@ -45,3 +45,32 @@ def test_base():
     assert base.magnitude       == 31622.776601683792
     assert str(base.dimensions) == "Dimensions(m=3 g=3:2)"
     
+
+def test_lazy_evaluation():
+
+    # Derived fields are calculated on the first access
+    bu = BaseUnits({'k:m':3,'g':2})
+    assert bu._dimensions is None and bu._expression is None
+    assert bu.expression == "km3*g2"
+    assert bu.units == ['m','g']
+    assert not bu.nodim and not bu.nobase
+
+    # Cached dimensions are combined directly in operations
+    bu1 = BaseUnits({'J':1})
+    bu2 = BaseUnits({'s':-1})
+    bu1.dimensions, bu2.dimensions
+    bu = bu1 + bu2
+    assert bu._dimensions is not None and bu._expression is None
+    assert str(bu.dimensions) == "Dimensions(m=2 g=1 s=-3)"
+    assert bu.magnitude       == 1000.0
+    bu = bu1 - bu1
+    assert bu.nodim and bu.nobase
+    assert bu.magnitude       == 1.0
+    assert str((bu1*2).dimensions) == "Dimensions(m=4 g=2 s=-4)"
+    assert str((bu1/2).dimensions) == "Dimensions(m=1 g=1:2 s=-1)"
+
+    # Units of unit environments are resolved before the environment is closed
+    with UnitEnvironment({'x': {'magnitude': 2, 'dimensions': [1,0,0,0,0,0,0,0]}}):
+        q = Quantity(2,'x')*Quantity(3,'m')
+    assert str(q) == "Quantity(6.000e+00 x*m)"
+    assert str(q.to('m2')) == "Quantity(1.200e+01 m2)"
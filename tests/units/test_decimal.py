@@ -1,9 +1,9 @@
 import numpy as np
 import sys
-from decimal import Decimal
+from decimal import Decimal, localcontext
 sys.path.insert(0, 'src')
 
-from scinumtools.units import Quantity
+from scinumtools.units import Quantity, DoubleDouble
 
 def test_decimal():
     
@@ -38,3 +38,47 @@ def test_decimal():
     # unit conversion
     assert str(a.to('nm')) == "Quantity(3.324e+4 nm)"
     assert a.value()       == Decimal('33239.84020394839204981469679')
+
+def test_double_double():
+
+    def max_error(values, reference):
+        return max(abs((x-y)/y) for x,y in zip(values, reference))
+
+    with localcontext() as ctx:
+        ctx.prec = 50
+        rng = np.random.default_rng(42)
+        a = [Decimal(str(x)) for x in rng.random(100)]
+        b = [Decimal(str(x))*Decimal('1e7') for x in rng.random(100)]
+        dda = DoubleDouble.from_decimal(a)
+        ddb = DoubleDouble.from_decimal(b)
+
+        # vectorized arithmetics
+        assert max_error((dda+ddb).to_decimal(), [x+y for x,y in zip(a,b)]) < 1e-30
+        assert max_error((dda-ddb).to_decimal(), [x-y for x,y in zip(a,b)]) < 1e-30
+        assert max_error((dda*ddb).to_decimal(), [x*y for x,y in zip(a,b)]) < 1e-30
+        assert max_error((dda/ddb).to_decimal(), [x/y for x,y in zip(a,b)]) < 1e-30
+        assert max_error((dda**3).to_decimal(),  [x**3 for x in a])         < 1e-30
+        
+        # quantities and unit conversion
+        qa = Quantity(dda, 'au')
+        qb = Quantity(ddb, 'km')
+        assert str(qa[:2]) == "Quantity([0.774 0.439] au)"
+        result = (qa+qb).value('m').to_decimal()
+        reference = [x*Decimal('1.49597870e11')+y*1000 for x,y in zip(a,b)]
+        assert max_error(result, reference) < 1e-30
+        result = qa.to('km').magnitude.value.to_decimal()
+        reference = [x*Decimal('1.49597870e8') for x in a]
+        assert max_error(result, reference) < 1e-30
+        result = Quantity(dda, 'K').to('Cel').value().to_decimal()
+        reference = [x-Decimal(273.15) for x in a]  # offset is defined as a float
+        assert max_error(result, reference) < 1e-30
+
+        # errors and data types of double-double values
+        q = Quantity(DoubleDouble([1.,2.,3.]), 'km', abse=0.1)
+        assert str(q) == "Quantity([1.00(10)e+00 2.00(10)e+00 3.00(10)e+00] km)"
+        assert str(q*2) == "Quantity([2.00(20)e+00 4.00(20)e+00 6.00(20)e+00] km)"
+        assert np.array_equal(q.value('m', dtype=float), [1000.,2000.,3000.])
+        q = Quantity(DoubleDouble.from_decimal('1.1'), 'km', abse=0.1)
+        assert str(q) == "Quantity(1.10(10)e+00 km)"
+        assert q.value('m', dtype=float) == 1100.0
+        assert abs(q.value(dtype=Decimal)-Decimal('1.1')) < Decimal('1e-30')
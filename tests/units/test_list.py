@@ -131,3 +131,33 @@ def test_unit_systems():
     assert str(AU.Pressure())            == "Quantity(1.000e+00 #APRE)"  # equivalent to Unit
     assert str(SI.Pressure(23))          == "Quantity(2.300e+01 #SPRE)"  # equivalent to Quantity
     assert str(CGS.Pressure(23))         == "Quantity(2.300e+01 #CPRE)"
+
+def test_system_conversion():
+
+    # convert a single quantity
+    assert str(Quantity(3, 'km/h').to_system(SI))     == "Quantity(8.333e-01 #SVEL)"
+    assert str(Quantity(3, 'J').to_system(CGS))       == "Quantity(3.000e+07 #CENE)"
+    assert str(Unit('erg').to_system(SI))             == "Quantity(1.000e-07 #SENE)"
+    assert str(Quantity(3, 'm*K/s').to_system(SI))    == "Quantity(3.000e+00 #SLEN*#STIM-1*#STEM)"
+    with pytest.raises(Exception) as excinfo:
+        Quantity(3, 'K').to_system(CGS)
+    assert excinfo.value.args[0] == "Dimensions cannot be expressed in the system of units:"
+
+    # convert quantities in dictionaries and lists
+    data = SI.convert({'a': Quantity(2, 'kPa'), 'b': [Quantity(1, 'cm'), 'x', True], 'c': Quantity(2)})
+    assert str(data['a'])    == "Quantity(2.000e+03 #SPRE)"
+    assert str(data['b'][0]) == "Quantity(1.000e-02 #SLEN)"
+    assert data['b'][1:]     == ['x', True]
+    assert str(data['c'])    == "Quantity(2.000e+00)"
+
+    # original quantities are not modified
+    q = Quantity(2, 'kPa')
+    data = SI.convert({'a': q})
+    assert str(q)         == "Quantity(2.000e+00 kPa)"
+    assert str(data['a']) == "Quantity(2.000e+03 #SPRE)"
+
+    # temperatures are converted using Kelvins and logarithmic units are not converted
+    data = SI.convert({'t': Quantity(7, 'Cel'), 'f': Quantity(32, 'degF'), 'p': Quantity(3, 'dBm')})
+    assert str(data['t']) == "Quantity(2.801e+02 #STEM)"
+    assert data['f'].units() == "#STEM" and isclose(data['f'].value(), 273.15)
+    assert str(data['p']) == "Quantity(3.000e+00 dBm)"
@@ -1,8 +1,11 @@
 import numpy as np
+import pytest
+import pickle
 import sys
 sys.path.insert(0, 'src')
 
-from scinumtools.units import Quantity, NaN
+from scinumtools.units import Quantity, NaN, ParallelExecution, UnitEnvironment, Magnitude
+from scinumtools.units.unit_types import UnitType
     
 def test_array_arithmetics():
 
@@ -81,3 +84,115 @@ def test_array_operation_sides():
     assert p-q == -(q-p)
     assert q*2 == 2*q
     assert p/2 == 1/(2/p)
+
+def test_from_strings():
+
+    # Parse value-unit strings into a single array quantity
+    q = Quantity.from_strings(["1.2 km", "300 m", "5e4cm"])
+    assert str(q) == "Quantity([1.2 0.3 0.5] km)"
+    q = Quantity.from_strings(["1.2 km", "300 m"], 'm')
+    assert str(q) == "Quantity([1200.  300.] m)"
+    q = Quantity.from_strings(["0 Cel", "300 K"], 'K')
+    assert str(q) == "Quantity([273.15 300.  ] K)"
+    q = Quantity.from_strings(["5 Cel", "7 Cel"])
+    assert str(q) == "Quantity([5. 7.] Cel)"
+    q = Quantity.from_strings(["10 dBm", "1 mW"], 'dBm')
+    assert str(q) == "Quantity([10.  0.] dBm)"
+    q = Quantity.from_strings([["1", "2"], ["3", "4"]])
+    assert str(q) == "Quantity([[1. 2.]\n [3. 4.]])"
+
+    # Report malformed entries by their index
+    with pytest.raises(Exception) as excinfo:
+        Quantity.from_strings(["1 km", "x m", "3 foo"])
+    assert excinfo.value.args[0] == "Following entries could not be parsed:"
+    assert excinfo.value.args[1] == {1: "x m", 2: "3 foo"}
+    q = Quantity.from_strings(["1 km", "x m", "4 m"], errors='coerce')
+    assert str(q) == "Quantity([1.      nan 0.004] km)"
+
+def test_pickling():
+
+    # Quantities are pickled as raw data and a unit signature
+    for q in [Quantity(3, 'km/s'), Quantity(3, 'km/s', abse=0.1), Quantity([[1,2],[3,4]], 'm2:3')]:
+        for protocol in [2, 4, 5]:
+            assert str(pickle.loads(pickle.dumps(q, protocol=protocol))) == str(q)
+
+    # Large arrays are passed as out-of-band buffers
+    q = Quantity(np.arange(1000), 'kg*m2/s2')
+    buffers = []
+    data = pickle.dumps(q, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 1
+    assert len(data) < 200
+    r = pickle.loads(data, buffers=buffers)
+    assert str(r) == str(q)
+    assert np.all(r.value('J') == q.value('J'))
+
+def test_parallel_execution():
+
+    # Chunked conversions give the same results as serial ones
+    data = np.linspace(1, 2, 3000).reshape(3, 1000, 1)
+    for units1, units2 in [('km','m'), ('K','Cel'), ('mW','dBm'), ('m','1/m')]:
+        serial = Quantity(data, units1).to(units2).value()
+        chunked = Quantity(data, units1).to(units2, workers=3, chunk_size=100).value()
+        assert chunked.shape == data.shape
+        assert np.array_equal(serial, chunked)
+    assert np.array_equal(
+        Quantity(data, 'km').value('m', workers=3, chunk_size=100),
+        Quantity(data, 'km').value('m')
+    )
+
+    # Arithmetics use global execution settings
+    with ParallelExecution(workers=3, chunk_size=100):
+        q = Quantity(data, 'km')*Quantity(data, 's')/2 + Quantity(data, 'km*s')
+    assert np.allclose(q.value(), data*data/2+data)
+
+    # Custom unit types do not need to support execution settings
+    class CustomUnitType(UnitType):
+        def _istype(self):
+            return 'x' in self.baseunits1.units+self.baseunits2.units
+        def convert(self, magnitude1):
+            return Magnitude(magnitude1.value*2, magnitude1.error)
+    units = {'x': {'magnitude':1, 'dimensions':[1,0,0,0,0,0,0,0], 'definition':CustomUnitType}}
+    with UnitEnvironment(units):
+        assert str(Quantity(3, 'x').to('m')) == "Quantity(6.000e+00 m)"
+        assert Quantity(3, 'x').value('m') == 6
+        with ParallelExecution(workers=3, chunk_size=100):
+            assert str(Quantity(3, 'x').to('m')) == "Quantity(6.000e+00 m)"
+
+def test_masked_sparse():
+
+    # Masks are preserved through conversions, arithmetics, reductions and pickling
+    data = np.ma.masked_array([1.,2.,3.,4.], mask=[0,1,0,0])
+    q = Quantity(data, 'km').to('m')
+    assert str(q) == "Quantity([1000.0 -- 3000.0 4000.0] m)"
+    assert str(Quantity(data, 'K').to('Cel')) == "Quantity([-272.15 -- -270.15 -269.15] Cel)"
+    assert str(q*Quantity(2,'s')) == "Quantity([2000.0 -- 6000.0 8000.0] m*s)"
+    assert str(np.sum(q)) == "Quantity(8.000e+03 m)"
+    assert str(np.mean(q)) == "Quantity(2.667e+03 m)"
+    assert str(np.max(q)) == "Quantity(4.000e+03 m)"
+    assert str(pickle.loads(pickle.dumps(q))) == "Quantity([1000.0 -- 3000.0 4000.0] m)"
+
+    # Sparse matrices are converted by scaling of stored values only
+    sparse = pytest.importorskip('scipy.sparse')
+    data = sparse.csr_matrix(np.array([[1.,0.,0.],[0.,0.,2.]]))
+    q = Quantity(data, 'km').to('m')
+    assert str(q) == "Quantity(<2x3 sparse, 2 stored> m)"
+    assert sparse.issparse(q.value())
+    assert np.array_equal(q.value().toarray(), [[1000.,0.,0.],[0.,0.,2000.]])
+    assert np.array_equal(q.value('km').toarray(), data.toarray())
+    assert str(np.sum(q)) == "Quantity(3.000e+03 m)"
+    assert np.array_equal(pickle.loads(pickle.dumps(q)).value().toarray(), q.value().toarray())
+    with pytest.raises(Exception) as excinfo:
+        Quantity(data, 'K').to('Cel')
+    assert excinfo.value.args == ('Sparse magnitudes support only linear conversions:', '_convert_K_Cel')
+
+    # Products and powers of sparse matrices are elementwise
+    data = sparse.csr_matrix(np.array([[1.,2.],[0.,4.]]))
+    q = Quantity(data, 'm')
+    assert np.array_equal((q*q).value().toarray(), [[1.,4.],[0.,16.]])
+    assert np.array_equal((q**2).value().toarray(), [[1.,4.],[0.,16.]])
+    assert np.array_equal((q*np.array([[2.,1.],[1.,1.]])).value().toarray(), [[2.,2.],[0.,4.]])
+    assert np.array_equal((3*q).value().toarray(), [[3.,6.],[0.,12.]])
+    assert (q*q).units() == "m2" and (q**2).units() == "m2"
+    with pytest.raises(Exception) as excinfo:
+        Quantity(data, 'm', rele=0.1)
+    assert excinfo.value.args[0] == "Sparse magnitudes cannot have errors:"
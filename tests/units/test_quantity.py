@@ -2,8 +2,9 @@ import pytest
 import sys
 sys.path.insert(0, 'src')
 
-from scinumtools.units import Quantity, Constant, Unit, Fraction, Dimensions, BaseUnits
+from scinumtools.units import Quantity, Constant, Unit, Fraction, Dimensions, BaseUnits, UnitEnvironment
 from scinumtools.units import quant, unit, const
+from scinumtools.units.quantity import FROZEN_QUANTITIES
 
 def test_quantity():
     
@@ -273,3 +274,35 @@ def test_rebase():
     
     # rebasing different units
     assert str(Quantity(1, 'erg*J').rebase())    == "Quantity(1.000e+07 erg2)"
+
+def test_frozen_constants():
+
+    # Named units and constants are copies of cached frozen quantities
+    const, unit = Constant(), Unit()
+    assert const.c is not const.c
+    assert FROZEN_QUANTITIES['[c]'] is FROZEN_QUANTITIES['[c]']
+    with pytest.raises(Exception) as excinfo:
+        FROZEN_QUANTITIES['[c]'].magnitude = 2
+    assert excinfo.value.args[0] == "Frozen quantity cannot be modified:"
+
+    # Modifying returned quantities does not modify the cache
+    km = unit.km
+    km.magnitude.value = 7
+    km.baseunits = BaseUnits('m')
+    assert str(unit.km)             == "Quantity(1.000e+00 km)"
+    km = unit.km
+    assert km.to('m') is km
+    assert str(km)                  == "Quantity(1.000e+03 m)"
+    assert str(unit.km)             == "Quantity(1.000e+00 km)"
+    assert str(const.c.to('km/s')) == "Quantity(2.998e+05 km*s-1)"
+    assert str(const.c)             == "Quantity(1.000e+00 [c])"
+    assert str(unit.m.abse(0.1))    == "Quantity(1.00(10)e+00 m)"
+    assert str(unit.m)              == "Quantity(1.000e+00 m)"
+    assert str(unit.dB+unit.dB)     == "Quantity(4.010e+00 dB)"
+    assert str(unit.dB)             == "Quantity(1.000e+00 dB)"
+
+    # Cache is invalidated when the unit registry changes
+    with UnitEnvironment({'x': {'magnitude':2, 'dimensions':[1,0,0,0,0,0,0,0]}}):
+        assert str(unit.x.to('m')) == "Quantity(2.000e+00 m)"
+    with UnitEnvironment({'x': {'magnitude':3, 'dimensions':[1,0,0,0,0,0,0,0]}}):
+        assert str(unit.x.to('m')) == "Quantity(3.000e+00 m)"
@@ -0,0 +1,39 @@
+import sys
+import time
+import tempfile
+sys.path.insert(0, '../../../src')
+
+from scinumtools.dip import DIP, EnvironmentCache
+from scinumtools import RowCollector
+
+def generate(directory, nodes):
+    # shared defaults, a source with settings, and small modifications
+    with open(f"{directory}/settings.dip", 'w') as f:
+        f.write("\n".join(f"setting{n} float = {n} cm" for n in range(nodes)))
+    with open(f"{directory}/defaults.dip", 'w') as f:
+        f.write("$source settings = settings.dip\n")
+        f.write("\n".join(f"group{n%10}.node{n} float = {{settings?setting{n}}}" for n in range(nodes)))
+    with open(f"{directory}/modifications.dip", 'w') as f:
+        f.write("\n".join(f"group{n%10}.node{n} = {2*n+1} m" for n in range(0, nodes, 10)))
+
+def parse(directory, cache=None):
+    start = time.perf_counter()
+    with DIP(cache=cache) as dip:
+        dip.add_file(f"{directory}/defaults.dip")
+        dip.add_file(f"{directory}/modifications.dip")
+        env = dip.parse()
+    return env, time.perf_counter()-start
+
+if __name__ == '__main__':
+
+    with RowCollector(['Nodes','Parse [s]','Cold cache [s]','Warm cache [s]','Speedup']) as rc:
+        for nodes in [10, 100, 1000]:
+            with tempfile.TemporaryDirectory() as directory:
+                generate(directory, nodes)
+                cache = EnvironmentCache(f"{directory}/cache")
+                env1, parsed = parse(directory)
+                env2, cold = parse(directory, cache)
+                env3, warm = parse(directory, cache)
+                assert env1.data() == env2.data() == env3.data()
+            rc.append([nodes, parsed, cold, warm, parsed/warm])
+        print(rc.to_text())
@@ -0,0 +1,46 @@
+import sys
+import time
+import tracemalloc
+sys.path.insert(0, '../../../src')
+
+from scinumtools.dip import DIP
+from scinumtools import RowCollector
+
+def generate(nodes, size, imports):
+    # group of array nodes that is imported multiple times and referenced in expressions
+    values = "[" + ",".join(str(i) for i in range(size)) + "]"
+    lines = ["group"]
+    for n in range(nodes):
+        lines.append(f"  node{n} float[{size}] = {values} cm")
+    for i in range(imports):
+        lines.append(f"copy{i} {{?group.*}}")
+        lines.append(f"ref{i} float[{size}] = {{?group.node{i%nodes}}} cm")
+    return "\n".join(lines)
+
+if __name__ == '__main__':
+
+    size = int(sys.argv[1]) if len(sys.argv)>1 else 10000
+    code = generate(10, size, 20)
+    with DIP() as dip:
+        dip.add_string(code)
+        tracemalloc.start()
+        start = time.perf_counter()
+        env = dip.parse()
+        elapsed = time.perf_counter()-start
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    with RowCollector(['Operation','Time [s]','Memory peak [MB]']) as rc:
+        rc.append(['parse', elapsed, peak/1e6])
+        tracemalloc.start()
+        start = time.perf_counter()
+        for i in range(20):
+            data = env.data(query='group.*')
+        elapsed = time.perf_counter()-start
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        rc.append(['data(query)', elapsed, peak/1e6])
+        start = time.perf_counter()
+        for i in range(20):
+            nodes = env.nodes['group']
+        rc.append(['nodes[group]', time.perf_counter()-start, None])
+        print(rc.to_text())
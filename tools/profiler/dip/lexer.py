@@ -0,0 +1,54 @@
+import sys
+import ast
+import time
+from glob import glob
+sys.path.insert(0, '../../../src')
+
+from scinumtools.dip import DIP
+from scinumtools import RowCollector
+
+def corpus(directory='../../../tests/dip'):
+    # DIP files and code strings from the test suite
+    codes = []
+    for filepath in sorted(glob(f"{directory}/examples/*.dip")):
+        with DIP() as dip:
+            dip.add_file(filepath)
+            codes.append((filepath, dip.lines))
+    for filepath in sorted(glob(f"{directory}/test_*.py")):
+        with open(filepath) as f:
+            tree = ast.parse(f.read())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Call) and getattr(node.func, 'attr', None)=='add_string' and node.args:
+                if isinstance(node.args[0], ast.Constant) and isinstance(node.args[0].value, str):
+                    with DIP() as dip:
+                        dip.add_string(node.args[0].value)
+                        codes.append((filepath, dip.lines))
+    return codes
+
+def lex(dip, lines):
+    return dip._get_nodes([dict(line) for line in lines])
+
+if __name__ == '__main__':
+
+    repeat = int(sys.argv[1]) if len(sys.argv)>1 else 20
+    codes = []
+    for filepath, lines in corpus():
+        try:
+            lex(DIP(), lines)
+            codes.append((filepath, lines))
+        except Exception:
+            pass   # some test strings are invalid on purpose
+    with RowCollector(['Corpus','Codes','Lines','Time [s]','Lines/s']) as rc:
+        for name, selected in [
+            ('examples', [lines for filepath, lines in codes if filepath.endswith('.dip')]),
+            ('tests',    [lines for filepath, lines in codes if filepath.endswith('.py')]),
+        ]:
+            dip = DIP()
+            nlines = sum(len(lines) for lines in selected)*repeat
+            start = time.perf_counter()
+            for r in range(repeat):
+                for lines in selected:
+                    lex(dip, lines)
+            elapsed = time.perf_counter()-start
+            rc.append([name, len(selected), nlines, elapsed, nlines/elapsed])
+        print(rc.to_text())
@@ -0,0 +1,44 @@
+import sys
+import time
+import tempfile
+sys.path.insert(0, '../../../src')
+
+from scinumtools.dip import DIP
+from scinumtools import RowCollector
+
+def generate(directory, sources, nodes):
+    # many sources that all import the same common definitions
+    with open(f"{directory}/common.dip", 'w') as f:
+        f.write("\n".join(f"const{n} float = {n+1} cm" for n in range(nodes)))
+    lines = []
+    for s in range(sources):
+        with open(f"{directory}/source{s}.dip", 'w') as f:
+            f.write("\n".join([
+                "$source common = common.dip",
+            ] + [
+                f"node{n} float = {{common?const{n}}}" for n in range(nodes)
+            ]))
+        lines.append(f"$source s{s} = source{s}.dip")
+        lines.append(f"value{s} float = {{s{s}?node0}}")
+    with open(f"{directory}/main.dip", 'w') as f:
+        f.write("\n".join(lines))
+    return f"{directory}/main.dip"
+
+if __name__ == '__main__':
+
+    nodes = int(sys.argv[1]) if len(sys.argv)>1 else 100
+    with RowCollector(['Sources','Workers','Time [s]']) as rc:
+        for sources in [4, 16, 64]:
+            with tempfile.TemporaryDirectory() as directory:
+                filepath = generate(directory, sources, nodes)
+                data = None
+                for workers in [None, 1, 2]:
+                    start = time.perf_counter()
+                    with DIP(workers=workers) as dip:
+                        dip.add_file(filepath)
+                        env = dip.parse()
+                    elapsed = time.perf_counter()-start
+                    assert data is None or env.data()==data
+                    data = env.data()
+                    rc.append([sources, workers, elapsed])
+        print(rc.to_text())
@@ -0,0 +1,33 @@
+import sys
+import time
+sys.path.insert(0, '../../../src')
+
+from scinumtools.dip import DIP
+from scinumtools import RowCollector
+
+def generate(size):
+    # configuration with groups of nodes that are partially modified and imported
+    lines = []
+    for g in range(size//10):
+        lines.append(f"group{g}")
+        for n in range(8):
+            lines.append(f"  node{n} float = {n} cm")
+        lines.append(f"  flag bool = true")
+    for g in range(0, size//10, 10):
+        lines.append(f"group{g}.node0 = 3 m")
+        lines.append(f"copy{g} {{?group{g}.*}}")
+    return "\n".join(lines)
+
+if __name__ == '__main__':
+
+    sizes = [int(size) for size in sys.argv[1:]] if len(sys.argv)>1 else [1000, 3000, 10000, 30000, 100000]
+    with RowCollector(['Lines','Nodes','Time [s]','Time/Node [us]']) as rc:
+        for size in sizes:
+            code = generate(size)
+            start = time.perf_counter()
+            with DIP() as dip:
+                dip.add_string(code)
+                env = dip.parse()
+            elapsed = time.perf_counter()-start
+            rc.append([code.count("\n")+1, len(env.nodes), elapsed, 1e6*elapsed/len(env.nodes)])
+        print(rc.to_text())
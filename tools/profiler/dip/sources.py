@@ -0,0 +1,38 @@
+import sys
+import time
+import tempfile
+sys.path.insert(0, '../../../src')
+
+from scinumtools.dip import DIP
+from scinumtools import RowCollector
+
+def generate(directory, depth, width, nodes):
+    # tree of files, where every file imports all files from the next level
+    for level in reversed(range(depth)):
+        for w in range(width):
+            lines = []
+            if level<depth-1:
+                for s in range(width):
+                    lines.append(f"$source l{level+1}s{s} = level{level+1}_{s}.dip")
+            for n in range(nodes):
+                lines.append(f"node{n} float[3] = [{n},{level},{w}] cm")
+            if level<depth-1:
+                lines.append(f"imported {{l{level+1}s{w}?node0}}")
+            with open(f"{directory}/level{level}_{w}.dip", 'w') as f:
+                f.write("\n".join(lines))
+    return f"{directory}/level0_0.dip"
+
+if __name__ == '__main__':
+
+    nodes = int(sys.argv[1]) if len(sys.argv)>1 else 50
+    with RowCollector(['Depth','Width','Files','Nodes','Time [s]']) as rc:
+        for depth, width in [(2,2),(3,2),(4,2),(5,2),(6,2),(4,1),(8,1),(16,1)]:
+            with tempfile.TemporaryDirectory() as directory:
+                filepath = generate(directory, depth, width, nodes)
+                start = time.perf_counter()
+                with DIP() as dip:
+                    dip.add_file(filepath)
+                    env = dip.parse()
+                elapsed = time.perf_counter()-start
+            rc.append([depth, width, sum(width**l for l in range(depth)), len(env.nodes), elapsed])
+        print(rc.to_text())
@@ -0,0 +1,48 @@
+import sys
+import time
+import tempfile
+sys.path.insert(0, '../../../src')
+
+from scinumtools.dip import DIP, TokenCache
+from scinumtools import RowCollector
+
+def generate(directory, nodes):
+    # large shared defaults and a small override file
+    lines = []
+    for n in range(nodes):
+        lines += [
+            f"group{n%10}",
+            f"  length{n} float = {n+1} cm  # length",
+            f"    !tags ['geometry']",
+            f"  count{n} int = {n+1}",
+            f"    = {n+1}",
+            f"    = {n+2}",
+            f"  name{n} str = 'node{n}'",
+            f"  enabled{n} bool = true",
+        ]
+    with open(f"{directory}/defaults.dip", 'w') as f:
+        f.write("\n".join(lines))
+    with open(f"{directory}/modifications.dip", 'w') as f:
+        f.write("group0.length0 = 2 m")
+
+def lex(directory, token_cache=None):
+    with DIP(token_cache=token_cache) as dip:
+        dip.add_file(f"{directory}/defaults.dip")
+        dip.add_file(f"{directory}/modifications.dip")
+        start = time.perf_counter()
+        queue = dip._get_queue()
+        elapsed = time.perf_counter()-start
+    return len(queue.nodes), elapsed
+
+if __name__ == '__main__':
+
+    with RowCollector(['Lines','No cache [s]','Cold cache [s]','Warm cache [s]','Speedup']) as rc:
+        for nodes in [10, 100, 1000]:
+            with tempfile.TemporaryDirectory() as directory:
+                generate(directory, nodes)
+                cache = TokenCache(f"{directory}/cache")
+                lines, nocache = lex(directory)
+                lines, cold = lex(directory, cache)
+                lines, warm = lex(directory, cache)
+            rc.append([lines, nocache, cold, warm, nocache/warm])
+        print(rc.to_text())
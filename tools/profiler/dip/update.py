@@ -0,0 +1,39 @@
+import sys
+import time
+import tempfile
+sys.path.insert(0, '../../../src')
+
+from scinumtools.dip import DIP
+from scinumtools import RowCollector
+
+def generate(directory, nodes, value):
+    # large shared defaults and a small override file that is changed
+    with open(f"{directory}/defaults.dip", 'w') as f:
+        f.write("\n".join(f"group{n%10}.node{n} float = {n+1} cm" for n in range(nodes)))
+    with open(f"{directory}/modifications.dip", 'w') as f:
+        f.write(f"group0.node0 = {value} m")
+
+def parse(directory):
+    dip = DIP()
+    dip.add_file(f"{directory}/defaults.dip")
+    dip.add_file(f"{directory}/modifications.dip")
+    return dip, dip.parse()
+
+if __name__ == '__main__':
+
+    with RowCollector(['Nodes','Parse [s]','Update [s]','Speedup']) as rc:
+        for nodes in [10, 100, 1000]:
+            with tempfile.TemporaryDirectory() as directory:
+                generate(directory, nodes, 1)
+                dip, env = parse(directory)
+                generate(directory, nodes, 2)
+                start = time.perf_counter()
+                dip2, env2 = parse(directory)
+                parsed = time.perf_counter()-start
+                start = time.perf_counter()
+                changed = dip.update([f"{directory}/modifications.dip"])
+                updated = time.perf_counter()-start
+                assert changed == {'group0.node0'}
+                assert env.data() == env2.data()
+            rc.append([nodes, parsed, updated, parsed/updated])
+        print(rc.to_text())
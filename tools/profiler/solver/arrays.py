@@ -0,0 +1,22 @@
+import sys
+import timeit
+import numpy as np
+sys.path.insert(0, '../../../src')
+
+from scinumtools.solver import ExpressionSolver, ArraySolver, AtomBase
+from scinumtools import RowCollector
+
+if __name__ == '__main__':
+
+    number = int(sys.argv[1]) if len(sys.argv)>1 else 10000
+    expr = "sqrt(a**2 + b**2) * (1 + exp(-a/b)) > 2 && !(a == b)"
+    data = {'a': np.random.rand(number) + 0.1, 'b': np.random.rand(number) + 0.1}
+    def solve_elements():
+        with ExpressionSolver(AtomBase) as es:
+            return [es.solve(expr, {'a': a, 'b': b}).value for a, b in zip(data['a'], data['b'])]
+    assert np.array_equal(solve_elements(), ArraySolver(expr, data))
+    with RowCollector(['Evaluation','Number','Time [s]','Time/Element [us]']) as rc:
+        for name, evaluate in {'elements': solve_elements, 'arrays': lambda: ArraySolver(expr, data)}.items():
+            time = timeit.timeit(evaluate, number=1)
+            rc.append([name, number, time, 1e6*time/number])
+        print(rc.to_text())
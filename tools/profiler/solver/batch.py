@@ -0,0 +1,34 @@
+import sys
+import random
+import time
+sys.path.insert(0, '../../../src')
+
+from scinumtools.solver import ExpressionSolver, AtomBase
+from scinumtools import RowCollector
+
+def generate(rng):
+    # random expression with a limited set of atoms
+    terms = [f"sqrt({rng.randint(1,50)}) * {rng.randint(1,50)}" for i in range(rng.randint(1,4))]
+    return " + ".join(terms)
+
+if __name__ == '__main__':
+
+    number = int(sys.argv[1]) if len(sys.argv)>1 else 20000
+    rng = random.Random(42)
+    expressions = [generate(rng) for i in range(number)]
+    expressions += expressions[:number//2]     # duplicated expressions
+    print("Expressions:", len(expressions), "Unique:", len(set(expressions)))
+    
+    with RowCollector(['Solver','Time [s]']) as rc:
+        with ExpressionSolver(AtomBase) as es:
+            start = time.perf_counter()
+            results = [es.solve(expr) for expr in expressions]
+            rc.append(['solve', time.perf_counter()-start])
+            start = time.perf_counter()
+            results = es.solve_many(expressions)
+            rc.append(['solve_many', time.perf_counter()-start])
+            for workers in [2,4]:
+                start = time.perf_counter()
+                results = es.solve_many(expressions, workers=workers)
+                rc.append([f"solve_many workers={workers}", time.perf_counter()-start])
+        print(rc.to_text())
@@ -0,0 +1,23 @@
+import sys
+import timeit
+sys.path.insert(0, '../../../src')
+
+from scinumtools.solver import ExpressionSolver, AtomBase
+from scinumtools import RowCollector
+
+def generate(size):
+    # long expression with operators from different operation steps
+    operators = ['+', '*', '-', '/', '**', '+ -', '* -']
+    return " ".join(f"{i%5+1} {operators[i%len(operators)]}" for i in range(size)) + " 1"
+
+if __name__ == '__main__':
+
+    number = int(sys.argv[1]) if len(sys.argv)>1 else 10
+    with RowCollector(['Atoms','Steps [ms]','Precedence [ms]','Speedup']) as rc:
+        for size in [10, 100, 1000, 10000]:
+            program = ExpressionSolver(AtomBase).compile(generate(size))
+            assert program.evaluate(AtomBase, engine='steps').value==program.evaluate(AtomBase, engine='precedence').value
+            time1 = timeit.timeit(lambda: program.evaluate(AtomBase, engine='steps'), number=number)
+            time2 = timeit.timeit(lambda: program.evaluate(AtomBase, engine='precedence'), number=number)
+            rc.append([size+1, 1e3*time1/number, 1e3*time2/number, time1/time2])
+        print(rc.to_text())
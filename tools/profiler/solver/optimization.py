@@ -0,0 +1,40 @@
+import sys
+import timeit
+sys.path.insert(0, '../../../src')
+
+from scinumtools.solver import ExpressionSolver, AtomBase
+from scinumtools import RowCollector
+
+CALLS = []
+
+class Atom(AtomBase):
+    # atom that counts parsing of atom strings
+    def __init__(self, value):
+        if isinstance(value, str):
+            CALLS.append(value)
+            value = {'pi': 3.141592653589793}.get(value.strip(), value)
+        super().__init__(value)
+
+if __name__ == '__main__':
+
+    number = int(sys.argv[1]) if len(sys.argv)>1 else 1000
+    expr = "2*pi*x/360 + sqrt(2)*(x - y)**2 - sqrt(2)*(x - y) + exp((x - y)**2/2)"
+    with ExpressionSolver(Atom) as es:
+        program = es.compile(expr)
+    optimized = program.optimize(Atom, ['x','y'])
+    variables = {'x': 1.5, 'y': 0.5}
+    cases = {
+        'operation steps': lambda: program.evaluate(Atom, variables, engine='steps'),
+        'expression tree': lambda: program.evaluate(Atom, variables),
+        'folded constants': lambda: optimized.evaluate(Atom, variables),
+    }
+    print("Expression:", expr)
+    print("Optimized: ", optimized)
+    with RowCollector(['Evaluation','Atom calls','Time/Evaluation [us]']) as rc:
+        for name, evaluate in cases.items():
+            CALLS.clear()
+            value = evaluate().value
+            calls = len(CALLS)
+            time = timeit.timeit(evaluate, number=number)
+            rc.append([name, calls, 1e6*time/number])
+        print(rc.to_text())
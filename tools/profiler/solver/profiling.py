@@ -0,0 +1,22 @@
+import sys
+import timeit
+sys.path.insert(0, '../../../src')
+
+from scinumtools.solver import ExpressionSolver, SolverProfiler, AtomBase
+from scinumtools import RowCollector
+
+if __name__ == '__main__':
+
+    size = int(sys.argv[1]) if len(sys.argv)>1 else 100
+    expr = " + ".join(f"sqrt({i}) * {i} - {i}/2" for i in range(size))
+    with RowCollector(['Engine','Profiler','Time [ms]']) as rc:
+        for engine in ['precedence','steps']:
+            with ExpressionSolver(AtomBase, engine=engine) as es:
+                es.solve(expr)
+                time = min(timeit.repeat(lambda: es.solve(expr), number=10, repeat=5))/10
+                rc.append([engine, 'disabled', 1e3*time])
+                with SolverProfiler() as sp:
+                    time = min(timeit.repeat(lambda: es.solve(expr), number=10, repeat=5))/10
+                rc.append([engine, 'enabled', 1e3*time])
+        print(rc.to_text())
+    print(sp.report().to_text())
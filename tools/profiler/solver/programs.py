@@ -0,0 +1,34 @@
+import sys
+import timeit
+import numpy as np
+sys.path.insert(0, '../../../src')
+
+from scinumtools.solver import ExpressionSolver, AtomBase
+from scinumtools import RowCollector
+
+if __name__ == '__main__':
+
+    number = int(sys.argv[1]) if len(sys.argv)>1 else 1000
+    expr = "sqrt(a**2 + b**2) * (1 + exp(-a/b)) > 2 && !(a == b)"
+    values = np.random.rand(number, 2) + 0.1
+    es = ExpressionSolver(AtomBase)
+    program = es.compile(expr)
+    cases = {
+        # values are substituted into the expression string and every expression is tokenized
+        'substituted strings': lambda: [
+            es.solve(expr.replace('a', str(a)).replace('b', str(b))) for a, b in values
+        ],
+        # expression is tokenized once and evaluated with different variables
+        'compiled program': lambda: [
+            program.evaluate(AtomBase, {'a': a, 'b': b}) for a, b in values
+        ],
+        # solving of the same expression reuses cached program
+        'cached solve': lambda: [
+            es.solve(expr, {'a': a, 'b': b}) for a, b in values
+        ],
+    }
+    with RowCollector(['Evaluation','Number','Time [s]','Time/Evaluation [us]']) as rc:
+        for name, evaluate in cases.items():
+            time = timeit.timeit(evaluate, number=1)
+            rc.append([name, number, time, 1e6*time/number])
+        print(rc.to_text())
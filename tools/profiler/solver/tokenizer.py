@@ -0,0 +1,43 @@
+import sys
+import timeit
+sys.path.insert(0, '../../../src')
+
+from scinumtools.solver import ExpressionSolver, AtomBase
+from scinumtools import RowCollector
+
+def tokenize_shifting(es, expr):
+    # previous tokenizer that shifts the expression string by one character
+    left, right = '', expr
+    while right:
+        for operator in es.operators.values():
+            if right.startswith(operator.symbol):
+                if left.strip():
+                    es.tokens.append(es.tokens.atom(left.strip()))
+                left, right = '', right[len(operator.symbol):]
+                es.tokens.append(operator())
+                break
+        else:
+            left, right = left+right[:1], right[1:]
+    if left.strip():
+        es.tokens.append(es.tokens.atom(left.strip()))
+
+def generate(size):
+    # long expression without parentheses
+    operators = ['+', '*', '-', '/', '<=', '&&', '**', '!=', '||']
+    return " ".join(f"{i+1} {operators[i%len(operators)]}" for i in range(size)) + " 1"
+
+if __name__ == '__main__':
+
+    number = int(sys.argv[1]) if len(sys.argv)>1 else 10
+    with RowCollector(['Atoms','Characters','Shifting [ms]','Index [ms]','Speedup']) as rc:
+        for size in [10, 100, 1000, 10000]:
+            expr = generate(size)
+            def run(tokenize):
+                es = ExpressionSolver(AtomBase)
+                tokenize(es, expr)
+                return len(es.tokens.right)
+            assert run(tokenize_shifting)==run(ExpressionSolver.tokenize)
+            time1 = timeit.timeit(lambda: run(tokenize_shifting), number=number)
+            time2 = timeit.timeit(lambda: run(ExpressionSolver.tokenize), number=number)
+            rc.append([size+1, len(expr), 1e3*time1/number, 1e3*time2/number, time1/time2])
+        print(rc.to_text())
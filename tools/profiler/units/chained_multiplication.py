@@ -0,0 +1,26 @@
+import sys
+import timeit
+sys.path.insert(0, '../../../src')
+
+from scinumtools.units import Quantity
+from scinumtools import RowCollector
+
+if __name__ == '__main__':
+
+    number = int(sys.argv[1]) if len(sys.argv)>1 else 1000
+    a = Quantity(2.0, 'kg')
+    b = Quantity(3.0, 'm/s')
+    c = Quantity(4.0, 'J/K')
+    d = Quantity(5.0, 'mol')
+    cases = {
+        'a*b':             lambda: a*b,
+        'a*b*c':           lambda: a*b*c,
+        'a*b*c*d':         lambda: a*b*c*d,
+        'a*b*c*d/a/b/c/d': lambda: a*b*c*d/a/b/c/d,
+        '(a*b*c*d)**2':    lambda: (a*b*c*d)**2,
+    }
+    with RowCollector(['Expression','Number','Time [s]','Time/Expression [us]']) as rc:
+        for name, expr in cases.items():
+            time = timeit.timeit(expr, number=number)
+            rc.append([name, number, time, 1e6*time/number])
+        print(rc.to_text())
@@ -0,0 +1,30 @@
+import sys
+import tracemalloc
+sys.path.insert(0, '../../../src')
+
+from scinumtools.units import Quantity
+from scinumtools import RowCollector
+
+def measure(create, number):
+    tracemalloc.start()
+    start = tracemalloc.take_snapshot()
+    objects = [create(i) for i in range(number)]
+    stop = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in stop.compare_to(start, 'filename'))
+    size -= sys.getsizeof(objects)
+    return size/number
+
+if __name__ == '__main__':
+
+    number = int(sys.argv[1]) if len(sys.argv)>1 else 10000
+    cases = {
+        'dimensionless':  lambda i: Quantity(float(i)),
+        'single unit':    lambda i: Quantity(float(i), 'm'),
+        'composite unit': lambda i: Quantity(float(i), 'kg*m2/s2'),
+        'with error':     lambda i: Quantity(float(i), 'km/s', abse=0.1),
+    }
+    with RowCollector(['Quantity','Number','Bytes/Quantity']) as rc:
+        for name, create in cases.items():
+            rc.append([name, number, measure(create, number)])
+        print(rc.to_text())
@@ -0,0 +1,32 @@
+import os
+import sys
+import time
+import numpy as np
+sys.path.insert(0, '../../../src')
+
+from scinumtools.units import Quantity, ParallelExecution
+from scinumtools import RowCollector
+
+if __name__ == '__main__':
+
+    size = int(float(sys.argv[1])) if len(sys.argv)>1 else 10**8
+    cores = int(sys.argv[2]) if len(sys.argv)>2 else os.cpu_count()
+    workers = sorted(set([2**i for i in range(cores.bit_length()) if 2**i<=cores]+[cores]))
+    data = np.random.rand(size)+1
+    cases = {
+        'scaling km -> m':       lambda w: Quantity(data, 'km').to('m', workers=w),
+        'temperature K -> Cel':  lambda w: Quantity(data, 'K').to('Cel', workers=w),
+        'logarithmic mW -> dBm': lambda w: Quantity(data, 'mW').to('dBm', workers=w),
+        'arithmetics a*b+c':     lambda w: Quantity(data, 'km')*Quantity(data, 's')+Quantity(data, 'km*s'),
+    }
+    with RowCollector(['Operation','Size','Workers','Time [s]','Speedup']) as rc:
+        for name, case in cases.items():
+            reference = None
+            for w in workers:
+                with ParallelExecution(workers=w):
+                    start = time.time()
+                    case(w)
+                    duration = time.time()-start
+                reference = duration if reference is None else reference
+                rc.append([name, size, w, duration, reference/duration])
+        print(rc.to_text())
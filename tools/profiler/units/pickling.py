@@ -0,0 +1,50 @@
+import sys
+import pickle
+import timeit
+import numpy as np
+sys.path.insert(0, '../../../src')
+
+from scinumtools.units import Quantity
+from scinumtools import RowCollector
+
+class GraphQuantity:
+    # quantity without custom pickling, that is pickled with its full object graph
+    __slots__ = ('magnitude','baseunits')
+
+def graph(quantity):
+    # default pickling of slots, for comparison
+    clone = GraphQuantity()
+    clone.magnitude, clone.baseunits = quantity.magnitude, quantity.baseunits
+    data = pickle.dumps(clone, protocol=4)
+    return data, None
+
+def compact(quantity):
+    data = pickle.dumps(quantity, protocol=4)
+    return data, None
+
+def out_of_band(quantity):
+    buffers = []
+    data = pickle.dumps(quantity, protocol=5, buffer_callback=buffers.append)
+    return data, buffers
+
+def roundtrip(method, quantity):
+    data, buffers = method(quantity)
+    return pickle.loads(data, buffers=buffers)
+
+if __name__ == '__main__':
+
+    number = int(sys.argv[1]) if len(sys.argv)>1 else 100
+    cases = {
+        'scalar':            Quantity(3.0, 'km/s'),
+        'scalar with error': Quantity(3.0, 'km/s', abse=0.1),
+        'array 1e3':         Quantity(np.random.rand(1000), 'kg*m2/s2'),
+        'array 1e7':         Quantity(np.random.rand(10000000), 'kg*m2/s2'),
+    }
+    with RowCollector(['Quantity','Method','Bytes','Buffers','Round trip [ms]']) as rc:
+        for name, quantity in cases.items():
+            for method in [graph, compact, out_of_band]:
+                data, buffers = method(quantity)
+                nbuffers = sum(buffer.raw().nbytes for buffer in buffers) if buffers else 0
+                time = timeit.timeit(lambda: roundtrip(method, quantity), number=number)
+                rc.append([name, method.__name__, len(data), nbuffers, 1e3*time/number])
+        print(rc.to_text())